@@ -0,0 +1,74 @@
+"""
+Benchmark of the HTML parser backends against the original BeautifulSoup html.parser path.
+Generates policy-page-like documents, checks that each backend extracts the same links
+and text as the original code, and reports the time per page for link and text extraction.
+
+Run with: python -m policy_scraper.benchmarks.bench_html_parser [--pages N] [--links N]
+"""
+
+import argparse
+import random
+import timeit
+from bs4 import BeautifulSoup
+from policy_scraper.processors.html_parser import PARSER_BACKENDS, LXML_AVAILABLE, get_html_parser
+
+WORDS = ('artificial intelligence policy framework regulation governance ethics report '
+         'guidelines standards compliance directive initiative agency federal public').split()
+
+
+def make_page(num_links: int, seed: int) -> str:
+    """Build a page with navigation, paragraphs, scripts and num_links anchors."""
+    rng = random.Random(seed)
+    words = lambda n: ' '.join(rng.choice(WORDS) for _ in range(n))
+    parts = ['<!DOCTYPE html><html><head><title>Policy page</title>',
+             '<script>var analytics = {"a": "<a href=\'x\'>"};</script><style>a { color: red; }</style>',
+             '</head><body><nav><ul>']
+    for i in range(num_links):
+        parts.append(f'<li><a class="nav-link" href="/policy/{i}?ref=nav&amp;p={i}">'
+                     f'<span>{words(2)}</span> {words(3)} &amp; more</a></li>')
+        if i % 5 == 0:
+            parts.append(f'<p>{words(40)} <b>{words(3)}</b> {words(20)}</p>')
+    parts.append('</ul></nav><footer>&copy; 2024 Agency</footer></body></html>')
+    return ''.join(parts)
+
+
+def original_links(markup: str):
+    soup = BeautifulSoup(markup, 'html.parser')
+    return [(a_tag.get('href'), a_tag.get_text(strip=True)) for a_tag in soup.find_all('a', href=True)]
+
+
+def original_text(markup: str):
+    return BeautifulSoup(markup, 'html.parser').get_text(strip=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends.")
+    parser.add_argument('--pages', type=int, default=20)
+    parser.add_argument('--links', type=int, default=200)
+    args = parser.parse_args()
+
+    pages = [make_page(args.links, seed) for seed in range(args.pages)]
+    expected_links = [original_links(page) for page in pages]
+    expected_text = [original_text(page) for page in pages]
+
+    def per_page(func):
+        return min(timeit.repeat(lambda: [func(page) for page in pages], number=1, repeat=3)) / len(pages) * 1000
+
+    print(f"{args.pages} pages, {args.links} links each, {sum(map(len, pages)) // len(pages)} bytes per page"
+          f"{'' if LXML_AVAILABLE else ' (lxml not installed)'}")
+    print(f"{'backend':<10} {'links ms':>9} {'text ms':>9}  same output")
+    base_links, base_text = per_page(original_links), per_page(original_text)
+    print(f"{'original':<10} {base_links:>9.2f} {base_text:>9.2f}")
+    for name in PARSER_BACKENDS:
+        if name == 'lxml' and not LXML_AVAILABLE:
+            continue
+        backend = get_html_parser(name)
+        links_ms, text_ms = per_page(backend.extract_links), per_page(backend.extract_text)
+        same_links = [backend.extract_links(page) for page in pages] == expected_links
+        same_text = [backend.extract_text(page) for page in pages] == expected_text
+        print(f"{name:<10} {links_ms:>9.2f} {text_ms:>9.2f}  links={same_links} text={same_text}"
+              f"  ({base_links / links_ms:.1f}x links)")
+
+
+if __name__ == '__main__':
+    main()
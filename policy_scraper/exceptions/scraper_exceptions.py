@@ -27,4 +27,8 @@ class ValidationError(ScraperError):
 
 class ContentProcessingError(ScraperError):
     """Raised when there are issues processing content."""
-    pass 
\ No newline at end of file
+    pass
+
+class DeadlineExceeded(ScraperError):
+    """Raised when the run's time budget is exhausted."""
+    pass
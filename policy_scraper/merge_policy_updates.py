@@ -5,8 +5,9 @@ Policy merger module that combines results from different policy scrapers.
 import json
 import os
 import logging
-from typing import List, Dict
+from typing import List, Dict, Iterator
 from datetime import datetime
+from policy_scraper.utils.result_sink import atomic_open, iter_jsonl, read_jsonl_at, write_json_array
 
 # Configure logging
 logging.basicConfig(
@@ -42,12 +43,22 @@ class PolicyMerger:
         
         return unique_items
 
-    def create_merged_file(self, output_filename: str = 'merged_policy_updates.json'):
+    def create_merged_file(self, output_filename: str = 'merged_policy_updates.json', keep_existing: bool = False,
+                           stream: bool = False):
+        """Merge scraper outputs into one file.
+
+        With keep_existing, entries already in the merged file are carried forward. This is
+        needed when scrapers use a persistent dedup store and only emit new results per run.
+        With stream, inputs are read record by record and the merged array is written
+        without holding every result in memory.
+        """
         import os
         output_dir = os.path.join(os.path.dirname(__file__), 'output')
         os.makedirs(output_dir, exist_ok=True)
         if not os.path.isabs(output_filename):
             output_filename = os.path.join(output_dir, output_filename)
+        if stream:
+            return self._create_merged_file_streaming(output_dir, output_filename, keep_existing)
         try:
             merged_results = []
             
@@ -55,6 +66,13 @@ class PolicyMerger:
             ai_policy_path = os.path.join(output_dir, 'ai_policy_updates.json')
             congress_bills_path = os.path.join(output_dir, 'congress_bills.json')
             
+            # Carry forward previously merged results
+            if keep_existing and os.path.exists(output_filename):
+                with open(output_filename, 'r', encoding='utf-8') as f:
+                    existing_data = json.load(f)
+                merged_results.extend(self.add_unique_items(existing_data))
+                logger.info(f"Loaded {len(existing_data)} previously merged results")
+            
             # Add AI policy results
             if os.path.exists(ai_policy_path):
                 with open(ai_policy_path, 'r', encoding='utf-8') as f:
@@ -72,14 +90,62 @@ class PolicyMerger:
             # Sort merged results by timestamp
             merged_results.sort(key=lambda x: x['timestamp'], reverse=True)
             
-            # Save merged results
-            with open(output_filename, 'w', encoding='utf-8') as f:
+            # Save merged results; the previous file stays intact if writing fails
+            with atomic_open(output_filename) as f:
                 json.dump(merged_results, f, indent=2, ensure_ascii=False)
             logger.info(f"Saved {len(merged_results)} merged results to {output_filename}")
             
         except Exception as e:
             logger.error(f"Error creating merged file: {str(e)}")
 
+    @staticmethod
+    def _iter_input(path: str) -> Iterator[Dict]:
+        """Yield records from a scraper output, reading its JSONL stream or its JSON array,
+        whichever was written last."""
+        stream_path = os.path.splitext(path)[0] + '.jsonl'
+        if os.path.exists(stream_path) and (
+                not os.path.exists(path) or os.path.getmtime(stream_path) >= os.path.getmtime(path)):
+            yield from iter_jsonl(stream_path)
+        elif os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                yield from json.load(f)
+
+    def _create_merged_file_streaming(self, output_dir: str, output_filename: str, keep_existing: bool):
+        """Merge scraper outputs through an on-disk staging file, keeping only sort keys in memory."""
+        staging_path = output_filename + '.staging.jsonl'
+        try:
+            inputs = [
+                os.path.join(output_dir, 'ai_policy_updates.json'),
+                os.path.join(output_dir, 'congress_bills.json')
+            ]
+            if keep_existing:
+                inputs.insert(0, output_filename)
+
+            # Stage unique items as JSONL, remembering (timestamp, byte offset) for sorting
+            sort_keys = []
+            with open(staging_path, 'wb') as staging:
+                for path in inputs:
+                    loaded = 0
+                    for item in self._iter_input(path):
+                        loaded += 1
+                        if not self.add_unique_items([item]):
+                            continue
+                        sort_keys.append((item['timestamp'], staging.tell()))
+                        staging.write(json.dumps(item, ensure_ascii=False).encode('utf-8') + b'\n')
+                    logger.info(f"Loaded {loaded} records from {path}")
+
+            # Sort merged results by timestamp and write them out one at a time
+            sort_keys.sort(key=lambda x: x[0], reverse=True)
+            count = write_json_array(read_jsonl_at(staging_path, [offset for _, offset in sort_keys]),
+                                     output_filename)
+            logger.info(f"Saved {count} merged results to {output_filename}")
+
+        except Exception as e:
+            logger.error(f"Error creating merged file: {str(e)}")
+        finally:
+            if os.path.exists(staging_path):
+                os.remove(staging_path)
+
 def main():
     try:
         merger = PolicyMerger()
@@ -7,8 +7,9 @@ to ensure high-quality and unique content collection.
 
 import hashlib
 from difflib import SequenceMatcher
-from typing import List, Dict
+from typing import List, Dict, Iterable, Tuple
 import logging
+from policy_scraper.processors.keyword_matcher import get_keyword_matcher
 
 logger = logging.getLogger(__name__)
 
@@ -38,27 +39,27 @@ class ContentProcessor:
     def is_relevant_content(text: str, url: str, keywords: List[str]) -> bool:
         """Check if content is relevant based on keywords."""
         try:
-            text_lower = text.lower()
-            url_lower = url.lower().replace('-', ' ')
-            
-            is_document = any(ext in url_lower for ext in ['.pdf', '.doc', '.docx'])
-            
-            # Check if any keyword appears in the text or URL
-            for keyword in keywords:
-                keyword_parts = keyword.split()
-                # For multi-word keywords, check if all parts appear in order
-                if len(keyword_parts) > 1:
-                    if all(part in text_lower for part in keyword_parts) or all(part in url_lower for part in keyword_parts):
-                        return True
-                else:
-                    if keyword in text_lower or keyword in url_lower:
-                        return True
-            
-            # Additional check for documents
-            if is_document:
-                return any(keyword in text_lower for keyword in keywords)
-            
+            # Multi-word keywords match when all their words appear in the text or in the URL
+            return get_keyword_matcher(keywords).matches_any(text, url)
+        except Exception as e:
+            logger.error(f"Error checking content relevance: {str(e)}")
             return False
+
+    @staticmethod
+    def match_keywords(text: str, url: str, keywords: List[str]) -> List[str]:
+        """Return the keywords found in the text or URL."""
+        try:
+            return get_keyword_matcher(keywords).match(text, url)
+        except Exception as e:
+            logger.error(f"Error matching keywords: {str(e)}")
+            return []
+
+    @staticmethod
+    def relevant_batch(pairs: Iterable[Tuple[str, str]], keywords: List[str]) -> List[bool]:
+        """Check relevance for a batch of (text, url) pairs."""
+        pairs = list(pairs)
+        try:
+            return [bool(matched) for matched in get_keyword_matcher(keywords).match_batch(pairs)]
         except Exception as e:
             logger.error(f"Error checking content relevance: {str(e)}")
-            return False 
\ No newline at end of file
+            return [False for _ in pairs]
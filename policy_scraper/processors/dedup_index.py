@@ -0,0 +1,192 @@
+"""
+Near-duplicate index module for the policy scraper system.
+This module provides a MinHash/LSH index over result titles so that scrapers can
+answer "is there an existing title above the similarity threshold?" without
+comparing against every stored result. Only titles that share an LSH bucket with
+the query are confirmed with an exact SequenceMatcher comparison.
+It also provides a structure-aware URL index that buckets URLs by host and parent
+path, so a URL is only compared with its siblings of a compatible length.
+"""
+
+import random
+import threading
+import zlib
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, List, Set, Tuple
+from urllib.parse import urlparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+_MAX_HASH = (1 << 32) - 1
+
+
+class TitleSimilarityIndex:
+    """MinHash/LSH index for finding titles similar to a query title.
+
+    Safe to share between threads: the index lock is held only to update or read the
+    buckets, while signatures and SequenceMatcher comparisons run outside it.
+    """
+
+    def __init__(self, threshold: float = 0.85, num_bands: int = 16,
+                 rows_per_band: int = 3, shingle_size: int = 3, seed: int = 1):
+        self.threshold = threshold
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.shingle_size = shingle_size
+        num_perm = num_bands * rows_per_band
+        rng = random.Random(seed)
+        # XOR masks stand in for independent hash functions over the shingle hashes
+        self._masks: List[int] = [rng.randint(0, _MAX_HASH) for _ in range(num_perm)]
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            defaultdict(list) for _ in range(num_bands)
+        ]
+        self._titles: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._titles)
+
+    @staticmethod
+    def _normalize(title: str) -> str:
+        return title.lower()
+
+    def _shingles(self, text: str) -> Set[int]:
+        """Return the hashed character shingles of a normalized title."""
+        k = self.shingle_size
+        if len(text) <= k:
+            grams = {text}
+        else:
+            grams = {text[i:i + k] for i in range(len(text) - k + 1)}
+        return {zlib.crc32(g.encode('utf-8')) for g in grams}
+
+    def _signature(self, text: str) -> List[int]:
+        """Compute the MinHash signature of a normalized title."""
+        shingles = self._shingles(text)
+        return [min(s ^ mask for s in shingles) for mask in self._masks]
+
+    def _band_keys(self, signature: List[int]) -> List[Tuple[int, ...]]:
+        r = self.rows_per_band
+        return [tuple(signature[i * r:(i + 1) * r]) for i in range(self.num_bands)]
+
+    def add(self, title: str) -> None:
+        """Add a title to the index."""
+        text = self._normalize(title)
+        keys = self._band_keys(self._signature(text))
+        with self._lock:
+            position = len(self._titles)
+            self._titles.append(text)
+            for band, key in enumerate(keys):
+                self._buckets[band][key].append(position)
+
+    def candidates(self, title: str, since: int = 0) -> Set[int]:
+        """Return positions of indexed titles sharing at least one LSH bucket,
+        ignoring those added before position since."""
+        keys = self._band_keys(self._signature(self._normalize(title)))
+        found: Set[int] = set()
+        with self._lock:
+            for band, key in enumerate(keys):
+                found.update(position for position in self._buckets[band].get(key, ()) if position >= since)
+        return found
+
+    def has_similar(self, title: str, since: int = 0) -> bool:
+        """Check whether any indexed title is more similar than the threshold.
+
+        With since, only titles added from that position on are compared, so a caller
+        that already checked the first since titles can recheck just the newer ones.
+        """
+        text = self._normalize(title)
+        positions = self.candidates(title, since)
+        if not positions:
+            return False
+        with self._lock:
+            titles = [self._titles[position] for position in positions]
+        try:
+            for other in titles:
+                matcher = SequenceMatcher(None, text, other)
+                # Cheap upper bounds first, exact ratio only on survivors
+                if (matcher.real_quick_ratio() > self.threshold and
+                        matcher.quick_ratio() > self.threshold and
+                        matcher.ratio() > self.threshold):
+                    return True
+        except Exception as e:
+            logger.error(f"Error comparing content similarity: {str(e)}")
+        return False
+
+
+class URLSimilarityIndex:
+    """Near-duplicate index for URLs, bucketed by host and parent path.
+
+    URLs are compared without their scheme or a leading 'www.', so only URLs on the
+    same site under the same parent path can match. Within a bucket, URLs are grouped
+    by length and only lengths that can reach the threshold are compared.
+    """
+
+    def __init__(self, threshold: float = 0.9):
+        self.threshold = threshold
+        self._buckets: Dict[Tuple[str, Tuple[str, ...]], Dict[int, List[str]]] = defaultdict(lambda: defaultdict(list))
+        self._texts: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._texts)
+
+    @staticmethod
+    def _key(url: str) -> Tuple[Tuple[str, Tuple[str, ...]], str]:
+        """Return the (host, parent path) bucket of a URL and the text it is compared by."""
+        parsed = urlparse(url.lower())
+        host = parsed.netloc
+        if host.startswith('www.'):
+            host = host[4:]
+        segments = [segment for segment in parsed.path.split('/') if segment]
+        text = host + '/' + '/'.join(segments)
+        if parsed.query:
+            text += '?' + parsed.query
+        return (host, tuple(segments[:-1])), text
+
+    def _length_range(self, length: int) -> range:
+        # SequenceMatcher.ratio() is at most 2*min(n, m)/(n + m), so only these lengths can match
+        if self.threshold <= 0:
+            return range(0, 2 * length + 2)
+        low = int(length * self.threshold / (2 - self.threshold))
+        high = int(length * (2 - self.threshold) / self.threshold) + 1
+        return range(low, high + 1)
+
+    def add(self, url: str):
+        """Add a URL to the index."""
+        bucket, text = self._key(url)
+        with self._lock:
+            if text in self._texts:
+                return
+            self._texts.add(text)
+            self._buckets[bucket][len(text)].append(text)
+
+    def candidates(self, url: str) -> List[str]:
+        """Return the indexed URL texts that share the URL's bucket and could reach the threshold."""
+        bucket, text = self._key(url)
+        with self._lock:
+            by_length = self._buckets.get(bucket)
+            if not by_length:
+                return []
+            found = []
+            for length in self._length_range(len(text)):
+                found.extend(by_length.get(length, ()))
+            return found
+
+    def has_similar(self, url: str) -> bool:
+        """Check whether an indexed URL is more similar than the threshold."""
+        _, text = self._key(url)
+        with self._lock:
+            if text in self._texts:
+                return True
+        try:
+            for candidate in self.candidates(url):
+                matcher = SequenceMatcher(None, text, candidate)
+                if matcher.quick_ratio() > self.threshold and matcher.ratio() > self.threshold:
+                    return True
+        except Exception as e:
+            logger.error(f"Error comparing URL similarity: {str(e)}")
+        return False
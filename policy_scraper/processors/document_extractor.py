@@ -0,0 +1,196 @@
+"""
+Document text extraction module for the policy scraper system.
+This module extracts the text of PDF and DOCX documents in a process pool, so the
+CPU-bound parsing runs beside the crawl threads instead of holding the interpreter.
+Each document is limited to its first max_pages pages and given a per-file timeout,
+and extracted text is cached by content hash so a document is parsed at most once.
+Workers are spawned rather than forked, since the pool is started from a process
+already running crawl threads.
+DOCX is read with the standard library; PDF needs pypdf, and without it PDFs are
+skipped. Legacy binary .doc files are not supported.
+"""
+
+import io
+import multiprocessing
+import re
+import signal
+import threading
+import zipfile
+import logging
+import concurrent.futures
+from concurrent.futures import BrokenExecutor, CancelledError, ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+from xml.etree import ElementTree
+from policy_scraper.exceptions.scraper_exceptions import ContentProcessingError
+from policy_scraper.utils.document_cache import DocumentTextCache, content_digest
+from policy_scraper.utils.http_client import DOCUMENT_CONTENT_TYPES
+
+logger = logging.getLogger(__name__)
+
+try:
+    from pypdf import PdfReader
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+_WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+# Seconds allowed past the in-worker timeout before the parent gives up on a document
+_TIMEOUT_GRACE = 5
+
+
+class DocumentTimeout(ContentProcessingError):
+    """Raised inside a worker when a document takes longer than its timeout."""
+    pass
+
+
+def _pdf_text(data: bytes, max_pages: int) -> str:
+    reader = PdfReader(io.BytesIO(data))
+    pages = []
+    for page in reader.pages[:max_pages]:
+        pages.append(page.extract_text() or '')
+    return '\n'.join(pages)
+
+
+def _docx_text(data: bytes, max_pages: int) -> str:
+    """Paragraph text of word/document.xml, stopping after max_pages page breaks."""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        xml = archive.read('word/document.xml')
+    paragraphs = []
+    page = 1
+    for paragraph in ElementTree.fromstring(xml).iter(f'{_WORD_NS}p'):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f'{_WORD_NS}t' and node.text:
+                parts.append(node.text)
+            elif node.tag == f'{_WORD_NS}tab':
+                parts.append('\t')
+            elif node.tag == f'{_WORD_NS}br' and node.get(f'{_WORD_NS}type') == 'page':
+                page += 1
+        if page > max_pages:
+            break
+        if parts:
+            paragraphs.append(''.join(parts))
+    return '\n'.join(paragraphs)
+
+
+def extract_document_text(data: bytes, doc_type: str, max_pages: int = 50) -> str:
+    """Extract the text of a 'pdf' or 'docx' document, normalizing runs of blank space."""
+    if doc_type == 'pdf':
+        if not PYPDF_AVAILABLE:
+            raise ContentProcessingError("pypdf is not installed, cannot extract PDF text")
+        text = _pdf_text(data, max_pages)
+    elif doc_type == 'docx':
+        text = _docx_text(data, max_pages)
+    else:
+        raise ContentProcessingError(f"Unsupported document type '{doc_type}'")
+    return re.sub(r'[ \t]*\n\s*\n\s*', '\n\n', text).strip()
+
+
+def _raise_timeout(signum, frame):
+    raise DocumentTimeout("document extraction timed out")
+
+
+def _extract_in_worker(data: bytes, doc_type: str, max_pages: int, timeout: float) -> str:
+    """Process pool entry point: extract text under an interval timer so a pathological
+    document fails on its own instead of holding the worker."""
+    use_alarm = timeout > 0 and hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread()
+    if use_alarm:
+        previous = signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return extract_document_text(data, doc_type, max_pages)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+
+class DocumentExtractor:
+    """Extracts document text in a process pool, caching the results by content hash."""
+
+    def __init__(self, workers: int = 2, timeout: float = 30, max_pages: int = 50,
+                 cache: Optional[DocumentTextCache] = None):
+        self.workers = workers
+        self.timeout = timeout
+        self.max_pages = max_pages
+        self.cache = cache if cache is not None else DocumentTextCache()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking a process that holds locks in other threads can deadlock the child
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def _discard_pool(self, executor: ProcessPoolExecutor):
+        """Drop a broken pool so the next extraction starts a fresh one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def extract(self, data: bytes, content_type: str) -> Optional[str]:
+        """Return the text of one document, or None if it could not be extracted."""
+        return self.extract_many([(data, content_type)])[0]
+
+    def extract_many(self, documents: Iterable[Tuple[bytes, str]]) -> List[Optional[str]]:
+        """Extract a batch of (bytes, content type) documents in parallel.
+
+        Cached documents, and repeats of a document within the batch, are not parsed
+        again. Documents that fail to parse give None and are cached as empty so they
+        are not retried. Documents lost to a parent-side timeout or a broken pool also
+        give None but are not cached, so a later call extracts them again.
+        """
+        documents = list(documents)
+        digests = [content_digest(data) for data, _ in documents]
+        texts = {}
+        pending = {}
+        for digest, (data, content_type) in zip(digests, documents):
+            if digest in texts or digest in pending:
+                continue
+            cached = self.cache.get(digest)
+            if cached is not None:
+                texts[digest] = cached
+                continue
+            doc_type = DOCUMENT_CONTENT_TYPES.get(content_type)
+            if doc_type not in ('pdf', 'docx') or (doc_type == 'pdf' and not PYPDF_AVAILABLE):
+                logger.info(f"Cannot extract text from {content_type} documents")
+                texts[digest] = None
+                continue
+            pool = self._pool()
+            try:
+                pending[digest] = (pool, pool.submit(_extract_in_worker, data, doc_type, self.max_pages, self.timeout))
+            except BrokenExecutor as e:
+                logger.error(f"Document pool failed, skipping document {digest[:12]}: {str(e)}")
+                self._discard_pool(pool)
+                texts[digest] = None
+
+        for digest, (pool, future) in pending.items():
+            try:
+                text = future.result(timeout=self.timeout + _TIMEOUT_GRACE if self.timeout > 0 else None)
+            except concurrent.futures.TimeoutError:
+                logger.error(f"Document {digest[:12]} did not finish within {self.timeout}s")
+                texts[digest] = None
+                continue
+            except (BrokenExecutor, CancelledError) as e:
+                logger.error(f"Document pool failed while extracting document {digest[:12]}: {str(e)}")
+                self._discard_pool(pool)
+                texts[digest] = None
+                continue
+            except Exception as e:
+                logger.error(f"Error extracting document {digest[:12]}: {str(e)}")
+                text = ''
+            self.cache.put(digest, text)
+            texts[digest] = text
+        return [texts[digest] or None for digest in digests]
+
+    def close(self):
+        """Shut down the worker processes and close the cache."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+        self.cache.close()
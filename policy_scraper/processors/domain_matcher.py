@@ -0,0 +1,106 @@
+"""
+Trusted domain matching module for the policy scraper system.
+This module compiles a trusted-domain list once into a reversed-label suffix trie plus
+label sets, so that checking a URL costs O(number of host labels) instead of a
+substring scan over every entry. Entries are interpreted as follows:
+- dotted entries ('whitehouse.gov') match that host and its subdomains;
+- bare public suffixes ('gov', 'edu') match hosts under that suffix (including 'gov.uk');
+- other bare names ('mit', 'oecd') match the registered domain name (mit.edu, oecd.org).
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List
+from urllib.parse import urlparse
+import logging
+import tldextract
+
+logger = logging.getLogger(__name__)
+
+# Use the public suffix list bundled with tldextract instead of fetching it at runtime
+_extract = tldextract.TLDExtract(suffix_list_urls=())
+
+# Marks the end of a trusted entry in the trie
+_TERMINAL = ''
+
+# Trust levels: a host under an explicitly listed domain ranks above one that only
+# matches a broad suffix or registered name
+TRUST_NONE = 0
+TRUST_BROAD = 1
+TRUST_EXPLICIT = 2
+
+
+class TrustedDomainMatcher:
+    """Matches hosts against a compiled set of trusted domain entries."""
+
+    def __init__(self, trusted_domains: Iterable[str]):
+        self._trie: Dict[str, dict] = {}
+        self._suffix_labels = set()
+        self._domain_labels = set()
+        for entry in trusted_domains:
+            entry = entry.strip().lower().strip('.')
+            if not entry:
+                continue
+            if '.' in entry:
+                node = self._trie
+                for label in reversed(entry.split('.')):
+                    node = node.setdefault(label, {})
+                node[_TERMINAL] = {}
+            elif _extract(entry).suffix == entry:
+                self._suffix_labels.add(entry)
+            else:
+                self._domain_labels.add(entry)
+        self.host_trust_level = lru_cache(maxsize=4096)(self._host_trust_level)
+
+    def _host_trust_level(self, host: str) -> int:
+        host = host.lower().strip('.')
+        if not host:
+            return TRUST_NONE
+        # Walk the reversed labels; any terminal on the way is a trusted parent domain
+        node = self._trie
+        for label in reversed(host.split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            if _TERMINAL in node:
+                return TRUST_EXPLICIT
+        if not self._suffix_labels and not self._domain_labels:
+            return TRUST_NONE
+        parts = _extract(host)
+        if any(label in self._suffix_labels for label in parts.suffix.split('.')):
+            return TRUST_BROAD
+        return TRUST_BROAD if parts.domain in self._domain_labels else TRUST_NONE
+
+    def is_trusted_host(self, host: str) -> bool:
+        return self.host_trust_level(host) > TRUST_NONE
+
+    def trust_level(self, url: str) -> int:
+        """Return TRUST_EXPLICIT, TRUST_BROAD or TRUST_NONE for a URL's host."""
+        try:
+            return self.host_trust_level(urlparse(url).hostname or '')
+        except ValueError:
+            return TRUST_NONE
+
+    def is_trusted(self, url: str) -> bool:
+        """Check whether a URL's host is trusted."""
+        try:
+            return self.is_trusted_host(urlparse(url).hostname or '')
+        except ValueError:
+            return False
+
+    def match_urls(self, urls: Iterable[str]) -> Dict[str, bool]:
+        """Check a whole list of links in one call, resolving each distinct host once."""
+        return {url: self.is_trusted(url) for url in dict.fromkeys(urls)}
+
+    def filter_trusted(self, urls: Iterable[str]) -> List[str]:
+        """Return the trusted URLs from a list, preserving order."""
+        return [url for url in urls if self.is_trusted(url)]
+
+
+@lru_cache(maxsize=32)
+def _compiled(trusted_domains: FrozenSet[str]) -> TrustedDomainMatcher:
+    return TrustedDomainMatcher(trusted_domains)
+
+
+def get_matcher(trusted_domains: Iterable[str]) -> TrustedDomainMatcher:
+    """Return a matcher for a trusted-domain collection, compiling it only once."""
+    return _compiled(frozenset(trusted_domains))
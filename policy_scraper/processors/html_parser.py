@@ -0,0 +1,183 @@
+"""
+HTML parsing module for the policy scraper system.
+This module puts link and text extraction behind a small backend interface so the
+scrapers do not have to build a full BeautifulSoup tree for every page. Backends:
+- 'bs4': full BeautifulSoup tree with html.parser (the original behavior);
+- 'lxml': full BeautifulSoup tree with the lxml parser, if installed;
+- 'strainer': BeautifulSoup restricted to <a href> tags by a SoupStrainer;
+- 'stream': a single pass of the standard library tokenizer, no tree at all;
+- 'regex': a regular expression fast path for links (text uses 'stream').
+Links are returned as (href, text) pairs with entities decoded and text stripped and
+joined the way Tag.get_text(strip=True) does.
+"""
+
+import html
+import logging
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from policy_scraper.exceptions.scraper_exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Elements whose content is not page text, as in BeautifulSoup's get_text
+_NON_TEXT_TAGS = frozenset(['script', 'style', 'template'])
+
+
+class ParserBackend:
+    """Extracts anchors and visible text from an HTML document."""
+
+    name = ''
+
+    def extract_links(self, markup: str) -> List[Tuple[str, str]]:
+        """Return the (href, text) pair of every <a> tag with an href."""
+        raise NotImplementedError
+
+    def extract_text(self, markup: str) -> str:
+        """Return the document text, stripped strings joined without separators."""
+        raise NotImplementedError
+
+
+class SoupBackend(ParserBackend):
+    """Full BeautifulSoup tree, optionally with anchor-only parsing."""
+
+    def __init__(self, name: str, features: str = 'html.parser', anchors_only: bool = False):
+        self.name = name
+        self.features = features
+        self.anchors_only = anchors_only
+
+    def extract_links(self, markup: str) -> List[Tuple[str, str]]:
+        parse_only = SoupStrainer('a', href=True) if self.anchors_only else None
+        soup = BeautifulSoup(markup, self.features, parse_only=parse_only)
+        return [(a_tag.get('href'), a_tag.get_text(strip=True)) for a_tag in soup.find_all('a', href=True)]
+
+    def extract_text(self, markup: str) -> str:
+        # Text needs the whole document, so anchor-only parsing does not apply
+        return BeautifulSoup(markup, self.features).get_text(strip=True)
+
+
+class _StreamCollector(HTMLParser):
+    """Single-pass tokenizer that collects anchors and text without building a tree."""
+
+    def __init__(self, collect_links: bool, collect_text: bool):
+        super().__init__(convert_charrefs=True)
+        self.collect_links = collect_links
+        self.collect_text = collect_text
+        self.links: List[Tuple[str, str]] = []
+        self.text: List[str] = []
+        self._skip_depth = 0
+        self._href = None
+        self._anchor_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _NON_TEXT_TAGS:
+            self._skip_depth += 1
+        elif tag == 'a' and self.collect_links:
+            self._close_anchor()
+            attrs = dict(attrs)
+            if 'href' in attrs:
+                # A bare href attribute has no value; BeautifulSoup reports it as ''
+                self._href = attrs['href'] or ''
+                self._anchor_text = []
+
+    def handle_endtag(self, tag):
+        if tag in _NON_TEXT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'a':
+            self._close_anchor()
+
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        stripped = data.strip()
+        if not stripped:
+            return
+        if self.collect_text:
+            self.text.append(stripped)
+        if self._href is not None:
+            self._anchor_text.append(stripped)
+
+    def _close_anchor(self):
+        if self._href is not None:
+            self.links.append((self._href, ''.join(self._anchor_text)))
+            self._href = None
+
+    def close(self):
+        super().close()
+        self._close_anchor()
+
+
+class StreamBackend(ParserBackend):
+    """Standard library tokenizer; one pass, no tree."""
+
+    name = 'stream'
+
+    def extract_links(self, markup: str) -> List[Tuple[str, str]]:
+        collector = _StreamCollector(collect_links=True, collect_text=False)
+        collector.feed(markup)
+        collector.close()
+        return collector.links
+
+    def extract_text(self, markup: str) -> str:
+        collector = _StreamCollector(collect_links=False, collect_text=True)
+        collector.feed(markup)
+        collector.close()
+        return ''.join(collector.text)
+
+
+class RegexBackend(StreamBackend):
+    """Regular expression fast path for links.
+
+    Handles well-formed anchors; markup that needs a real parser (unclosed anchors,
+    '>' inside quoted attributes before href) may be missed. Text extraction uses the
+    stream tokenizer.
+    """
+
+    name = 'regex'
+    _anchor = re.compile(
+        r'<a\s[^>]*?\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))[^>]*>(.*?)</a\s*>',
+        re.IGNORECASE | re.DOTALL
+    )
+    _tag = re.compile(r'<[^>]*>')
+    _non_text = re.compile(r'<!--.*?-->|<(script|style|template)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+
+    def extract_links(self, markup: str) -> List[Tuple[str, str]]:
+        links = []
+        for match in self._anchor.finditer(self._non_text.sub('', markup)):
+            href = match.group(1) if match.group(1) is not None else (
+                match.group(2) if match.group(2) is not None else match.group(3))
+            inner = self._tag.split(match.group(4))
+            text = ''.join(html.unescape(part).strip() for part in inner)
+            links.append((html.unescape(href), text))
+        return links
+
+
+def _backends() -> Dict[str, ParserBackend]:
+    return {
+        'bs4': SoupBackend('bs4'),
+        'lxml': SoupBackend('lxml', features='lxml'),
+        'strainer': SoupBackend('strainer', features='lxml' if LXML_AVAILABLE else 'html.parser', anchors_only=True),
+        'stream': StreamBackend(),
+        'regex': RegexBackend(),
+    }
+
+
+PARSER_BACKENDS = tuple(_backends())
+
+
+def get_html_parser(name: str) -> ParserBackend:
+    """Return the named parser backend, falling back to 'bs4' for lxml if it is not installed."""
+    backends = _backends()
+    if name not in backends:
+        raise ConfigurationError(f"Unknown HTML parser backend '{name}', expected one of: {', '.join(backends)}")
+    if name == 'lxml' and not LXML_AVAILABLE:
+        logger.warning("lxml is not installed, using the html.parser backend")
+        return backends['bs4']
+    return backends[name]
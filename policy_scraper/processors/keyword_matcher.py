@@ -0,0 +1,66 @@
+"""
+Keyword matching module for the policy scraper system.
+This module compiles a keyword list once into a single regular expression that finds
+every keyword occurrence in one pass over the text, including overlapping ones. It is
+shared by the relevance checks of all scrapers and supports batches of (text, url) pairs.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """Finds which keywords occur in a text and URL in a single scan of each.
+
+    With match_all_words, a multi-word keyword matches when all of its words occur
+    somewhere in the text (or all in the URL); otherwise keywords match as whole phrases.
+    """
+
+    def __init__(self, keywords: Iterable[str], match_all_words: bool = True):
+        self.keywords: List[str] = list(dict.fromkeys(k.lower() for k in keywords if k.strip()))
+        self.match_all_words = match_all_words
+        self._terms = {
+            keyword: (keyword.split() if match_all_words else [keyword]) or [keyword]
+            for keyword in self.keywords
+        }
+        terms = sorted({term for parts in self._terms.values() for term in parts}, key=len, reverse=True)
+        # Zero-width lookahead reports a match at every position, so overlapping terms are found;
+        # the longest term wins at a position, and the terms it contains are implied below
+        self._pattern = re.compile('(?=(' + '|'.join(re.escape(term) for term in terms) + '))') if terms else None
+        self._implied = {term: {other for other in terms if other in term} for term in terms}
+
+    def found_terms(self, text: str) -> Set[str]:
+        """Return the set of terms occurring in an already lowercased text."""
+        if self._pattern is None or not text:
+            return set()
+        found: Set[str] = set()
+        for term in {m.group(1) for m in self._pattern.finditer(text)}:
+            found |= self._implied[term]
+        return found
+
+    def match(self, text: str, url: str = '') -> List[str]:
+        """Return the keywords matched by the text or the URL, in keyword-list order."""
+        text_terms = self.found_terms(text.lower())
+        url_terms = self.found_terms(url.lower().replace('-', ' ')) if url else set()
+        return [
+            keyword for keyword, parts in self._terms.items()
+            if all(part in text_terms for part in parts) or all(part in url_terms for part in parts)
+        ]
+
+    def matches_any(self, text: str, url: str = '') -> bool:
+        return bool(self.match(text, url))
+
+    def match_batch(self, pairs: Iterable[Tuple[str, str]]) -> List[List[str]]:
+        """Match a batch of (text, url) pairs."""
+        return [self.match(text, url) for text, url in pairs]
+
+
+@lru_cache(maxsize=32)
+def _compiled(keywords: Tuple[str, ...], match_all_words: bool) -> KeywordMatcher:
+    return KeywordMatcher(keywords, match_all_words)
+
+
+def get_keyword_matcher(keywords: Iterable[str], match_all_words: bool = True) -> KeywordMatcher:
+    """Return a matcher for a keyword list, compiling it only once."""
+    return _compiled(tuple(keywords), match_all_words)
@@ -6,14 +6,53 @@ URLs are processed by the scrapers.
 """
 
 import re
+import time
+import threading
+import concurrent.futures
 from urllib.parse import urlparse, urlunparse
-from typing import Set, Dict
+from typing import Set, Dict, Iterable, Optional
+from dataclasses import dataclass, field
 import requests
 import validators
 import logging
+from policy_scraper.processors.domain_matcher import get_matcher
+from policy_scraper.exceptions.scraper_exceptions import DeadlineExceeded
 
 logger = logging.getLogger(__name__)
 
+# Client errors that say a URL is gone rather than that the request should be retried
+DEFINITIVE_STATUS_CODES = frozenset({404, 410})
+
+@dataclass
+class URLCheck:
+    """Outcome of a HEAD request used to validate a URL."""
+    status_code: int
+    content_type: str = ''
+    content_length: Optional[int] = None
+    checked_at: float = field(default_factory=time.time)
+
+    @property
+    def is_valid(self) -> bool:
+        return self.status_code == 200
+
+    @property
+    def is_cacheable(self) -> bool:
+        """Whether the outcome will still hold on a later check.
+
+        Throttling (429) and server errors (5xx) are transient, so only success and
+        client errors that mean the page is gone are worth remembering.
+        """
+        return 200 <= self.status_code < 300 or self.status_code in DEFINITIVE_STATUS_CODES
+
+    @classmethod
+    def from_response(cls, response) -> 'URLCheck':
+        length = response.headers.get('Content-Length')
+        return cls(
+            status_code=response.status_code,
+            content_type=response.headers.get('Content-Type', ''),
+            content_length=int(length) if length and length.isdigit() else None
+        )
+
 class URLProcessor:
     """Utility class for URL processing operations."""
     
@@ -44,22 +83,95 @@ class URLProcessor:
     def is_trusted_domain(url: str, trusted_domains: Set[str]) -> bool:
         """Check if the URL belongs to a trusted domain."""
         try:
-            domain = urlparse(url).netloc.lower()
-            return any(trusted in domain for trusted in trusted_domains)
+            return get_matcher(trusted_domains).is_trusted(url)
         except Exception as e:
             logger.error(f"Error checking trusted domain for {url}: {str(e)}")
             return False
 
     @staticmethod
-    def validate_url(url: str, headers: Dict[str, str], visited_urls: Set[str], timeout: int = 10) -> bool:
-        """Validate if a URL is legitimate and accessible."""
+    def match_trusted_domains(urls: Iterable[str], trusted_domains: Set[str]) -> Dict[str, bool]:
+        """Check a whole list of URLs against the trusted domains in one call."""
+        return get_matcher(trusted_domains).match_urls(urls)
+
+    @staticmethod
+    def validate_url(url: str, headers: Dict[str, str], visited_urls: Set[str], timeout: int = 10,
+                     session=None) -> bool:
+        """Validate if a URL is legitimate and accessible, over the given session if any."""
         try:
             if not validators.url(url):
                 return False
             if url in visited_urls:
                 return False
-            response = requests.head(url, headers=headers, timeout=timeout)
+            response = (session or requests).head(url, headers=headers, timeout=timeout)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Error validating URL {url}: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
+
+    @staticmethod
+    def check_urls(urls: Iterable[str], headers: Dict[str, str], timeout: int = 10,
+                   session: Optional[requests.Session] = None, max_workers: int = 16,
+                   per_host_limit: int = 4, scheduler=None,
+                   executor: Optional[concurrent.futures.Executor] = None) -> Dict[str, Optional[URLCheck]]:
+        """Send HEAD requests for many URLs concurrently, with at most per_host_limit in flight per host.
+
+        If a HostScheduler is given it takes over per-host limits and spacing, and URLs that
+        robots.txt disallows are not requested. If an executor is given the requests run on
+        it instead of a pool of max_workers threads created for this call. URLs that are malformed, disallowed or fail
+        at the network level map to None. DeadlineExceeded is raised, not mapped to None,
+        so a check cut off by the time budget is not mistaken for an invalid URL.
+        """
+        results: Dict[str, Optional[URLCheck]] = {}
+        candidates = []
+        for url in dict.fromkeys(urls):
+            if not validators.url(url) or (scheduler is not None and not scheduler.can_fetch(url)):
+                results[url] = None
+            else:
+                candidates.append(url)
+        if not candidates:
+            return results
+
+        http = session or requests
+        host_limits = {
+            host: threading.BoundedSemaphore(per_host_limit)
+            for host in {urlparse(url).netloc.lower() for url in candidates}
+        }
+
+        def check(url: str) -> Optional[URLCheck]:
+            limit = scheduler.slot(url) if scheduler is not None else host_limits[urlparse(url).netloc.lower()]
+            with limit:
+                try:
+                    response = http.head(url, headers=headers, timeout=timeout)
+                    return URLCheck.from_response(response)
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    logger.error(f"Error validating URL {url}: {str(e)}")
+                    return None
+
+        if executor is not None:
+            for url, outcome in zip(candidates, executor.map(check, candidates)):
+                results[url] = outcome
+            return results
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(candidates))) as pool:
+            for url, outcome in zip(candidates, pool.map(check, candidates)):
+                results[url] = outcome
+        return results
+
+    @staticmethod
+    def validate_urls(urls: Iterable[str], headers: Dict[str, str], visited_urls: Set[str], timeout: int = 10,
+                      session: Optional[requests.Session] = None, max_workers: int = 16,
+                      per_host_limit: int = 4) -> Dict[str, bool]:
+        """Validate many URLs concurrently, with at most per_host_limit requests in flight per host."""
+        results: Dict[str, bool] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            if url in visited_urls:
+                results[url] = False
+            else:
+                pending.append(url)
+        checks = URLProcessor.check_urls(pending, headers, timeout=timeout, session=session,
+                                         max_workers=max_workers, per_host_limit=per_host_limit)
+        for url, outcome in checks.items():
+            results[url] = outcome is not None and outcome.is_valid
+        return results
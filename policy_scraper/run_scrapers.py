@@ -6,12 +6,16 @@ This script coordinates the execution of:
 3. Policy Merger
 """
 
+import argparse
 import logging
 import time
 from datetime import datetime
+from typing import Optional
 from policy_scraper.scrapers.ai_policy import AIPolicyScraper
 from policy_scraper.scrapers.congress import CongressScraper
 from policy_scraper.merge_policy_updates import PolicyMerger
+from policy_scraper.utils.config import AIScraperConfig, CongressScraperConfig
+from policy_scraper.utils.deadline import Deadline
 
 # Configure logging
 logging.basicConfig(
@@ -20,31 +24,106 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def run_scrapers():
-    """Run all scrapers and merge their results."""
+# Cross-run dedup store shared by all scrapers, relative to the output directory
+DEDUP_STORE_FILENAME = 'dedup_store.sqlite3'
+# HEAD validation outcomes reused across runs until they expire
+VALIDATION_CACHE_FILENAME = 'validation_cache.json'
+# ETag/Last-Modified validators and extracted links of fetched pages
+PAGE_CACHE_FILENAME = 'page_cache.sqlite3'
+# Search API responses reused across runs, refreshed in the background once stale
+SEARCH_CACHE_FILENAME = 'search_cache.sqlite3'
+# Text extracted from PDF/DOCX documents, keyed by content hash
+DOCUMENT_CACHE_FILENAME = 'document_cache.sqlite3'
+# Raw page and document bodies, content-addressed, for reprocessing without re-crawling
+CONTENT_STORE_DIRNAME = 'content_store'
+# AI policy results are streamed here as they are accepted, then materialized to JSON
+AI_RESULT_STREAM_FILENAME = 'ai_policy_updates.jsonl'
+# Per-scraper progress checkpoints used by --resume
+AI_CHECKPOINT_FILENAME = 'ai_policy_checkpoint.json'
+CONGRESS_CHECKPOINT_FILENAME = 'congress_checkpoint.json'
+
+def _start_stage(scraper, name: str, resume: bool) -> bool:
+    """Prepare a scraper's checkpoint and return False if a resumed run already finished it."""
+    if resume and scraper.resume():
+        if scraper.checkpoint.is_complete():
+            logger.info(f"{name} already completed in the interrupted run, skipping")
+            return False
+        logger.info(f"Resuming {name} from checkpoint")
+    elif scraper.checkpoint is not None:
+        scraper.checkpoint.clear()
+    return True
+
+def run_scrapers(persist_dedup: bool = True, resume: bool = False, crawl_engine: str = 'threads',
+                 time_budget: Optional[float] = None):
+    """Run all scrapers and merge their results.
+
+    With persist_dedup, URLs and content seen by earlier runs are skipped and the
+    merged file accumulates results across runs. With resume, each scraper continues
+    from the checkpoint left by a failed run instead of starting over. crawl_engine
+    selects how the AI policy scraper extracts pages: 'threads' or 'frontier' (a
+    priority-ordered multi-depth crawl). time_budget, in seconds, is
+    shared by every stage: when it runs out, stages stop, their partial results are
+    saved and merged, and their checkpoints are kept so --resume can finish the work.
+    """
+    dedup_store_path = DEDUP_STORE_FILENAME if persist_dedup else None
+    deadline = Deadline(time_budget)
     start_time = time.time()
     logger.info("Starting policy scraping process...")
 
     try:
         # Run AI Policy Scraper
         logger.info("Running AI Policy Scraper...")
-        ai_scraper = AIPolicyScraper()
-        ai_scraper.scrape_with_threading()
-        ai_scraper.save_results()
+        ai_config = AIScraperConfig(
+            DEDUP_STORE_PATH=dedup_store_path,
+            RESULT_STREAM_PATH=AI_RESULT_STREAM_FILENAME,
+            VALIDATION_CACHE_PATH=VALIDATION_CACHE_FILENAME,
+            SEARCH_CACHE_PATH=SEARCH_CACHE_FILENAME,
+            PAGE_CACHE_PATH=PAGE_CACHE_FILENAME,
+            DOCUMENT_CACHE_PATH=DOCUMENT_CACHE_FILENAME,
+            CONTENT_STORE_PATH=CONTENT_STORE_DIRNAME,
+            CHECKPOINT_PATH=AI_CHECKPOINT_FILENAME,
+            CRAWL_ENGINE=crawl_engine
+        )
+        ai_scraper = AIPolicyScraper(config=ai_config)
+        ai_scraper.deadline = deadline
+        if _start_stage(ai_scraper, "AI Policy Scraper", resume):
+            if ai_config.CRAWL_ENGINE == 'frontier':
+                ai_scraper.scrape_deep()
+            else:
+                ai_scraper.scrape_with_threading()
+            ai_scraper.save_results()
+            if not deadline.expired():
+                ai_scraper.checkpoint.mark_complete()
         logger.info("AI Policy Scraper completed successfully")
 
         # Run Congress Scraper
         logger.info("Running Congress Scraper...")
-        congress_scraper = CongressScraper()
-        congress_scraper.run()
+        congress_scraper = CongressScraper(config=CongressScraperConfig(
+            DEDUP_STORE_PATH=dedup_store_path,
+            CHECKPOINT_PATH=CONGRESS_CHECKPOINT_FILENAME
+        ))
+        congress_scraper.deadline = deadline
+        if deadline.expired():
+            logger.warning("Time budget exhausted, skipping Congress Scraper")
+        elif _start_stage(congress_scraper, "Congress Scraper", resume):
+            congress_scraper.run()
+            if not deadline.expired():
+                congress_scraper.checkpoint.mark_complete()
         logger.info("Congress Scraper completed successfully")
 
         # Merge results
         logger.info("Merging results...")
         merger = PolicyMerger()
-        merger.create_merged_file()
+        merger.create_merged_file(keep_existing=persist_dedup, stream=True)
         logger.info("Results merged successfully")
 
+        if deadline.expired():
+            logger.warning("Time budget exhausted; run again with --resume to finish the remaining work")
+        else:
+            # The run finished, so the next one starts from scratch
+            ai_scraper.checkpoint.clear()
+            congress_scraper.checkpoint.clear()
+
         # Calculate and log execution time
         execution_time = time.time() - start_time
         logger.info(f"Scraping process completed in {execution_time:.2f} seconds")
@@ -55,8 +134,16 @@ def run_scrapers():
 
 def main():
     """Main entry point for the script."""
+    parser = argparse.ArgumentParser(description="Run all policy scrapers and merge their results.")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue from the checkpoint left by an interrupted run")
+    parser.add_argument('--engine', choices=['threads', 'frontier'], default='threads',
+                        help="crawl engine used by the AI policy scraper")
+    parser.add_argument('--time-budget', type=float, default=None, metavar='SECONDS',
+                        help="stop all stages and save partial results after this many seconds")
+    args = parser.parse_args()
     try:
-        run_scrapers()
+        run_scrapers(resume=args.resume, crawl_engine=args.engine, time_budget=args.time_budget)
     except Exception as e:
         logger.error(f"Fatal error: {str(e)}")
         exit(1)
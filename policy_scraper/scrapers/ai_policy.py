@@ -6,30 +6,40 @@ It handles concurrent scraping, content relevance checking, and result deduplica
 """
 
 import requests
-from bs4 import BeautifulSoup
 import validators
 from datetime import datetime
 import json
 import logging
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Set, Optional, Tuple
 import time
 from urllib.parse import urljoin, urlparse, urlunparse
 import re
 import os
 from dotenv import load_dotenv
-from googleapiclient.discovery import build
 import concurrent.futures
+import threading
 from difflib import SequenceMatcher
 import hashlib
 import tldextract
 from .base import BaseScraper
+from .pipeline import Stage, StagedPipeline
+from ..utils.host_scheduler import interleave_by_host
+from ..utils.rate_limiter import get_rate_limiter, is_rate_limited, retry_after
+from ..utils.search_cache import SearchCache
+from ..utils.search_client import CustomSearchClient
+from ..utils.crawl_frontier import CrawlFrontier, score_page
+from ..utils.http_client import StreamedResponse, KIND_DOCUMENT
+from ..utils.page_cache import CachedPage
+from ..utils.dedup_store import KIND_PROCESSED
 from policy_scraper.merge_policy_updates import PolicyMerger
 from dataclasses import dataclass, field
 from enum import Enum
 from ..utils.config import AIScraperConfig
-from ..exceptions.scraper_exceptions import ConfigurationError, APIError
-from ..processors.url_processor import URLProcessor
+from ..exceptions.scraper_exceptions import ConfigurationError, APIError, DeadlineExceeded
+from ..processors.url_processor import URLProcessor as BaseURLProcessor
 from ..processors.content_processor import ContentProcessor
+from ..processors.domain_matcher import get_matcher
+from ..processors.dedup_index import URLSimilarityIndex
 
 # Load environment variables from .env file
 load_dotenv()
@@ -41,6 +51,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Results requested per Custom Search call (the API maximum)
+SEARCH_PAGE_SIZE = 10
+# The API serves at most the first 100 results of a query
+SEARCH_RESULT_LIMIT = 100
+
 class ScraperError(Exception):
     """Base exception for scraper-related errors."""
     pass
@@ -49,7 +64,7 @@ class URLProcessingError(ScraperError):
     """Raised when there are issues processing URLs."""
     pass
 
-class URLProcessor:
+class URLProcessor(BaseURLProcessor):
     """Utility class for URL processing operations."""
     
     @staticmethod
@@ -78,20 +93,19 @@ class URLProcessor:
     def is_trusted_domain(url: str, trusted_domains: Set[str]) -> bool:
         """Check if the URL belongs to a trusted domain."""
         try:
-            domain = urlparse(url).netloc.lower()
-            return any(trusted in domain for trusted in trusted_domains)
+            return get_matcher(trusted_domains).is_trusted(url)
         except Exception as e:
             raise URLProcessingError(f"Error checking trusted domain for {url}: {str(e)}")
 
     @staticmethod
-    def validate_url(url: str, headers: Dict[str, str], visited_urls: Set[str]) -> bool:
-        """Validate if a URL is legitimate and accessible."""
+    def validate_url(url: str, headers: Dict[str, str], visited_urls: Set[str], session=None) -> bool:
+        """Validate if a URL is legitimate and accessible, over the given session if any."""
         try:
             if not validators.url(url):
                 return False
             if url in visited_urls:
                 return False
-            response = requests.head(url, headers=headers, timeout=AIScraperConfig.REQUEST_TIMEOUT)
+            response = (session or requests).head(url, headers=headers, timeout=AIScraperConfig.REQUEST_TIMEOUT)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Error validating URL {url}: {str(e)}")
@@ -116,42 +130,96 @@ class AIPolicyScraper(BaseScraper):
                 "or pass them to the constructor."
             )
         
-        # Initialize the Google Custom Search API service
-        self.service = build(
-            "customsearch", "v1",
-            developerKey=self.api_key,
-            cache_discovery=False
+        # Custom Search JSON API client over the shared connection pool
+        self.search_client = CustomSearchClient(
+            self.api_key, self.http,
+            endpoint=self.config.SEARCH_API_ENDPOINT,
+            timeout=self.config.REQUEST_TIMEOUT
         )
         
         self.url_processor = URLProcessor()
         self.content_processor = ContentProcessor()
+        # Trusted domains compiled once into a suffix matcher
+        self.domain_matcher = get_matcher(self.config.TRUSTED_DOMAINS)
+        # Visited URLs indexed by host and parent path for near-duplicate lookups
+        self.url_index = URLSimilarityIndex(self.config.URL_SIMILARITY_THRESHOLD)
+        self.visited_urls.subscribe(self.url_index.add)
+        # Guard checkpointed progress updated by several workers: the completed query map
+        # and the set of extracted pages
+        self._queries_lock = threading.Lock()
+        self._progress_lock = threading.Lock()
+        # Pages whose links were extracted this run, recorded in the dedup store once results are saved
+        self.processed_pages: Set[str] = set()
+        # Custom Search quota is shared by every scraper using the API
+        self.search_limiter = get_rate_limiter('google-cse', self.config.SEARCH_RATE, self.config.SEARCH_BURST)
+        # Cached responses spare quota and let a run start from stale hits while they refresh
+        self.search_cache: Optional[SearchCache] = None
+        if self.config.SEARCH_CACHE_PATH:
+            self.search_cache = SearchCache(
+                self._output_path(self.config.SEARCH_CACHE_PATH),
+                ttl=self.config.SEARCH_CACHE_TTL,
+                max_stale=self.config.SEARCH_CACHE_MAX_STALE
+            )
 
     def run(self) -> List[Dict]:
         """Run the scraper to collect AI policy updates."""
         try:
-            for query in self.config.SEARCH_QUERIES:
-                self.search_policies(query)
-                time.sleep(self.config.SEARCH_DELAY)
+            # Kept apart from completed_queries: these searches add results directly and
+            # record no URLs for a crawl to replay
+            searched = set(self.checkpoint.get('searched_queries', [])) if self.checkpoint else set()
+            pending = [query for query in self.config.SEARCH_QUERIES if query not in searched]
+            # Queries run concurrently; the search limiter paces them to the API's rate
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.SEARCH_CONCURRENCY) as executor:
+                for query, _ in zip(pending, executor.map(self.search_policies, pending)):
+                    if self.checkpoint is not None:
+                        searched.add(query)
+                        self.checkpoint.set('searched_queries', sorted(searched))
+                        self.save_checkpoint(force=True)
+            self.close_search_cache()
             return self.results
         except Exception as e:
             logger.error(f"Error running AI Policy scraper: {str(e)}")
             raise APIError(f"Error running AI Policy scraper: {str(e)}")
 
+    def _execute_search(self, query: str, start: int = 1) -> Dict:
+        """Run one Custom Search query, answered from the search cache when one is configured."""
+        if self.search_cache is None:
+            return self._request_search(query, start)
+        key = SearchCache.make_key(query, self.search_engine_id, start, SEARCH_PAGE_SIZE)
+        return self.search_cache.fetch(
+            key, lambda: self._request_search(query, start),
+            stale_while_revalidate=self.config.SEARCH_CACHE_REVALIDATE
+        )
+
+    def _request_search(self, query: str, start: int = 1) -> Dict:
+        """Call the Custom Search API within the rate limit, backing off on 429 responses."""
+        params = {'q': query, 'cx': self.search_engine_id, 'num': SEARCH_PAGE_SIZE}
+        if start > 1:
+            # The API starts at the first result by default
+            params['start'] = start
+        for attempt in range(self.config.RATE_LIMIT_RETRIES + 1):
+            self.search_limiter.acquire(deadline=self.deadline)
+            try:
+                result = self.search_client.search(**params)
+                self.search_limiter.record_success()
+                return result
+            except Exception as e:
+                if not is_rate_limited(e) or attempt == self.config.RATE_LIMIT_RETRIES:
+                    raise
+                self.search_limiter.penalize(retry_after(e))
+                self.deadline.check('search backoff')
+
     def search_policies(self, query: str) -> List[Dict]:
         """Search for AI policies using Google Custom Search API."""
         try:
-            result = self.service.cse().list(
-                q=query,
-                cx=self.search_engine_id,
-                num=10
-            ).execute()
+            result = self._execute_search(query)
             
             if 'items' in result:
                 for item in result['items']:
                     url = item.get('link')
                     title = item.get('title', '')
                     snippet = item.get('snippet', '')
-                    if url and self.url_processor.is_trusted_domain(url, self.config.TRUSTED_DOMAINS):
+                    if url and self.domain_matcher.is_trusted(url):
                         self.add_result(url, title, 'https://www.google.com')
             
             return self.results
@@ -162,10 +230,19 @@ class AIPolicyScraper(BaseScraper):
     def fetch_policy_content(self, url: str) -> str:
         """Fetch and extract content from a policy URL."""
         try:
-            response = requests.get(url, headers=self.headers, timeout=self.config.REQUEST_TIMEOUT)
+            response, cached = self.conditional_get(url, document_max_bytes=self.config.MAX_DOCUMENT_BYTES)
+            if cached is not None:
+                return self.html_parser.extract_text(cached.body)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            return soup.get_text(strip=True)
+            self.store_body(url, response)
+            if response.kind == KIND_DOCUMENT and not response.skipped:
+                return self.document_extractor.extract(response.content, response.content_type) or ''
+            if response.skipped:
+                # Not HTML, or over its size cap
+                return ''
+            if self.page_cache is not None:
+                self.page_cache.put(url, response)
+            return self.html_parser.extract_text(response.text)
         except Exception as e:
             logger.error(f"Error fetching content from {url}: {str(e)}")
             raise APIError(f"Error fetching content from {url}: {str(e)}")
@@ -185,89 +262,435 @@ class AIPolicyScraper(BaseScraper):
 
     def is_duplicate(self, url: str, title: str) -> bool:
         """Check if the URL or content is a duplicate."""
-        normalized_url = self.url_processor.normalize_url(url)
-        content_hash = self.get_content_hash(title)
-        
-        if normalized_url in self.visited_urls:
+        # Visited URLs, content hashes and keys from previous runs; titles are compared
+        # only when DEDUP_SIMILAR_TITLES is set
+        if super().is_duplicate(url, title):
             return True
             
-        if content_hash in self.url_hashes:
-            return True
-            
-        for existing_url in self.visited_urls:
-            if self.is_similar_content(normalized_url, existing_url):
-                return True
-        
-        return False
+        # Compare only with visited URLs under the same host and parent path
+        return self.url_index.has_similar(self.url_processor.normalize_url(url))
+
+    def close_search_cache(self):
+        """Let background search cache refreshes finish and close the cache."""
+        if self.search_cache is not None:
+            self.search_cache.close()
+
+    def _completed_queries(self) -> Dict[str, List[str]]:
+        """Queries finished by a checkpointed run, mapped to the URLs they discovered."""
+        if self.checkpoint is None:
+            return {}
+        return self.checkpoint.get('completed_queries', {})
+
+    def _mark_query_done(self, query: str, urls: List[str]):
+        if self.checkpoint is None:
+            return
+        with self._queries_lock:
+            completed = dict(self._completed_queries())
+            completed[query] = urls
+            self.checkpoint.set('completed_queries', completed)
+        self.save_checkpoint(force=True)
 
     def discover_urls(self) -> List[str]:
         """Discover relevant URLs using Google Custom Search API."""
         discovered_urls = set()
+        completed = self._completed_queries()
+        pending = []
         
         for query in self.config.SEARCH_QUERIES:
-            try:
-                result = self.service.cse().list(
-                    q=query,
-                    cx=self.search_engine_id,
-                    num=10
-                ).execute()
+            if query in completed:
+                discovered_urls.update(completed[query])
+            else:
+                pending.append(query)
+        
+        # Queries run concurrently; the search limiter paces them to the API's rate
+        discovered_lock = threading.Lock()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.SEARCH_CONCURRENCY) as executor:
+            results = executor.map(
+                lambda query: self._discover_query(query, discovered_urls, discovered_lock), pending
+            )
+            for query, query_urls in zip(pending, results):
+                discovered_urls.update(query_urls)
+                # A query cut short by the time budget is searched again on resume
+                if not self.deadline.expired():
+                    self._mark_query_done(query, query_urls)
+        
+        return list(discovered_urls)
+
+    def _discover_query(self, query: str, discovered_urls: Set[str], discovered_lock: threading.Lock) -> List[str]:
+        """Return the trusted result URLs of one search query, adding them to discovered_urls.
+
+        Result pages are requested in turn up to SEARCH_MAX_PAGES, stopping early at the
+        last page or at a page that yields no trusted URL not already discovered.
+        """
+        try:
+            query_urls = []
+            max_pages = min(self.config.SEARCH_MAX_PAGES, SEARCH_RESULT_LIMIT // SEARCH_PAGE_SIZE)
+            for page in range(max_pages):
+                if page and self.deadline.expired():
+                    logger.warning(f"Time budget exhausted, stopping '{query}' after {page} result pages")
+                    break
+                result = self._execute_search(query, start=page * SEARCH_PAGE_SIZE + 1)
                 
+                page_urls = []
                 if 'items' in result:
                     for item in result['items']:
                         url = item.get('link')
-                        if url and self.url_processor.is_trusted_domain(url, self.config.TRUSTED_DOMAINS):
-                            discovered_urls.add(url)
-                
-                time.sleep(self.config.SEARCH_DELAY)
+                        if url and self.domain_matcher.is_trusted(url):
+                            page_urls.append(url)
+                with discovered_lock:
+                    new_urls = [url for url in dict.fromkeys(page_urls) if url not in discovered_urls]
+                    discovered_urls.update(new_urls)
+                query_urls.extend(new_urls)
                 
-            except Exception as e:
-                logger.error(f"Error searching for query '{query}': {str(e)}")
-                raise APIError(f"Error searching for query '{query}': {str(e)}")
-        
-        return list(discovered_urls)
+                # Further pages of this query are unlikely to pay for their quota
+                if not new_urls or 'nextPage' not in result.get('queries', {}):
+                    break
+            return query_urls
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error searching for query '{query}': {str(e)}")
+            raise APIError(f"Error searching for query '{query}': {str(e)}")
 
     def _is_relevant_link(self, text: str, url: str) -> bool:
         """Check if a link is relevant to AI policy."""
         return self.content_processor.is_relevant_content(text, url, self.config.KEYWORDS)
 
+    def _parse_links(self, url: str, markup: str) -> List[Tuple[str, str]]:
+        """Return the (absolute URL, text) pairs of a page's anchors."""
+        return [(urljoin(url, href), text) for href, text in self.html_parser.extract_links(markup)]
+
     def extract_links(self, url: str) -> List[Dict]:
         """Extract relevant links from a discovered URL."""
         try:
-            self.visited_urls.add(url)
-            response = requests.get(url, headers=self.headers, timeout=self.config.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag.get('href')
-                text = a_tag.get_text(strip=True)
-                
-                full_url = urljoin(url, href)
-                
-                if self._is_relevant_link(text, full_url):
-                    if (self.url_processor.validate_url(full_url, self.headers, self.visited_urls) and 
-                        self.url_processor.is_trusted_domain(full_url, self.config.TRUSTED_DOMAINS)):
-                        self.add_result(full_url, text, url)
-            
+            self._extract_page(url)
             return self.results
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error extracting links from {url}: {str(e)}")
             return []
 
-    def scrape_with_threading(self):
-        """Scrape discovered URLs using threading for better performance."""
+    def _extract_page(self, url: str) -> List[Tuple[str, str]]:
+        """Fetch a page, add its relevant trusted links as results and return the links that validated."""
+        page = self._fetch_page(url)
+        if page is None:
+            return []
+        valid_links = self._validate_links(self._parse_page(url, page))
+        self._store_links(url, valid_links)
+        return valid_links
+
+    def _fetch_page(self, url: str) -> Optional[Tuple[StreamedResponse, Optional[CachedPage]]]:
+        """Fetch a page, returning the response and its cache entry if it was unchanged,
+        or None if robots.txt disallows it or its body was skipped."""
+        self.visited_urls.add(url)
+        if not self.host_scheduler.can_fetch(url):
+            logger.info(f"Skipping {url}: disallowed by robots.txt")
+            return None
+        with self.host_scheduler.slot(url):
+            response, cached = self.conditional_get(url)
+        if cached is None:
+            response.raise_for_status()
+            if response.skipped:
+                return None
+            self.store_body(url, response)
+        return response, cached
+
+    def _parse_page(self, url: str, page: Tuple[StreamedResponse, Optional[CachedPage]]) -> List[Tuple[str, str]]:
+        """Return the relevant trusted (URL, text) links of a fetched page."""
+        response, cached = page
+        if cached is None:
+            links = self._parse_links(url, response.text)
+            if self.page_cache is not None:
+                self.page_cache.put(url, response, links)
+        elif cached.links is not None:
+            # Unchanged since it was last fetched: replay its links without parsing
+            links = cached.links
+        else:
+            links = self._parse_links(url, cached.body)
+        trusted = self.domain_matcher.match_urls(full_url for full_url, _ in links)
+        
+        # Collect relevant trusted links first so they can be validated as one concurrent batch
+        trusted_links = [(full_url, text) for full_url, text in links if trusted[full_url]]
+        relevant = self.content_processor.relevant_batch(
+            ((text, full_url) for full_url, text in trusted_links), self.config.KEYWORDS
+        )
+        return [link for link, is_relevant in zip(trusted_links, relevant) if is_relevant]
+
+    def _validate_links(self, candidates: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Return the candidate links whose URLs validate."""
+        validity = self.validate_urls(full_url for full_url, _ in candidates)
+        return [(full_url, text) for full_url, text in candidates if validity.get(full_url)]
+
+    def _store_links(self, url: str, valid_links: List[Tuple[str, str]]):
+        for full_url, text in valid_links:
+            self.add_result(full_url, text, url)
+        self.processed_pages.add(self.url_processor.normalize_url(url))
+
+    def _processed_in_previous_run(self, url: str) -> bool:
+        return self.seen_in_previous_run(KIND_PROCESSED, self.url_processor.normalize_url(url))
+
+    def _remember_results(self):
+        """Record saved results, and the pages their links were extracted from, in the dedup store."""
+        store = self.dedup_store
+        if store is not None:
+            store.add_many(KIND_PROCESSED, sorted(self.processed_pages))
+        super()._remember_results()
+
+    def _pending_extractions(self) -> Tuple[List[str], Set[str]]:
+        """Discover URLs and return those still to extract, with those a checkpointed run extracted."""
         discovered_urls = self.discover_urls()
         logger.info(f"Discovered {len(discovered_urls)} potential URLs")
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS) as executor:
-            future_to_url = {executor.submit(self.extract_links, url): url for url in discovered_urls}
-            
-            for future in concurrent.futures.as_completed(future_to_url):
-                url = future_to_url[future]
+
+        # Skip pages already passed through extract_links by a checkpointed run, and pages
+        # whose links an earlier run extracted
+        extracted_urls = self._extracted_urls()
+        # Round-robin across hosts so workers spread over sites instead of queueing on one
+        pending_urls = interleave_by_host(
+            url for url in discovered_urls
+            if url not in extracted_urls and not self._processed_in_previous_run(url)
+        )
+        if len(pending_urls) < len(discovered_urls):
+            logger.info(f"Resuming with {len(pending_urls)} URLs left to extract")
+        return pending_urls, extracted_urls
+
+    def _extracted_urls(self) -> Set[str]:
+        """Pages a checkpointed run already extracted, as a set _mark_extracted adds to.
+
+        The set is sorted into the checkpoint only when the checkpoint is written.
+        """
+        if self.checkpoint is None:
+            return set()
+        extracted_urls = set(self.checkpoint.get('extracted_urls', []))
+
+        def snapshot():
+            with self._progress_lock:
+                return sorted(extracted_urls)
+
+        self.checkpoint.provide('extracted_urls', snapshot)
+        return extracted_urls
+
+    def _mark_extracted(self, url: str, extracted_urls: Set[str]):
+        if self.checkpoint is not None:
+            with self._progress_lock:
+                extracted_urls.add(url)
+            self.save_checkpoint()
+
+    def scrape_with_threading(self):
+        """Scrape discovered URLs through a staged pipeline of worker threads.
+
+        Search queries, page fetches, link parsing, link validation and result storage
+        each run on their own workers, joined by bounded queues: a stage that gets
+        ahead blocks until the next one catches up, so discovery never queues more
+        pages than the fetchers can take and pages are fetched as soon as their query
+        returns. A failed search query does not stop the other stages; its error is
+        raised once they have drained. self.pipeline.stop() ends the crawl early from
+        another thread.
+        """
+        completed = self._completed_queries()
+        extracted_urls = self._extracted_urls()
+        discovered_urls = set(url for urls in completed.values() for url in urls)
+        discovered_lock = threading.Lock()
+        # Search failures, re-raised once the pages already discovered are extracted
+        discover_errors = []
+
+        def discover(query):
+            if query in completed:
+                query_urls = completed[query]
+            else:
+                try:
+                    query_urls = self._discover_query(query, discovered_urls, discovered_lock)
+                except DeadlineExceeded:
+                    raise
+                except Exception as e:
+                    discover_errors.append(e)
+                    raise
+                # A query cut short by the time budget is searched again on resume
+                if not self.deadline.expired():
+                    self._mark_query_done(query, query_urls)
+            # Round-robin across hosts so fetch workers spread over sites instead of queueing on one.
+            # Pages travel as (url, value) pairs; a None value marks a page with nothing left to do
+            pending_urls = interleave_by_host(
+                url for url in query_urls
+                if url not in extracted_urls and not self._processed_in_previous_run(url)
+            )
+            return [(url, url) for url in pending_urls]
+
+        def page_step(step):
+            """Wrap a per-page step so a failure still passes the page on to be marked extracted."""
+            def run(item):
+                url, value = item
+                if value is None:
+                    return [item]
                 try:
-                    future.result()
+                    return [(url, step(url, value))]
+                except DeadlineExceeded:
+                    # Left unmarked so a resumed run extracts the page again
+                    return None
                 except Exception as e:
-                    logger.error(f"Error processing {url}: {str(e)}")
+                    logger.error(f"Error extracting links from {url}: {str(e)}")
+                    return [(url, None)]
+            return run
+
+        def store(item):
+            url, valid_links = item
+            if valid_links is not None:
+                self._store_links(url, valid_links)
+            self._mark_extracted(url, extracted_urls)
+
+        queue_size = self.config.PIPELINE_QUEUE_SIZE
+        self.pipeline = StagedPipeline([
+            Stage('discover', discover, self.config.SEARCH_CONCURRENCY, queue_size),
+            Stage('fetch', page_step(lambda url, _: self._fetch_page(url)), self.config.MAX_WORKERS, queue_size),
+            Stage('parse', page_step(self._parse_page), self.config.PARSE_WORKERS, queue_size),
+            Stage('validate', page_step(lambda _, candidates: self._validate_links(candidates)),
+                  self.config.VALIDATE_STAGE_WORKERS, queue_size),
+            Stage('store', store, 1, queue_size),
+        ])
+        remaining = self.deadline.remaining()
+        timer = threading.Timer(remaining, self.pipeline.stop) if remaining is not None else None
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+        try:
+            stats = self.pipeline.run(self.config.SEARCH_QUERIES)
+            logger.info(f"Extracted {stats['store'].processed} pages")
+            if self.pipeline.stopped:
+                logger.warning("Time budget exhausted, queued pages left unextracted")
+            if discover_errors:
+                # Fail the run like discover_urls does, so the checkpoint is kept and
+                # --resume searches the failed queries again
+                raise discover_errors[0]
+        finally:
+            if timer is not None:
+                timer.cancel()
+            self._finish_crawl()
+
+    def _frontier_score(self, url: str, text: str, depth: int) -> float:
+        relevance = len(self.content_processor.match_keywords(text, url, self.config.KEYWORDS))
+        return score_page(relevance, self.domain_matcher.trust_level(url), depth)
+
+    def _frontier_floor(self) -> float:
+        """Lowest score still worth fetching: zero with the full budget left, rising to
+        the best score seen as the budget runs out."""
+        return self.frontier.max_score * (1 - self.deadline.fraction_remaining())
+
+    def scrape_deep(self):
+        """Crawl beyond the search hits, highest-priority pages first.
+
+        Search hits are seeded at depth 0; the relevant trusted links found on each page
+        are enqueued one level deeper, scored by keyword relevance, domain trust and
+        depth. CRAWL_MAX_DEPTH, CRAWL_DOMAIN_BUDGET and CRAWL_MAX_PAGES bound the crawl.
+        Under a time budget, pages scoring below a rising share of the best score are
+        left out as the budget runs down, and no page is started once it is spent.
+        """
+        pending_urls, extracted_urls = self._pending_extractions()
+        self.frontier = CrawlFrontier(
+            max_depth=self.config.CRAWL_MAX_DEPTH,
+            domain_budget=self.config.CRAWL_DOMAIN_BUDGET,
+            max_pages=self.config.CRAWL_MAX_PAGES,
+            normalize=self.url_processor.normalize_url
+        )
+        self.frontier.mark_seen(extracted_urls)
+        for url in pending_urls:
+            self.frontier.push(url, 0, self._frontier_score(url, '', 0))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS) as executor:
+            in_flight = {}
+            while True:
+                # Keep the workers busy with the best pages the frontier holds
+                while len(in_flight) < self.config.MAX_WORKERS and not self.deadline.expired():
+                    entry = self.frontier.pop(min_score=self._frontier_floor())
+                    if entry is None:
+                        break
+                    in_flight[executor.submit(self._extract_page, entry[0])] = entry
+                if not in_flight:
+                    break
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    url, depth = in_flight.pop(future)
+                    try:
+                        for link, text in future.result():
+                            self.frontier.push(link, depth + 1, self._frontier_score(link, text, depth + 1))
+                    except DeadlineExceeded:
+                        # Not extracted; a resumed run fetches it again
+                        continue
+                    except Exception as e:
+                        logger.error(f"Error extracting links from {url}: {str(e)}")
+                    self._mark_extracted(url, extracted_urls)
+        if self.deadline.expired():
+            logger.warning(f"Time budget exhausted with {len(self.frontier)} pages left in the frontier")
+        logger.info(f"Deep crawl fetched {self.frontier.pages_popped} pages")
+        self._finish_crawl()
+
+    def _fetch_document(self, url: str) -> Optional[StreamedResponse]:
+        with self.host_scheduler.slot(url):
+            response = self.http.stream_get(url, 0, self.config.MAX_DOCUMENT_BYTES)
+        response.raise_for_status()
+        if response.kind != KIND_DOCUMENT or response.skipped:
+            return None
+        self.store_body(url, response)
+        return response
+
+    @staticmethod
+    def _document_title(text: str, url: str) -> str:
+        """First substantial line of a document's text, or its file name."""
+        for line in text.splitlines():
+            line = ' '.join(line.split())
+            if len(line.split()) >= 3:
+                return line[:200]
+        return os.path.basename(urlparse(url).path) or url
+
+    def extract_documents(self):
+        """Extract the text of the documents routed aside while crawling and add the relevant ones as results.
+
+        Documents are downloaded by the crawl threads and parsed by the document
+        extractor's worker processes, a batch of MAX_WORKERS at a time.
+        """
+        with self._documents_lock:
+            urls = list(self.documents)
+            self.documents.clear()
+        if not urls:
+            return
+        logger.info(f"Extracting text from {len(urls)} documents")
+        batch_size = self.config.MAX_WORKERS
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.MAX_WORKERS) as executor:
+            for i in range(0, len(urls), batch_size):
+                batch = urls[i:i + batch_size]
+                fetched = []
+                for url, future in zip(batch, [executor.submit(self._fetch_document, url) for url in batch]):
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        logger.error(f"Error fetching document {url}: {str(e)}")
+                        continue
+                    if response is not None:
+                        fetched.append((url, response))
+                texts = self.document_extractor.extract_many(
+                    (response.content, response.content_type) for _, response in fetched
+                )
+                for (url, _), text in zip(fetched, texts):
+                    if text and self.content_processor.is_relevant_content(text, url, self.config.KEYWORDS):
+                        self.add_result(url, self._document_title(text, url), url)
+
+    def _finish_crawl(self):
+        """Extract routed documents, then write the final checkpoint and release shared resources."""
+        if self.deadline.expired():
+            logger.warning("Time budget exhausted, leaving routed documents unextracted")
+        else:
+            try:
+                self.extract_documents()
+            except Exception as e:
+                logger.error(f"Error extracting documents: {str(e)}")
+        self.save_checkpoint(force=True)
+        self.close_search_cache()
+        self.close_validation_pool()
+        self.document_extractor.close()
+        if self.page_cache is not None:
+            self.page_cache.close()
+        if self.content_store is not None:
+            self.content_store.close()
+        self.http.log_stats()
 
     def save_results(self, filename: str = 'ai_policy_updates.json'):
         """Save the scraped results to a JSON file in the output directory."""
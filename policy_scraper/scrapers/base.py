@@ -10,12 +10,28 @@ import logging
 from datetime import datetime
 import json
 import os
-from typing import List, Dict, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Set, Optional, Iterator, Tuple
 from dotenv import load_dotenv
 from policy_scraper.processors.url_processor import URLProcessor
 from policy_scraper.processors.content_processor import ContentProcessor
+from policy_scraper.processors.dedup_index import TitleSimilarityIndex
+from policy_scraper.processors.html_parser import get_html_parser
+from policy_scraper.processors.document_extractor import DocumentExtractor
 from policy_scraper.exceptions.scraper_exceptions import ScraperError
 from policy_scraper.utils.config import ScraperConfig
+from policy_scraper.utils.dedup_store import DedupStore, KIND_URL, KIND_HASH
+from policy_scraper.utils.validation_cache import ValidationCache
+from policy_scraper.utils.host_scheduler import HostScheduler
+from policy_scraper.utils.http_client import HTTPClient, StreamedResponse, KIND_DOCUMENT
+from policy_scraper.utils.page_cache import PageCache, CachedPage
+from policy_scraper.utils.document_cache import DocumentTextCache
+from policy_scraper.utils.content_store import ContentStore
+from policy_scraper.utils.result_store import ResultStore
+from policy_scraper.utils.result_sink import JSONLResultSink, iter_jsonl
+from policy_scraper.utils.checkpoint import Checkpoint
+from policy_scraper.utils.deadline import Deadline
 
 # Load environment variables from .env file
 load_dotenv()
@@ -33,11 +49,197 @@ class BaseScraper:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
-        self.visited_urls: Set[str] = set()
-        self.url_hashes: Set[str] = set()
+        # Visited URLs and content hashes are lock-striped so worker threads can share them
+        self.result_store = ResultStore(self.config.RESULT_STORE_STRIPES)
+        self.visited_urls: Set[str] = self.result_store.urls
+        self.url_hashes: Set[str] = self.result_store.hashes
         self.results: List[Dict] = []
+        # Guards the results list together with the title index built from it
+        self._results_lock = threading.RLock()
         self.url_processor = URLProcessor()
         self.content_processor = ContentProcessor()
+        self.html_parser = get_html_parser(self.config.HTML_PARSER)
+        # Keep-alive connection pool shared by page fetches, validation and robots.txt lookups
+        self.http = HTTPClient(
+            self.headers,
+            pool_connections=self.config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.config.HTTP_POOL_MAXSIZE,
+            timeout=self.config.REQUEST_TIMEOUT
+        )
+        self._validation_pool: Optional[ThreadPoolExecutor] = None
+        self._validation_pool_lock = threading.Lock()
+        # Per-host politeness: robots.txt, Crawl-delay and connection caps
+        self.host_scheduler = HostScheduler(
+            self.http, self.headers,
+            max_concurrency=self.config.MAX_CONNECTIONS_PER_HOST,
+            min_delay=self.config.HOST_MIN_DELAY,
+            respect_robots=self.config.RESPECT_ROBOTS_TXT,
+            robots_ttl=self.config.ROBOTS_TXT_TTL,
+            timeout=self.config.REQUEST_TIMEOUT
+        )
+        self.deadline = Deadline(self.config.TIME_BUDGET)
+        # Raw bodies of fetched pages, kept by content hash for reprocessing without a re-crawl
+        self.content_store: Optional[ContentStore] = None
+        if self.config.CONTENT_STORE_PATH:
+            self.content_store = ContentStore(
+                self._output_path(self.config.CONTENT_STORE_PATH),
+                compression=self.config.CONTENT_STORE_COMPRESSION
+            )
+        # Documents (PDF, DOC, DOCX) met while fetching pages, by URL, for the document extraction path
+        self.documents: Dict[str, str] = {}
+        self._documents_lock = threading.Lock()
+        # Document text is parsed in worker processes and cached by content hash
+        self.document_extractor = DocumentExtractor(
+            workers=self.config.DOCUMENT_WORKERS,
+            timeout=self.config.DOCUMENT_TIMEOUT,
+            max_pages=self.config.DOCUMENT_MAX_PAGES,
+            cache=DocumentTextCache(
+                self._output_path(self.config.DOCUMENT_CACHE_PATH) if self.config.DOCUMENT_CACHE_PATH else None
+            )
+        )
+        # Validators and extracted links of fetched pages, for conditional GETs on later runs
+        self.page_cache: Optional[PageCache] = None
+        if self.config.PAGE_CACHE_PATH:
+            self.page_cache = PageCache(self._output_path(self.config.PAGE_CACHE_PATH))
+        self.validation_cache = ValidationCache(
+            self._output_path(self.config.VALIDATION_CACHE_PATH) if self.config.VALIDATION_CACHE_PATH else None,
+            ttl=self.config.VALIDATION_CACHE_TTL,
+            max_entries=self.config.VALIDATION_CACHE_SIZE
+        )
+        self._title_index = self._new_title_index()
+        self._indexed_results: List[Dict] = self.results
+        self._indexed_count = 0
+        self._result_urls: Set[str] = set()
+        self._dedup_store: Optional[DedupStore] = None
+        # In streaming mode accepted results go to a JSONL file instead of self.results
+        self.result_sink: Optional[JSONLResultSink] = None
+        if self.config.RESULT_STREAM_PATH:
+            self.result_sink = JSONLResultSink(
+                self._output_path(self.config.RESULT_STREAM_PATH),
+                batch_size=self.config.RESULT_STREAM_BATCH_SIZE
+            )
+        self.checkpoint: Optional[Checkpoint] = None
+        if self.config.CHECKPOINT_PATH:
+            self.checkpoint = Checkpoint(
+                self._output_path(self.config.CHECKPOINT_PATH),
+                save_interval=self.config.CHECKPOINT_INTERVAL
+            )
+            if self.result_sink is None:
+                # Copied only when the checkpoint is written, not on every progress update
+                self.checkpoint.provide('results', self._results_snapshot)
+
+    @property
+    def deadline(self) -> Deadline:
+        """Time budget of the run; assign a shared Deadline to make several scrapers inherit one."""
+        return self._deadline
+
+    @deadline.setter
+    def deadline(self, deadline: Deadline):
+        self._deadline = deadline
+        self.http.deadline = deadline
+        self.host_scheduler.deadline = deadline
+
+    def _output_path(self, filename: str) -> str:
+        """Resolve a relative filename under the output directory."""
+        output_dir = os.path.join(os.path.dirname(__file__), '..', 'output')
+        os.makedirs(output_dir, exist_ok=True)
+        if not os.path.isabs(filename):
+            filename = os.path.join(output_dir, filename)
+        return filename
+
+    @property
+    def dedup_store(self) -> Optional[DedupStore]:
+        """Persistent cross-run dedup store, opened lazily when configured."""
+        if self._dedup_store is None and self.config.DEDUP_STORE_PATH:
+            self._dedup_store = DedupStore(
+                self._output_path(self.config.DEDUP_STORE_PATH),
+                batch_size=self.config.DEDUP_BATCH_SIZE
+            )
+        return self._dedup_store
+
+    def seen_in_previous_run(self, kind: str, key: str) -> bool:
+        """Check the persistent dedup store for a key recorded by an earlier run."""
+        store = self.dedup_store
+        return store is not None and store.contains(kind, key)
+
+    def remember(self, kind: str, key: str):
+        """Record a key in the persistent dedup store, if one is configured."""
+        store = self.dedup_store
+        if store is not None:
+            store.add(kind, key)
+
+    def _new_title_index(self) -> TitleSimilarityIndex:
+        return TitleSimilarityIndex(
+            threshold=self.config.SIMILARITY_THRESHOLD,
+            num_bands=self.config.TITLE_LSH_BANDS,
+            rows_per_band=self.config.TITLE_LSH_ROWS
+        )
+
+    def _sync_title_index(self):
+        """Bring the title index up to date if results were replaced or extended directly."""
+        if self.results is not self._indexed_results or self._indexed_count > len(self.results):
+            self._title_index = self._new_title_index()
+            self._result_urls = set()
+            self._indexed_results = self.results
+            self._indexed_count = 0
+        for result in self.results[self._indexed_count:]:
+            self._index_result(result.get('title', ''), result.get('normalized_url'))
+        self._indexed_count = len(self.results)
+
+    def _index_result(self, title: str, normalized_url: Optional[str]):
+        self._title_index.add(title)
+        if normalized_url:
+            self._result_urls.add(normalized_url)
+
+    def resume(self) -> bool:
+        """Load the last checkpoint and the results accepted before it.
+
+        Returns False, leaving the scraper untouched, if there is no checkpoint to resume.
+        """
+        if self.checkpoint is None or not self.checkpoint.load():
+            return False
+        if self.result_sink is not None:
+            # Keep appending to the stream and rebuild dedup state from what it holds
+            self.result_sink.resume()
+            restored = iter_jsonl(self.result_sink.path)
+        else:
+            restored = self.checkpoint.get('results', [])
+        count = 0
+        with self._results_lock:
+            for record in restored:
+                normalized_url = record.get('normalized_url') or self.url_processor.normalize_url(record['url'])
+                self.result_store.claim(normalized_url, self.content_processor.get_content_hash(record['title']))
+                self._index_result(record['title'], normalized_url)
+                if self.result_sink is None:
+                    self.results.append(record)
+                    self._indexed_count = len(self.results)
+                count += 1
+        logger.info(f"Resumed from checkpoint with {count} previous results")
+        return True
+
+    def save_checkpoint(self, force: bool = False):
+        """Persist progress; without force, only once the checkpoint interval has elapsed."""
+        if self.checkpoint is None:
+            return
+        if self.result_sink is not None:
+            # Streamed results must be on disk before progress past them is recorded
+            self.result_sink.flush()
+        # Provided values such as the results are rebuilt when the checkpoint is written
+        self.checkpoint.touch()
+        if force:
+            self.checkpoint.save()
+        else:
+            self.checkpoint.maybe_save()
+
+    def _results_snapshot(self) -> List[Dict]:
+        with self._results_lock:
+            return list(self.results)
+
+    def iter_results(self) -> Iterator[Dict]:
+        """Iterate over accepted results, reading them back from the stream in streaming mode."""
+        if self.result_sink is not None:
+            return iter(self.result_sink)
+        return iter(list(self.results))
 
     def is_duplicate(self, url: str, title: str) -> bool:
         """Check if the URL or content is a duplicate."""
@@ -51,48 +253,174 @@ class BaseScraper:
         # Check if the content hash exists
         if content_hash in self.url_hashes:
             return True
+
+        # Check keys recorded by previous runs
+        if self.seen_in_previous_run(KIND_URL, normalized_url) or self.seen_in_previous_run(KIND_HASH, content_hash):
+            return True
             
-        # Check for similar content and URLs
-        for result in self.results:
-            if self.content_processor.is_similar_content(title, result['title'], self.config.SIMILARITY_THRESHOLD):
-                return True
-            if normalized_url == result['normalized_url']:  # Use exact match for normalized URLs
+        with self._results_lock:
+            self._sync_title_index()
+            if normalized_url in self._result_urls:
                 return True
-        
-        return False
+            title_index = self._title_index
+
+        if not self.config.DEDUP_SIMILAR_TITLES:
+            return False
+        # Compare similar content against LSH candidates only, outside the results lock
+        return title_index.has_similar(title)
+
+    def conditional_get(self, url: str, document_max_bytes: int = 0) -> Tuple[StreamedResponse, Optional[CachedPage]]:
+        """GET a page over the shared client, revalidating the cached copy if there is one.
+
+        The body is streamed and read only if it is HTML within MAX_PAGE_BYTES, or a
+        document within document_max_bytes. With no document cap, documents are left
+        unread and recorded with route_document.
+        Returns the response and, when the server answered 304 Not Modified, the cached page.
+        """
+        cached = self.page_cache.get(url) if self.page_cache is not None else None
+        headers = cached.conditional_headers() if cached is not None else None
+        response = self.http.stream_get(url, self.config.MAX_PAGE_BYTES, document_max_bytes, headers=headers)
+        if response.kind == KIND_DOCUMENT and response.status_code < 300 and document_max_bytes <= 0:
+            self.route_document(url, response.content_type)
+        return response, (cached if cached is not None and response.status_code == 304 else None)
+
+    def store_body(self, url: str, response: StreamedResponse):
+        """Keep a fully read body in the content store, if one is configured."""
+        if self.content_store is None or response.skipped or response.status_code != 200:
+            return
+        try:
+            self.content_store.put(self.url_processor.normalize_url(url), response.content, response.content_type)
+        except OSError as e:
+            logger.error(f"Error storing body of {url}: {str(e)}")
+
+    def route_document(self, url: str, content_type: str):
+        """Record a document URL for text extraction instead of HTML parsing."""
+        with self._documents_lock:
+            self.documents[url] = content_type
 
     def validate_url(self, url: str) -> bool:
         """Validate if a URL is legitimate and accessible."""
-        return self.url_processor.validate_url(url, self.headers, self.visited_urls)
+        return self.validate_urls([url])[url]
+
+    def validate_urls(self, urls) -> Dict[str, bool]:
+        """Validate many URLs concurrently over the pooled session.
+
+        Outcomes cached within the TTL are answered without a network call.
+        """
+        results: Dict[str, bool] = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            if url in self.visited_urls:
+                results[url] = False
+                continue
+            cached = self.validation_cache.get(self.url_processor.normalize_url(url))
+            if cached is not None:
+                results[url] = cached.is_valid
+            else:
+                pending.append(url)
+        checks = self.url_processor.check_urls(
+            pending, self.headers,
+            timeout=self.config.REQUEST_TIMEOUT,
+            session=self.http,
+            scheduler=self.host_scheduler,
+            executor=self._validation_executor()
+        )
+        for url, outcome in checks.items():
+            # Network failures are not cached so they are retried next time; the cache
+            # itself drops transient statuses
+            if outcome is not None:
+                self.validation_cache.put(self.url_processor.normalize_url(url), outcome)
+            results[url] = outcome is not None and outcome.is_valid
+        return results
+
+    def _validation_executor(self) -> ThreadPoolExecutor:
+        """Pool shared by every validate_urls call.
+
+        Pages validated at once by many workers share VALIDATION_WORKERS threads
+        instead of each starting a pool of their own.
+        """
+        with self._validation_pool_lock:
+            if self._validation_pool is None:
+                self._validation_pool = ThreadPoolExecutor(
+                    max_workers=self.config.VALIDATION_WORKERS, thread_name_prefix='validate'
+                )
+            return self._validation_pool
+
+    def close_validation_pool(self):
+        """Shut down the shared validation pool; a later validation starts a new one."""
+        with self._validation_pool_lock:
+            pool, self._validation_pool = self._validation_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
 
     def save_results(self, filename: str):
         """Save the scraped results to a JSON file under output directory."""
-        output_dir = os.path.join(os.path.dirname(__file__), '..', 'output')
-        os.makedirs(output_dir, exist_ok=True)
         # If filename is not an absolute path, save under output_dir
-        if not os.path.isabs(filename):
-            filename = os.path.join(output_dir, filename)
+        filename = self._output_path(filename)
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.results, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved {len(self.results)} results to {filename}")
+            if self.result_sink is not None:
+                count = self.result_sink.materialize(filename)
+                logger.info(f"Materialized {count} streamed results to {filename}")
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(self.results, f, indent=2, ensure_ascii=False)
+                logger.info(f"Saved {len(self.results)} results to {filename}")
         except Exception as e:
             logger.error(f"Error saving results: {str(e)}")
+            return
+        self.validation_cache.save()
+        self._remember_results()
+
+    def _remember_results(self):
+        """Record saved results in the dedup store.
+
+        This happens only after the results are on disk, so a crash can never leave a
+        result marked as seen without it having been written out.
+        """
+        store = self.dedup_store
+        if store is None:
+            return
+        for record in self.iter_results():
+            if 'normalized_url' in record:
+                store.add(KIND_URL, record['normalized_url'])
+                store.add(KIND_HASH, self.content_processor.get_content_hash(record.get('title', '')))
+        store.flush()
 
     def add_result(self, url: str, title: str, source_url: str):
         """Add a new result to the results list."""
         normalized_url = self.url_processor.normalize_url(url)
         content_hash = self.content_processor.get_content_hash(title)
         
-        if not self.is_duplicate(url, title):
-            self.url_hashes.add(content_hash)
-            self.visited_urls.add(normalized_url)
-            
-            self.results.append({
+        # Titles indexed before is_duplicate ran need not be compared again under the lock
+        with self._results_lock:
+            self._sync_title_index()
+            title_index = self._title_index
+            checked = len(title_index)
+        if self.is_duplicate(url, title):
+            return
+
+        with self._results_lock:
+            # Re-check only titles accepted since the unlocked check
+            self._sync_title_index()
+            since = checked if self._title_index is title_index else 0
+            if self.config.DEDUP_SIMILAR_TITLES and self._title_index.has_similar(title, since):
+                return
+            # Atomically claim the URL and content hash only once the result is accepted,
+            # so a rejected result does not leave them marked as visited
+            if not self.result_store.claim(normalized_url, content_hash):
+                return
+            record = {
                 'url': url,
                 'title': title,
                 'source_url': source_url,
                 'timestamp': datetime.now().isoformat(),
                 'normalized_url': normalized_url
-            })
-            logger.debug(f"Added new result: {url}") 
\ No newline at end of file
+            }
+            self._index_result(title, normalized_url)
+            if self.result_sink is not None:
+                self.result_sink.write(record)
+            else:
+                self.results.append(record)
+                self._indexed_count = len(self.results)
+
+        logger.debug(f"Added new result: {url}")
@@ -10,6 +10,8 @@ from typing import List, Dict, Optional, Set
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from .base import BaseScraper
 from ..utils.config import CongressScraperConfig
+from ..utils.dedup_store import KIND_PROCESSED
+from ..processors.keyword_matcher import get_keyword_matcher
 
 # Configure logging
 logging.basicConfig(
@@ -26,18 +28,21 @@ class CongressScraper(BaseScraper):
         self.timeout = 30000  # 30 seconds timeout
         self.query = self.config.SEARCH_TERM or "artificial intelligence"
         self.base_url = "https://www.congress.gov/search"
+        self.keyword_matcher = get_keyword_matcher(self.config.KEYWORDS, match_all_words=False)
 
     def is_relevant(self, title: str, summary: str) -> bool:
-        text = f"{title.lower()} {summary.lower()}"
-        keywords = [
-            "artificial intelligence", "machine learning", "ai governance",
-            "neural network", "automated decision", "foundation model",
-            "deep learning", "facial recognition", "algorithmic accountability"
-        ]
-        return any(k in text for k in keywords)
+        return self.keyword_matcher.matches_any(f"{title} {summary}")
 
     def search_bills(self) -> List[Dict]:
-        results = []
+        # Continue from the page after the last one a checkpointed run finished
+        page_number = self.checkpoint.get('page', 1) if self.checkpoint else 1
+        if page_number > 1:
+            results = list(self.results)
+            self.processed_urls.update(self.checkpoint.get('processed_urls', []))
+            logger.info(f"Resuming from page {page_number} with {len(results)} bills")
+        else:
+            results = []
+        self.results = results
         try:
             with sync_playwright() as p:
                 browser = p.chromium.launch(headless=True)
@@ -47,11 +52,13 @@ class CongressScraper(BaseScraper):
                 )
                 page = context.new_page()
 
-                # Set default timeout
-                page.set_default_timeout(self.timeout)
+                # Set default timeout, trimmed to the time left in the run
+                page.set_default_timeout(self._page_timeout())
 
                 query_param = json.dumps({"source": "legislation", "search": self.query})
                 url = f"{self.base_url}?q={query_param}"
+                if page_number > 1:
+                    url = f"{url}&page={page_number}"
                 logger.info(f"Navigating to: {url}")
                 
                 try:
@@ -60,7 +67,8 @@ class CongressScraper(BaseScraper):
                     logger.info("Waiting for page load...")
                     
                     # Wait for either the results list or a potential error message
-                    page.wait_for_selector("ol.basic-search-results-lists > li, .no-results-message", timeout=self.timeout)
+                    page.wait_for_selector("ol.basic-search-results-lists > li, .no-results-message",
+                                           timeout=self._page_timeout())
                     logger.info("Page loaded successfully")
 
                     # Check if we have results
@@ -90,8 +98,8 @@ class CongressScraper(BaseScraper):
                                 else:
                                     full_url = f"https://www.congress.gov{url}/text"
                                 
-                                # Skip if we've already processed this URL
-                                if full_url in self.processed_urls:
+                                # Skip if we've already processed this URL, in this run or an earlier one
+                                if full_url in self.processed_urls or self.seen_in_previous_run(KIND_PROCESSED, full_url):
                                     continue
                                 self.processed_urls.add(full_url)
 
@@ -109,13 +117,22 @@ class CongressScraper(BaseScraper):
                                 logger.error(f"Error processing item: {str(e)}")
                                 continue
 
+                        # Stop paginating once the run's time budget is spent; the checkpoint resumes here
+                        if self.deadline.expired():
+                            logger.warning(f"Time budget exhausted, stopping at page {page_number}")
+                            page_number += 1
+                            self._checkpoint_page(page_number)
+                            break
+
                         # Try to find and click the "Next" button
                         next_button = page.query_selector("a.pagination-next")
                         if next_button and "Next" in next_button.inner_text():
+                            page_number += 1
+                            self._checkpoint_page(page_number)
                             logger.info("Navigating to next page")
                             next_button.click()
                             page.wait_for_timeout(3000)  # Wait longer between pages
-                            page.wait_for_load_state('networkidle')
+                            page.wait_for_load_state('networkidle', timeout=self._page_timeout())
                         else:
                             logger.info("No more pages to process")
                             break
@@ -133,8 +150,25 @@ class CongressScraper(BaseScraper):
         # Save results even if we encountered errors
         self.results = results
         self.save_results("congress_bills.json")
+        # Only mark bills as processed across runs once they have been saved
+        for processed_url in self.processed_urls:
+            self.remember(KIND_PROCESSED, processed_url)
+        if self.dedup_store is not None:
+            self.dedup_store.flush()
         return results
 
+    def _page_timeout(self) -> float:
+        """Playwright timeout in milliseconds, trimmed to the time left in the run."""
+        return self.deadline.timeout(self.timeout / 1000) * 1000
+
+    def _checkpoint_page(self, page_number: int):
+        """Record the next page to process along with the bills collected so far."""
+        if self.checkpoint is None:
+            return
+        self.checkpoint.set('page', page_number)
+        self.checkpoint.set('processed_urls', sorted(self.processed_urls))
+        self.save_checkpoint(force=True)
+
     def run(self) -> List[Dict]:
         return self.search_bills()
 
@@ -0,0 +1,127 @@
+"""
+Staged pipeline module for the policy scrapers.
+This module implements StagedPipeline, which runs a crawl as a chain of stages
+(discover, fetch, parse, validate, store) joined by bounded queues. Each stage has
+its own worker threads sized to its bottleneck, and a stage whose output queue is
+full blocks until the next stage catches up, so fast discovery cannot pile up
+thousands of URLs ahead of slow fetches. Stopping the pipeline drops queued items
+while the items already being processed finish normally.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Tells a stage worker that its upstream stage has finished
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One step of a pipeline.
+
+    fn takes an item and returns the items to hand to the next stage (None or an
+    empty iterable to drop it); the last stage's outputs are discarded.
+    """
+    name: str
+    fn: Callable[[Any], Optional[Iterable[Any]]]
+    workers: int = 1
+    queue_size: int = 64  # Bound on items waiting for this stage
+
+
+@dataclass
+class StageStats:
+    """Counters of one stage after (or during) a run."""
+    processed: int = 0
+    errors: int = 0
+    max_queued: int = 0  # Highest number of items seen waiting in the stage's queue
+
+
+class StagedPipeline:
+    """Runs items through a chain of stages over bounded queues."""
+
+    def __init__(self, stages: List[Stage]):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.stats: Dict[str, StageStats] = {stage.name: StageStats() for stage in stages}
+        self._queues = [queue.Queue(maxsize=max(1, stage.queue_size)) for stage in stages]
+        self._stats_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        """Stop taking new work; items in flight finish and queued ones are dropped.
+
+        Safe to call from any thread.
+        """
+        self._stop_event.set()
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def _put(self, index: int, item: Any):
+        """Hand an item to a stage, blocking while its queue is full."""
+        inbox = self._queues[index]
+        inbox.put(item)
+        queued = inbox.qsize()
+        stats = self.stats[self.stages[index].name]
+        with self._stats_lock:
+            stats.max_queued = max(stats.max_queued, queued)
+
+    def _work(self, index: int):
+        stage = self.stages[index]
+        stats = self.stats[stage.name]
+        inbox = self._queues[index]
+        last = index == len(self.stages) - 1
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                return
+            if self.stopped:
+                # Keep draining so upstream workers blocked on this queue can finish
+                continue
+            try:
+                outputs = stage.fn(item)
+            except Exception as e:
+                logger.error(f"Error in {stage.name} stage: {str(e)}")
+                with self._stats_lock:
+                    stats.errors += 1
+                continue
+            with self._stats_lock:
+                stats.processed += 1
+            if last or outputs is None:
+                continue
+            for output in outputs:
+                self._put(index + 1, output)
+
+    def run(self, items: Iterable[Any]) -> Dict[str, StageStats]:
+        """Feed items to the first stage and return once every stage has drained."""
+        workers = []
+        for index, stage in enumerate(self.stages):
+            threads = [
+                threading.Thread(target=self._work, args=(index,), name=f"{stage.name}-{n}", daemon=True)
+                for n in range(max(1, stage.workers))
+            ]
+            for thread in threads:
+                thread.start()
+            workers.append(threads)
+
+        try:
+            for item in items:
+                if self.stopped:
+                    break
+                self._put(0, item)
+        finally:
+            # Close the stages in order: once a stage's workers exit, everything it
+            # produced is already queued ahead of the next stage's end markers
+            for index, threads in enumerate(workers):
+                for _ in threads:
+                    self._queues[index].put(_DONE)
+                for thread in threads:
+                    thread.join()
+        return self.stats
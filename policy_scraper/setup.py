@@ -7,10 +7,11 @@ setup(
     install_requires=[
         "requests",
         "beautifulsoup4",
-        "google-api-python-client",
         "python-dotenv",
         "validators",
         "tldextract",
+        "playwright",
+        "pypdf",
     ],
     python_requires=">=3.7",
     author="PolicySense Team",
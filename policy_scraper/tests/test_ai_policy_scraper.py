@@ -25,13 +25,16 @@ class TestAIPolicyScraper(unittest.TestCase):
     def tearDown(self):
         self.env_patcher.stop()
 
-    @patch('policy_scraper.scrapers.ai_policy.build')
-    def test_init_success(self, mock_build):
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_init_success(self, mock_search):
         """Test successful initialization of AIPolicyScraper"""
         scraper = AIPolicyScraper()
         self.assertEqual(scraper.api_key, self.mock_api_key)
         self.assertEqual(scraper.search_engine_id, self.mock_search_engine_id)
-        mock_build.assert_called_once()
+        self.assertEqual(scraper.search_client.api_key, self.mock_api_key)
+        self.assertIs(scraper.search_client.http, scraper.http)
+        # Construction makes no API calls
+        mock_search.assert_not_called()
 
     def test_init_missing_credentials(self):
         """Test initialization fails when credentials are missing"""
@@ -39,13 +42,16 @@ class TestAIPolicyScraper(unittest.TestCase):
             with self.assertRaises(ConfigurationError):
                 AIPolicyScraper()
 
-    @patch('policy_scraper.scrapers.ai_policy.build')
-    @patch('policy_scraper.scrapers.ai_policy.requests.get')
-    def test_fetch_policy_content_success(self, mock_get, mock_build):
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    @patch('policy_scraper.utils.http_client.HTTPClient.get')
+    def test_fetch_policy_content_success(self, mock_get, mock_search):
         """Test successful content fetching"""
         # Setup mock response
         mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
         mock_response.text = "<html><body>Test content</body></html>"
+        mock_response.iter_content.return_value = iter([mock_response.text.encode()])
         mock_get.return_value = mock_response
 
         scraper = AIPolicyScraper()
@@ -54,9 +60,9 @@ class TestAIPolicyScraper(unittest.TestCase):
         self.assertEqual(content, "Test content")
         mock_get.assert_called_once()
 
-    @patch('policy_scraper.scrapers.ai_policy.build')
-    @patch('policy_scraper.scrapers.ai_policy.requests.get')
-    def test_fetch_policy_content_error(self, mock_get, mock_build):
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    @patch('policy_scraper.utils.http_client.HTTPClient.get')
+    def test_fetch_policy_content_error(self, mock_get, mock_search):
         """Test content fetching error handling"""
         mock_get.side_effect = Exception("Network error")
         
@@ -64,8 +70,8 @@ class TestAIPolicyScraper(unittest.TestCase):
         with self.assertRaises(APIError):
             scraper.fetch_policy_content("https://test.com")
 
-    @patch('policy_scraper.scrapers.ai_policy.build')
-    def test_is_relevant_content(self, mock_build):
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_is_relevant_content(self, mock_search):
         """Test content relevance checking"""
         scraper = AIPolicyScraper()
         
@@ -77,8 +83,8 @@ class TestAIPolicyScraper(unittest.TestCase):
         irrelevant_text = "This is about cooking recipes"
         self.assertFalse(scraper.is_relevant_content(irrelevant_text))
 
-    @patch('policy_scraper.scrapers.ai_policy.build')
-    def test_url_processing(self, mock_build):
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_url_processing(self, mock_search):
         """Test URL processing functionality"""
         scraper = AIPolicyScraper()
         
@@ -93,8 +99,8 @@ class TestAIPolicyScraper(unittest.TestCase):
             {"whitehouse.gov"}
         ))
 
-    @patch('policy_scraper.scrapers.ai_policy.build')
-    def test_duplicate_detection(self, mock_build):
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_duplicate_detection(self, mock_search):
         """Test duplicate content detection"""
         scraper = AIPolicyScraper()
         
@@ -107,8 +113,53 @@ class TestAIPolicyScraper(unittest.TestCase):
         # Second URL should also not be a duplicate, since normalization keeps query params
         self.assertFalse(scraper.is_duplicate(url2, title))
 
-    @patch('policy_scraper.scrapers.ai_policy.build')
-    def test_save_results(self, mock_build):
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_similar_titles_on_other_hosts_kept(self, mock_search):
+        """Test that titles are only compared when DEDUP_SIMILAR_TITLES is set"""
+        scraper = AIPolicyScraper()
+        scraper.add_result("https://www.nist.gov/itl/ai-rmf", "AI Risk Management Framework 1.0", "https://www.nist.gov")
+        scraper.add_result("https://www.whitehouse.gov/ai-rmf", "AI Risk Management Framework 2.0", "https://www.whitehouse.gov")
+        self.assertEqual(len(scraper.results), 2)
+
+        scraper = AIPolicyScraper(config=AIScraperConfig(DEDUP_SIMILAR_TITLES=True))
+        scraper.add_result("https://www.nist.gov/itl/ai-rmf", "AI Risk Management Framework 1.0", "https://www.nist.gov")
+        scraper.add_result("https://www.whitehouse.gov/ai-rmf", "AI Risk Management Framework 2.0", "https://www.whitehouse.gov")
+        self.assertEqual(len(scraper.results), 1)
+
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_discover_urls_pagination(self, mock_search):
+        """Test that result pages are fetched until one yields no new trusted URLs"""
+        pages = {
+            ('ai policy', 1): ['https://nist.gov/1', 'https://example.com/spam'],
+            ('ai policy', 11): ['https://nist.gov/2'],
+            ('ai policy', 21): ['https://nist.gov/1', 'https://example.com/other'],
+            ('ai policy', 31): ['https://nist.gov/never-requested'],
+            ('ai ethics', 1): ['https://oecd.org/1'],
+            ('ai ethics', 11): ['https://oecd.org/2'],
+        }
+
+        def search(q, cx, num, start=1):
+            return {
+                'items': [{'link': link} for link in pages[(q, start)]],
+                'queries': {'nextPage': [{}]} if (q, start + num) in pages else {}
+            }
+
+        mock_search.side_effect = search
+        scraper = AIPolicyScraper(config=AIScraperConfig(SEARCH_QUERIES=['ai policy', 'ai ethics']))
+        scraper.search_limiter = Mock()
+
+        urls = scraper.discover_urls()
+
+        self.assertEqual(sorted(urls), ['https://nist.gov/1', 'https://nist.gov/2',
+                                        'https://oecd.org/1', 'https://oecd.org/2'])
+        requested = sorted((c.kwargs['q'], c.kwargs.get('start', 1))
+                           for c in mock_search.call_args_list)
+        # Page 3 of 'ai policy' added nothing new, so page 4 was skipped; 'ai ethics' had no page 3
+        self.assertEqual(requested, [('ai ethics', 1), ('ai ethics', 11),
+                                     ('ai policy', 1), ('ai policy', 11), ('ai policy', 21)])
+
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_save_results(self, mock_search):
         """Test saving results to file"""
         scraper = AIPolicyScraper()
         test_results = [
@@ -0,0 +1,178 @@
+"""
+Tests for checkpointing and resuming scraper runs
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import tempfile
+from policy_scraper.utils.checkpoint import Checkpoint
+from policy_scraper.utils.config import ScraperConfig, AIScraperConfig, CongressScraperConfig
+from policy_scraper.scrapers.base import BaseScraper
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.scrapers.congress import CongressScraper
+from policy_scraper.run_scrapers import _start_stage
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'checkpoint.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_save_and_load(self):
+        """Test that saved state is loaded by a new checkpoint"""
+        checkpoint = Checkpoint(self.path)
+        checkpoint.set('page', 3)
+        checkpoint.mark_complete()
+
+        loaded = Checkpoint(self.path)
+        self.assertTrue(loaded.load())
+        self.assertEqual(loaded.get('page'), 3)
+        self.assertTrue(loaded.is_complete())
+
+        loaded.clear()
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(Checkpoint(self.path).load())
+
+    def test_maybe_save_respects_interval(self):
+        """Test that periodic saves are rate limited"""
+        checkpoint = Checkpoint(self.path, save_interval=3600)
+        checkpoint.set('page', 1)
+        checkpoint.maybe_save()
+        checkpoint.set('page', 2)
+        checkpoint.maybe_save()
+        loaded = Checkpoint(self.path)
+        loaded.load()
+        self.assertEqual(loaded.get('page'), 1)
+
+    def test_provided_values_built_at_save(self):
+        """Test that provided values are computed only when the checkpoint is written"""
+        checkpoint = Checkpoint(self.path, save_interval=3600)
+        calls = []
+        checkpoint.provide('urls', lambda: calls.append(1) or ['a', 'b'])
+        checkpoint.touch()
+        self.assertEqual(calls, [])
+        checkpoint.save()
+        self.assertEqual(calls, [1])
+        loaded = Checkpoint(self.path)
+        loaded.load()
+        self.assertEqual(loaded.get('urls'), ['a', 'b'])
+
+class TestResume(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.stream_path = os.path.join(self.tmpdir.name, 'results.jsonl')
+        self.checkpoint_path = os.path.join(self.tmpdir.name, 'checkpoint.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_resume_restores_streamed_results(self):
+        """Test that a resumed scraper keeps earlier streamed results and their dedup state"""
+        config = ScraperConfig(RESULT_STREAM_PATH=self.stream_path, CHECKPOINT_PATH=self.checkpoint_path)
+        first = BaseScraper(config)
+        first.add_result("https://nist.gov/ai", "NIST AI Resource Center", "https://nist.gov")
+        first.save_checkpoint(force=True)
+        first.result_sink.close()
+        # Simulate a crash in the middle of writing the next record
+        with open(self.stream_path, 'a', encoding='utf-8') as f:
+            f.write('{"url": "https://nist.gov/tor')
+
+        second = BaseScraper(config)
+        self.assertTrue(second.resume())
+        self.assertTrue(second.is_duplicate("https://nist.gov/ai", "Other"))
+        second.add_result("https://europa.eu/ai-act", "EU Artificial Intelligence Act", "https://europa.eu")
+        self.assertEqual([r['url'] for r in second.iter_results()],
+                         ["https://nist.gov/ai", "https://europa.eu/ai-act"])
+        second.result_sink.close()
+
+    def test_resume_without_checkpoint(self):
+        """Test that resuming without a checkpoint starts fresh"""
+        scraper = BaseScraper(ScraperConfig(CHECKPOINT_PATH=self.checkpoint_path))
+        self.assertFalse(scraper.resume())
+        self.assertFalse(BaseScraper().resume())
+
+    @patch.dict(os.environ, {'GOOGLE_API_KEY': 'key', 'GOOGLE_CSE_ID': 'cx'})
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_ai_scraper_skips_completed_work(self, mock_search):
+        """Test that completed queries and extracted pages are not repeated"""
+        config = AIScraperConfig(CHECKPOINT_PATH=self.checkpoint_path,
+                                 SEARCH_QUERIES=['done query', 'new query'])
+        checkpoint = Checkpoint(self.checkpoint_path)
+        checkpoint.set('completed_queries', {'done query': ['https://nist.gov/a', 'https://nist.gov/b']})
+        checkpoint.set('extracted_urls', ['https://nist.gov/a'])
+        checkpoint.save()
+
+        mock_search.return_value = {
+            'items': [{'link': 'https://nist.gov/c'}]
+        }
+        scraper = AIPolicyScraper(config=config)
+        self.assertTrue(scraper.resume())
+        with patch.object(scraper, '_fetch_page', return_value=None) as mock_fetch:
+            scraper.scrape_with_threading()
+        mock_search.assert_called_once_with(q='new query', cx='cx', num=10)
+        self.assertEqual(sorted(call.args[0] for call in mock_fetch.call_args_list),
+                         ['https://nist.gov/b', 'https://nist.gov/c'])
+        self.assertEqual(scraper.checkpoint.get('extracted_urls'),
+                         ['https://nist.gov/a', 'https://nist.gov/b', 'https://nist.gov/c'])
+
+    @patch.dict(os.environ, {'GOOGLE_API_KEY': 'key', 'GOOGLE_CSE_ID': 'cx'})
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_search_run_does_not_clobber_discovered_urls(self, mock_search):
+        """Test that run() checkpoints its queries apart from the URLs a crawl replays"""
+        config = AIScraperConfig(CHECKPOINT_PATH=self.checkpoint_path,
+                                 SEARCH_QUERIES=['done query', 'new query'])
+        checkpoint = Checkpoint(self.checkpoint_path)
+        checkpoint.set('completed_queries', {'done query': ['https://nist.gov/a']})
+        checkpoint.save()
+
+        mock_search.return_value = {'items': []}
+        scraper = AIPolicyScraper(config=config)
+        self.assertTrue(scraper.resume())
+        scraper.run()
+        self.assertEqual(mock_search.call_count, 2)
+        self.assertEqual(scraper.checkpoint.get('completed_queries'), {'done query': ['https://nist.gov/a']})
+        self.assertEqual(scraper.checkpoint.get('searched_queries'), ['done query', 'new query'])
+
+    def _congress_page(self, mock_playwright, href, title, has_next, click_error=None):
+        """Point the mocked browser at one results page holding a single bill."""
+        page = MagicMock()
+        browser = mock_playwright.return_value.__enter__.return_value.chromium.launch.return_value
+        browser.new_context.return_value.new_page.return_value = page
+        item = MagicMock()
+        title_tag = MagicMock()
+        title_tag.inner_text.return_value = title
+        title_tag.get_attribute.return_value = href
+        summary_tag = MagicMock()
+        summary_tag.inner_text.return_value = "A bill about artificial intelligence"
+        item.query_selector.side_effect = lambda selector: title_tag if 'heading' in selector else summary_tag
+        page.query_selector_all.return_value = [item]
+        next_button = MagicMock()
+        next_button.inner_text.return_value = "Next"
+        next_button.click.side_effect = click_error
+        page.query_selector.side_effect = lambda selector: next_button if 'pagination' in selector and has_next else None
+        return page
+
+    @patch.object(CongressScraper, 'save_results')
+    @patch('policy_scraper.scrapers.congress.sync_playwright')
+    def test_congress_resume_keeps_results_of_interrupted_run(self, mock_playwright, mock_save):
+        """Test that bills found before an interruption survive a fresh run, a crash and a resume"""
+        config = CongressScraperConfig(CHECKPOINT_PATH=self.checkpoint_path)
+        first = CongressScraper(config=config)
+        # The fresh run clears any stale checkpoint after the scraper registered its providers
+        self.assertTrue(_start_stage(first, "Congress Scraper", resume=False))
+        self._congress_page(mock_playwright, "/bill/1", "AI Governance Act", has_next=True,
+                            click_error=RuntimeError("browser crashed"))
+        first.run()
+
+        second = CongressScraper(config=config)
+        self.assertTrue(_start_stage(second, "Congress Scraper", resume=True))
+        page = self._congress_page(mock_playwright, "/bill/2", "AI Safety Act", has_next=False)
+        results = second.run()
+        self.assertIn("page=2", page.goto.call_args.args[0])
+        self.assertEqual([r['url'] for r in results],
+                         ["https://www.congress.gov/bill/1/text", "https://www.congress.gov/bill/2/text"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for the content-addressed page store
+"""
+import unittest
+from unittest.mock import Mock
+import gzip
+import hashlib
+import os
+import tempfile
+from policy_scraper.utils.content_store import ContentStore, ZSTD_AVAILABLE
+from policy_scraper.exceptions.scraper_exceptions import ConfigurationError
+from policy_scraper.scrapers.base import BaseScraper
+from policy_scraper.utils.config import ScraperConfig
+
+PAGE = b"<html><body><h1>AI governance framework</h1></body></html>"
+
+class TestContentStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmpdir.name, 'content_store')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """Test that a body is stored compressed under its hash and read back by URL"""
+        store = ContentStore(self.root)
+        digest = store.put("https://nist.gov/ai", PAGE, 'text/html')
+        self.assertEqual(digest, hashlib.sha256(PAGE).hexdigest())
+        path = os.path.join(self.root, 'objects', digest[:2], digest[2:4], digest + '.gz')
+        self.assertEqual(gzip.decompress(open(path, 'rb').read()), PAGE)
+        self.assertEqual(store.get_url("https://nist.gov/ai"), PAGE)
+        self.assertEqual(store.lookup("https://nist.gov/ai").content_type, 'text/html')
+        self.assertIsNone(store.get_url("https://nist.gov/missing"))
+        store.close()
+
+    def test_identical_bodies_stored_once(self):
+        """Test that URLs serving the same body share one blob"""
+        store = ContentStore(self.root)
+        first = store.put("https://nist.gov/ai", PAGE)
+        second = store.put("https://www.nist.gov/ai-mirror", PAGE)
+        self.assertEqual(first, second)
+        blobs = [name for _, _, files in os.walk(os.path.join(self.root, 'objects')) for name in files]
+        self.assertEqual(len(blobs), 1)
+        self.assertEqual([page.url for page in store.pages()], ["https://nist.gov/ai", "https://www.nist.gov/ai-mirror"])
+        store.close()
+
+    def test_index_follows_latest_body(self):
+        """Test that a changed page points to its new body and keeps the old one readable"""
+        store = ContentStore(self.root)
+        old = store.put("https://nist.gov/ai", PAGE)
+        new = store.put("https://nist.gov/ai", PAGE + b"<p>updated</p>")
+        self.assertEqual(store.lookup("https://nist.gov/ai").digest, new)
+        self.assertEqual(store.get(old), PAGE)
+        store.close()
+
+        reopened = ContentStore(self.root)
+        self.assertTrue(reopened.has(new))
+        self.assertEqual(reopened.get_url("https://nist.gov/ai"), PAGE + b"<p>updated</p>")
+        reopened.close()
+
+    @unittest.skipIf(ZSTD_AVAILABLE, "zstandard is installed")
+    def test_zstd_falls_back_to_gzip(self):
+        """Test that zstd compression falls back to gzip without the zstandard package"""
+        self.assertEqual(ContentStore(self.root, compression='zstd').compression, 'gzip')
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ConfigurationError):
+            ContentStore(self.root, compression='bz2')
+
+    def test_scraper_stores_read_bodies(self):
+        """Test that the scraper stores bodies it read under the normalized URL, and skips others"""
+        scraper = BaseScraper(ScraperConfig(CONTENT_STORE_PATH=self.root))
+        scraper.store_body("https://NIST.gov/ai", Mock(skipped=None, status_code=200, content=PAGE,
+                                                       content_type='text/html'))
+        scraper.store_body("https://nist.gov/video", Mock(skipped="content type video/mp4", status_code=200))
+        self.assertEqual([page.url for page in scraper.content_store.pages()],
+                         [scraper.url_processor.normalize_url("https://NIST.gov/ai")])
+        scraper.content_store.close()
+
+if __name__ == '__main__':
+    unittest.main()
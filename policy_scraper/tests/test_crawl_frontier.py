@@ -0,0 +1,124 @@
+"""
+Tests for the priority crawl frontier
+"""
+import unittest
+from unittest.mock import patch
+import os
+from policy_scraper.utils.crawl_frontier import CrawlFrontier, score_page
+from policy_scraper.processors.domain_matcher import TrustedDomainMatcher, TRUST_NONE, TRUST_BROAD, TRUST_EXPLICIT
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+
+class TestCrawlFrontier(unittest.TestCase):
+    def test_pops_highest_score_first(self):
+        """Test that pages come out in descending score order"""
+        frontier = CrawlFrontier()
+        frontier.push("https://a.gov/low", 0, 1.0)
+        frontier.push("https://b.gov/high", 0, 5.0)
+        frontier.push("https://c.gov/mid", 0, 3.0)
+        self.assertEqual([frontier.pop()[0] for _ in range(3)],
+                         ["https://b.gov/high", "https://c.gov/mid", "https://a.gov/low"])
+        self.assertIsNone(frontier.pop())
+
+    def test_dedup_before_enqueue(self):
+        """Test that a URL is enqueued once, including normalized variants and seen pages"""
+        frontier = CrawlFrontier(normalize=lambda url: url.rstrip('/').lower())
+        frontier.mark_seen(["https://nist.gov/done"])
+        self.assertTrue(frontier.push("https://nist.gov/ai", 0, 1.0))
+        self.assertFalse(frontier.push("https://NIST.gov/AI/", 1, 9.0))
+        self.assertFalse(frontier.push("https://nist.gov/done", 0, 1.0))
+        self.assertTrue(frontier.seen("https://nist.gov/ai/"))
+        self.assertEqual(len(frontier), 1)
+
+    def test_max_depth(self):
+        """Test that pages deeper than max_depth are refused"""
+        frontier = CrawlFrontier(max_depth=1)
+        self.assertTrue(frontier.push("https://nist.gov/1", 1, 1.0))
+        self.assertFalse(frontier.push("https://nist.gov/2", 2, 1.0))
+
+    def test_domain_budget(self):
+        """Test that no more than domain_budget pages are popped per domain"""
+        frontier = CrawlFrontier(domain_budget=2)
+        for i in range(5):
+            frontier.push(f"https://nist.gov/{i}", 0, 10.0 - i)
+        frontier.push("https://europa.eu/ai", 0, 1.0)
+        popped = []
+        while True:
+            entry = frontier.pop()
+            if entry is None:
+                break
+            popped.append(entry[0])
+        self.assertEqual(popped, ["https://nist.gov/0", "https://nist.gov/1", "https://europa.eu/ai"])
+        # A spent domain takes no new pages
+        self.assertFalse(frontier.push("https://nist.gov/new", 0, 1.0))
+
+    def test_max_pages(self):
+        """Test that the crawl stops after max_pages pages"""
+        frontier = CrawlFrontier(max_pages=3)
+        for i in range(10):
+            frontier.push(f"https://site{i}.gov/", 0, 1.0)
+        self.assertEqual(sum(1 for _ in iter(frontier.pop, None)), 3)
+        self.assertEqual(frontier.pages_popped, 3)
+
+    def test_score_page(self):
+        """Test that relevance and trust raise the score and depth lowers it"""
+        self.assertGreater(score_page(3, 0, 0), score_page(1, 0, 0))
+        self.assertGreater(score_page(1, 2, 0), score_page(1, 1, 0))
+        self.assertGreater(score_page(1, 1, 0), score_page(1, 1, 1))
+
+    def test_trust_level(self):
+        """Test that explicit domains outrank suffix and label matches"""
+        matcher = TrustedDomainMatcher({'nist.gov', 'gov', 'stanford'})
+        self.assertEqual(matcher.trust_level("https://www.nist.gov/ai"), TRUST_EXPLICIT)
+        self.assertEqual(matcher.trust_level("https://www.fda.gov/ai"), TRUST_BROAD)
+        self.assertEqual(matcher.trust_level("https://hai.stanford.edu"), TRUST_BROAD)
+        self.assertEqual(matcher.trust_level("https://example.com"), TRUST_NONE)
+
+class TestScrapeDeep(unittest.TestCase):
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+
+    def test_follows_links_to_max_depth(self):
+        """Test that links found on pages are crawled one level deeper, up to the maximum depth"""
+        graph = {
+            "https://www.whitehouse.gov/ostp": [("https://www.nist.gov/ai-framework", "AI risk framework")],
+            "https://www.nist.gov/ai-framework": [("https://www.fda.gov/ai-guidance", "AI guidance")],
+            "https://www.fda.gov/ai-guidance": [("https://www.europa.eu/too-deep", "AI act")],
+        }
+        fetched = []
+
+        def extract_page(url):
+            fetched.append(url)
+            return graph.get(url, [])
+
+        scraper = AIPolicyScraper(config=AIScraperConfig(CRAWL_ENGINE='frontier', CRAWL_MAX_DEPTH=2, MAX_WORKERS=2))
+        with patch.object(scraper, 'discover_urls', return_value=["https://www.whitehouse.gov/ostp"]), \
+             patch.object(scraper, '_extract_page', side_effect=extract_page):
+            scraper.scrape_deep()
+        self.assertEqual(fetched, ["https://www.whitehouse.gov/ostp", "https://www.nist.gov/ai-framework",
+                                   "https://www.fda.gov/ai-guidance"])
+
+    def test_relevant_trusted_pages_first(self):
+        """Test that with a page limit the most relevant trusted pages are fetched"""
+        seeds = ["https://example.com/blog", "https://www.nist.gov/ai-policy-regulation"]
+        fetched = []
+
+        def extract_page(url):
+            fetched.append(url)
+            return []
+
+        scraper = AIPolicyScraper(config=AIScraperConfig(CRAWL_MAX_PAGES=1, MAX_WORKERS=1))
+        with patch.object(scraper, 'discover_urls', return_value=seeds), \
+             patch.object(scraper, '_extract_page', side_effect=extract_page):
+            scraper.scrape_deep()
+        self.assertEqual(fetched, ["https://www.nist.gov/ai-policy-regulation"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Tests for the run deadline
+"""
+import unittest
+from unittest.mock import Mock, patch
+import os
+import time
+from policy_scraper.utils.deadline import Deadline, MIN_REQUEST_TIMEOUT
+from policy_scraper.utils.http_client import HTTPClient
+from policy_scraper.utils.crawl_frontier import CrawlFrontier
+from policy_scraper.utils.host_scheduler import HostScheduler
+from policy_scraper.processors.url_processor import URLProcessor
+from policy_scraper.exceptions.scraper_exceptions import DeadlineExceeded
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+class TestDeadline(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_unlimited(self):
+        """Test that a deadline without a budget never expires or trims timeouts"""
+        deadline = Deadline()
+        self.assertIsNone(deadline.remaining())
+        self.assertFalse(deadline.expired())
+        self.assertEqual(deadline.fraction_remaining(), 1.0)
+        self.assertEqual(deadline.timeout(10), 10)
+
+    def test_budget_runs_down(self):
+        """Test remaining time, fraction and expiry as the clock advances"""
+        deadline = Deadline(60, clock=self.clock)
+        self.clock.now += 45
+        self.assertEqual(deadline.remaining(), 15)
+        self.assertEqual(deadline.fraction_remaining(), 0.25)
+        self.assertFalse(deadline.expired())
+        self.clock.now += 20
+        self.assertTrue(deadline.expired())
+        self.assertEqual(deadline.remaining(), 0)
+        with self.assertRaises(DeadlineExceeded):
+            deadline.check('crawl')
+
+    def test_timeouts_trimmed(self):
+        """Test that request timeouts never outlast the budget"""
+        deadline = Deadline(60, clock=self.clock)
+        self.assertEqual(deadline.timeout(10), 10)
+        self.clock.now += 57
+        self.assertEqual(deadline.timeout(10), 3)
+        self.clock.now += 2.9
+        self.assertEqual(deadline.timeout(10), MIN_REQUEST_TIMEOUT)
+        self.clock.now += 1
+        with self.assertRaises(DeadlineExceeded):
+            deadline.timeout(10)
+
+    def test_http_client_trims_timeouts(self):
+        """Test that the shared client applies the deadline to every request"""
+        client = HTTPClient(timeout=10)
+        client.deadline = Deadline(60, clock=self.clock)
+        self.clock.now += 58
+        with patch.object(client.session, 'get') as mock_get:
+            client.get("https://nist.gov")
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], 2)
+        self.clock.now += 5
+        with self.assertRaises(DeadlineExceeded):
+            client.get("https://nist.gov")
+
+    def test_budget_cutoff_is_not_a_verdict(self):
+        """Test that link checks and robots.txt lookups cut off by the budget raise instead of failing"""
+        session = Mock()
+        session.head.side_effect = DeadlineExceeded("spent")
+        session.get.side_effect = DeadlineExceeded("spent")
+        with self.assertRaises(DeadlineExceeded):
+            URLProcessor.check_urls(["https://www.nist.gov/ai"], {}, session=session)
+        scheduler = HostScheduler(session)
+        with self.assertRaises(DeadlineExceeded):
+            scheduler.can_fetch("https://www.nist.gov/ai")
+        # Nothing was cached, so the next lookup asks again
+        session.get.side_effect = None
+        session.get.return_value = Mock(status_code=200, text="User-agent: *\nDisallow: /ai")
+        self.assertFalse(scheduler.can_fetch("https://www.nist.gov/ai"))
+
+    def test_host_spacing_bounded_by_deadline(self):
+        """Test that a Crawl-delay longer than the time left raises instead of sleeping"""
+        session = Mock()
+        session.get.return_value = Mock(status_code=200, text="User-agent: *\nCrawl-delay: 60")
+        scheduler = HostScheduler(session, max_concurrency=1, deadline=Deadline(5))
+        with scheduler.slot("https://www.nist.gov/a"):
+            pass
+        started = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            with scheduler.slot("https://www.nist.gov/b"):
+                self.fail("slot should not be entered")
+        self.assertLess(time.monotonic() - started, 1)
+        # The host's only slot was released
+        self.assertTrue(scheduler._state("www.nist.gov").slots.acquire(blocking=False))
+
+    def test_slot_wait_bounded_by_deadline(self):
+        """Test that waiting for a busy host's slot stops at the deadline"""
+        scheduler = HostScheduler(Mock(), max_concurrency=1, respect_robots=False, deadline=Deadline(0.1))
+        with scheduler.slot("https://www.nist.gov/a"):
+            with self.assertRaises(DeadlineExceeded):
+                with scheduler.slot("https://www.nist.gov/b"):
+                    pass
+
+    def test_frontier_min_score(self):
+        """Test that pages below the score floor are held back"""
+        frontier = CrawlFrontier()
+        frontier.push("https://a.gov/", 0, 4.0)
+        frontier.push("https://b.gov/", 0, 1.0)
+        self.assertEqual(frontier.max_score, 4.0)
+        self.assertEqual(frontier.pop(min_score=2.0), ("https://a.gov/", 0))
+        self.assertIsNone(frontier.pop(min_score=2.0))
+        self.assertEqual(frontier.pop(), ("https://b.gov/", 0))
+
+class TestCrawlDeadline(unittest.TestCase):
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+
+    def test_threading_stops_at_deadline(self):
+        """Test that a threaded crawl stops when the budget runs out and keeps its partial results"""
+        urls = [f"https://site{i}.gov/page" for i in range(40)]
+
+        def fetch_page(url):
+            time.sleep(0.05)
+            return Mock(), None
+
+        def parse_page(url, page):
+            return [(url, f"Policy number {urls.index(url) * 7919}")]
+
+        scraper = AIPolicyScraper(config=AIScraperConfig(MAX_WORKERS=2, TIME_BUDGET=0.3, SEARCH_QUERIES=['ai policy']))
+        started = time.monotonic()
+        with patch.object(scraper, '_discover_query', return_value=urls), \
+             patch.object(scraper, '_fetch_page', side_effect=fetch_page), \
+             patch.object(scraper, '_parse_page', side_effect=parse_page), \
+             patch.object(scraper, '_validate_links', side_effect=lambda links: links):
+            scraper.scrape_with_threading()
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertGreater(len(scraper.results), 0)
+        self.assertLess(len(scraper.results), len(urls))
+
+    def test_deep_crawl_favors_best_pages_late(self):
+        """Test that with little budget left only the best-scoring pages are fetched"""
+        clock = FakeClock()
+        scraper = AIPolicyScraper(config=AIScraperConfig(MAX_WORKERS=1))
+        scraper.deadline = Deadline(100, clock=clock)
+        clock.now += 90
+        seeds = ["https://example.com/blog", "https://www.nist.gov/ai-policy-regulation"]
+        fetched = []
+
+        def extract_page(url):
+            fetched.append(url)
+            return []
+
+        with patch.object(scraper, 'discover_urls', return_value=seeds), \
+             patch.object(scraper, '_extract_page', side_effect=extract_page):
+            scraper.scrape_deep()
+        self.assertEqual(fetched, ["https://www.nist.gov/ai-policy-regulation"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests for the near-duplicate indexes
+"""
+import unittest
+from unittest.mock import patch
+import os
+from policy_scraper.processors.dedup_index import TitleSimilarityIndex, URLSimilarityIndex
+from policy_scraper.scrapers.base import BaseScraper
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+
+class TestTitleSimilarityIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TitleSimilarityIndex(threshold=0.85)
+        self.index.add("Executive Order on Safe, Secure, and Trustworthy AI")
+        self.index.add("NIST AI Risk Management Framework")
+
+    def test_similar_title_found(self):
+        """Test that a near-identical title is detected"""
+        self.assertTrue(self.index.has_similar("Executive Order on Safe, Secure and Trustworthy AI"))
+        self.assertTrue(self.index.has_similar("nist ai risk management framework"))
+
+    def test_dissimilar_title_not_found(self):
+        """Test that unrelated titles are not reported"""
+        self.assertFalse(self.index.has_similar("EU Artificial Intelligence Act"))
+
+    def test_candidates_are_a_shortlist(self):
+        """Test that only bucket candidates are returned for comparison"""
+        for i in range(200):
+            self.index.add(f"Unrelated agricultural subsidy notice number {i * 7919}")
+        candidates = self.index.candidates("NIST AI Risk Management Framework 1.0")
+        self.assertIn(1, candidates)
+        self.assertLess(len(candidates), len(self.index))
+
+    def test_empty_index(self):
+        """Test lookups against an empty index"""
+        self.assertFalse(TitleSimilarityIndex().has_similar("Anything"))
+
+class TestURLSimilarityIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = URLSimilarityIndex(threshold=0.9)
+        self.index.add("https://www.nist.gov/itl/ai-risk-management-framework")
+
+    def test_similar_url_found(self):
+        """Test that variants of an indexed URL on the same site and path are detected"""
+        self.assertTrue(self.index.has_similar("http://nist.gov/itl/ai-risk-management-framework"))
+        self.assertTrue(self.index.has_similar("https://www.nist.gov/itl/ai-risk-management-frameworks"))
+
+    def test_other_paths_not_compared(self):
+        """Test that similar slugs under another host or parent path are not duplicates"""
+        self.assertFalse(self.index.has_similar("https://www.nist.gov/news/ai-risk-management-framework"))
+        self.assertFalse(self.index.has_similar("https://www.fda.gov/itl/ai-risk-management-framework"))
+        self.assertFalse(self.index.has_similar("https://www.nist.gov/itl/privacy-framework"))
+
+    def test_candidates_stay_small(self):
+        """Test that a lookup only sees siblings of compatible length as the index grows"""
+        for i in range(2000):
+            self.index.add(f"https://site{i % 50}.gov/section{i % 7}/page-{i}")
+        self.index.add("https://www.nist.gov/itl/ai")
+        candidates = self.index.candidates("https://www.nist.gov/itl/ai-risk-management-framework-v2")
+        self.assertEqual(candidates, ["nist.gov/itl/ai-risk-management-framework"])
+
+class TestAIPolicyScraperURLDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+
+    def test_visited_urls_are_indexed(self):
+        """Test that near-duplicates of visited URLs are detected and siblings are not"""
+        scraper = AIPolicyScraper()
+        scraper.visited_urls.add("https://www.whitehouse.gov/ostp/ai-bill-of-rights")
+        scraper.add_result("https://www.nist.gov/itl/ai-rmf", "NIST AI Risk Management Framework", "https://nist.gov")
+        self.assertTrue(scraper.is_duplicate("https://www.whitehouse.gov/ostp/ai-bill-of-rights/", "Blueprint"))
+        self.assertTrue(scraper.is_duplicate("https://www.nist.gov/itl/ai-rmf1", "RMF playbook"))
+        self.assertFalse(scraper.is_duplicate("https://www.whitehouse.gov/ostp/news-updates", "OSTP news"))
+
+class TestBaseScraperDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.scraper = BaseScraper()
+
+    def test_add_result_rejects_similar_title(self):
+        """Test that add_result skips titles similar to an existing result"""
+        self.scraper.add_result("https://nist.gov/rmf", "NIST AI Risk Management Framework", "https://nist.gov")
+        self.scraper.add_result("https://nist.gov/rmf-2", "NIST AI Risk Management Framework.", "https://nist.gov")
+        self.scraper.add_result("https://europa.eu/ai-act", "EU Artificial Intelligence Act", "https://europa.eu")
+        self.assertEqual([r['url'] for r in self.scraper.results],
+                         ["https://nist.gov/rmf", "https://europa.eu/ai-act"])
+
+    def test_replaced_results_are_reindexed(self):
+        """Test that assigning results directly keeps duplicate detection in sync"""
+        self.scraper.results = [{
+            "url": "https://nist.gov/rmf",
+            "normalized_url": "https://nist.gov/rmf",
+            "title": "NIST AI Risk Management Framework"
+        }]
+        self.assertTrue(self.scraper.is_duplicate("https://other.gov/x", "NIST AI Risk Management Framework!"))
+        self.assertTrue(self.scraper.is_duplicate("https://nist.gov/rmf", "Another title"))
+        self.assertFalse(self.scraper.is_duplicate("https://other.gov/y", "EU Artificial Intelligence Act"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Tests for the persistent dedup store
+"""
+import unittest
+from unittest.mock import Mock, patch
+import os
+import tempfile
+from policy_scraper.utils.dedup_store import DedupStore, KIND_URL, KIND_HASH
+from policy_scraper.utils.config import ScraperConfig, AIScraperConfig
+from policy_scraper.scrapers.base import BaseScraper
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+
+class TestDedupStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'dedup.sqlite3')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_keys_persist_across_instances(self):
+        """Test that flushed keys are visible to a new store on the same file"""
+        store = DedupStore(self.path)
+        store.add(KIND_URL, "https://nist.gov/ai")
+        self.assertTrue(store.contains(KIND_URL, "https://nist.gov/ai"))
+        self.assertFalse(store.contains(KIND_HASH, "https://nist.gov/ai"))
+        store.close()
+
+        reopened = DedupStore(self.path)
+        self.assertTrue(reopened.contains(KIND_URL, "https://nist.gov/ai"))
+        self.assertEqual(reopened.keys(KIND_URL), ["https://nist.gov/ai"])
+        reopened.close()
+
+    def test_writes_are_batched(self):
+        """Test that keys are buffered until the batch size is reached"""
+        store = DedupStore(self.path, batch_size=3)
+        store.add_many(KIND_URL, ["a", "b"])
+        other = DedupStore(self.path)
+        self.assertFalse(other.contains(KIND_URL, "a"))
+        store.add(KIND_URL, "c")
+        self.assertTrue(other.contains(KIND_URL, "a"))
+        store.close()
+        other.close()
+
+    def test_store_is_opened_lazily(self):
+        """Test that no file is created until the store is used"""
+        DedupStore(self.path)
+        self.assertFalse(os.path.exists(self.path))
+
+class TestBaseScraperDedupStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config = ScraperConfig(DEDUP_STORE_PATH=os.path.join(self.tmpdir.name, 'dedup.sqlite3'))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_repeat_run_skips_known_work(self):
+        """Test that a second scraper skips results saved by the first"""
+        first = BaseScraper(self.config)
+        first.add_result("https://nist.gov/ai", "NIST AI Resource Center", "https://nist.gov")
+        first.save_results(os.path.join(self.tmpdir.name, 'results.json'))
+        first.dedup_store.close()
+
+        second = BaseScraper(self.config)
+        self.assertTrue(second.is_duplicate("https://nist.gov/ai", "Some other title"))
+        second.dedup_store.close()
+
+    def test_disabled_by_default(self):
+        """Test that no store is used unless configured"""
+        self.assertIsNone(BaseScraper().dedup_store)
+
+@patch.dict(os.environ, {'GOOGLE_API_KEY': 'key', 'GOOGLE_CSE_ID': 'cx'})
+class TestAIScraperDedupStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.config = AIScraperConfig(DEDUP_STORE_PATH=os.path.join(self.tmpdir.name, 'dedup.sqlite3'),
+                                      SEARCH_QUERIES=['ai policy'])
+        self.results_path = os.path.join(self.tmpdir.name, 'results.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def crawl(self, scraper):
+        with patch.object(scraper, '_discover_query', return_value=["https://www.nist.gov/ai"]), \
+             patch.object(scraper, '_fetch_page', return_value=(Mock(), None)) as mock_fetch, \
+             patch.object(scraper, '_parse_page', return_value=[("https://www.nist.gov/ai/rmf", "AI risk framework")]), \
+             patch.object(scraper, '_validate_links', side_effect=lambda links: links):
+            scraper.scrape_with_threading()
+        return mock_fetch
+
+    def test_repeat_run_skips_known_work(self):
+        """Test that a second AI scraper neither refetches pages nor re-emits results of the first"""
+        first = AIPolicyScraper(config=self.config)
+        self.crawl(first)
+        self.assertEqual(len(first.results), 1)
+        first.save_results(self.results_path)
+        first.dedup_store.close()
+
+        second = AIPolicyScraper(config=self.config)
+        self.assertTrue(second.is_duplicate("https://www.nist.gov/ai/rmf", "Another title"))
+        second.add_result("https://www.nist.gov/ai/rmf", "Another title", "https://www.nist.gov/ai")
+        self.assertEqual(second.results, [])
+        mock_fetch = self.crawl(second)
+        mock_fetch.assert_not_called()
+        second.dedup_store.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Tests for process-pool document text extraction
+"""
+import unittest
+from unittest.mock import Mock, patch
+import io
+import os
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import tempfile
+import time
+import zipfile
+from policy_scraper.processors import document_extractor
+from policy_scraper.processors.document_extractor import (
+    DocumentExtractor, DocumentTimeout, extract_document_text, _extract_in_worker, PYPDF_AVAILABLE
+)
+from policy_scraper.utils.document_cache import DocumentTextCache, content_digest
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+
+DOCX_TYPE = 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+def make_docx(pages):
+    """Build a minimal DOCX whose pages are separated by page breaks"""
+    body = ''
+    for i, paragraphs in enumerate(pages):
+        if i:
+            body += '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+        body += ''.join(f'<w:p><w:r><w:t>{text}</w:t></w:r></w:p>' for text in paragraphs)
+    xml = f'<?xml version="1.0"?><w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>'
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('word/document.xml', xml)
+    return buffer.getvalue()
+
+class TestDocumentExtraction(unittest.TestCase):
+    def test_docx_text(self):
+        """Test that DOCX paragraphs are extracted in order"""
+        data = make_docx([["National AI strategy", "Section one"]])
+        self.assertEqual(extract_document_text(data, 'docx'), "National AI strategy\nSection one")
+
+    def test_docx_page_limit(self):
+        """Test that text after max_pages page breaks is not extracted"""
+        data = make_docx([["Page one"], ["Page two"], ["Page three"]])
+        text = extract_document_text(data, 'docx', max_pages=2)
+        self.assertIn("Page two", text)
+        self.assertNotIn("Page three", text)
+
+    @unittest.skipIf(PYPDF_AVAILABLE, "pypdf is installed")
+    def test_pdf_without_pypdf(self):
+        """Test that PDFs are skipped when pypdf is missing"""
+        self.assertIsNone(DocumentExtractor().extract(b'%PDF-1.7', 'application/pdf'))
+
+    def test_worker_timeout(self):
+        """Test that a slow document fails with a timeout inside the worker"""
+        with patch.object(document_extractor, 'extract_document_text', side_effect=lambda *args: time.sleep(2)):
+            with self.assertRaises(DocumentTimeout):
+                _extract_in_worker(b'', 'docx', 1, 0.1)
+
+class TestDocumentExtractor(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'document_cache.sqlite3')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_extract_many_in_pool(self):
+        """Test that a batch is extracted and a repeated document is parsed once"""
+        first = make_docx([["AI governance framework"]])
+        second = make_docx([["Machine learning guidelines"]])
+        extractor = DocumentExtractor(workers=2)
+        with patch.object(extractor, '_pool', wraps=extractor._pool) as pool:
+            texts = extractor.extract_many([(first, DOCX_TYPE), (second, DOCX_TYPE), (first, DOCX_TYPE)])
+        self.assertEqual(texts, ["AI governance framework", "Machine learning guidelines", "AI governance framework"])
+        self.assertEqual(pool.call_count, 2)
+        extractor.close()
+
+    def test_cached_by_content_hash(self):
+        """Test that a document parsed by an earlier run is answered from the cache"""
+        data = make_docx([["AI risk management"]])
+        extractor = DocumentExtractor(cache=DocumentTextCache(self.path))
+        self.assertEqual(extractor.extract(data, DOCX_TYPE), "AI risk management")
+        extractor.close()
+
+        cache = DocumentTextCache(self.path)
+        self.assertEqual(cache.get(content_digest(data)), "AI risk management")
+        extractor = DocumentExtractor(cache=cache)
+        with patch.object(extractor, '_pool') as pool:
+            self.assertEqual(extractor.extract(data, DOCX_TYPE), "AI risk management")
+        pool.assert_not_called()
+        extractor.close()
+
+    def test_failures_cached_as_empty(self):
+        """Test that a corrupt document gives None and is not parsed again"""
+        extractor = DocumentExtractor()
+        self.assertIsNone(extractor.extract(b'PK\x03\x04 not a zip', DOCX_TYPE))
+        self.assertEqual(extractor.cache.get(content_digest(b'PK\x03\x04 not a zip')), '')
+        extractor.close()
+
+    def test_pool_failures_not_cached(self):
+        """Test that documents lost to a parent-side timeout or a broken pool are retried"""
+        data = make_docx([["AI risk management"]])
+        extractor = DocumentExtractor(timeout=0.1)
+        for error in (concurrent.futures.TimeoutError(), BrokenProcessPool("worker died")):
+            broken = Mock()
+            broken.submit.return_value.result.side_effect = error
+            with patch.object(extractor, '_pool', return_value=broken):
+                self.assertIsNone(extractor.extract(data, DOCX_TYPE))
+            self.assertIsNone(extractor.cache.get(content_digest(data)))
+        self.assertEqual(extractor.extract(data, DOCX_TYPE), "AI risk management")
+        extractor.close()
+
+    def test_workers_are_spawned(self):
+        """Test that the pool does not fork the crawling process"""
+        with patch.object(document_extractor, 'ProcessPoolExecutor') as pool:
+            DocumentExtractor()._pool()
+        self.assertEqual(pool.call_args.kwargs['mp_context'].get_start_method(), 'spawn')
+
+class TestExtractDocuments(unittest.TestCase):
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+
+    def test_routed_documents_become_results(self):
+        """Test that relevant routed documents are added with a title from their text"""
+        scraper = AIPolicyScraper(config=AIScraperConfig())
+        documents = {
+            "https://www.nist.gov/ai-rmf.docx": make_docx([["Artificial intelligence risk management framework"]]),
+            "https://www.fda.gov/menu.docx": make_docx([["Cafeteria lunch menu for the week"]]),
+        }
+        for url in documents:
+            scraper.route_document(url, DOCX_TYPE)
+        with patch.object(scraper, '_fetch_document',
+                          side_effect=lambda url: Mock(content=documents[url], content_type=DOCX_TYPE)):
+            scraper.extract_documents()
+        scraper.document_extractor.close()
+        self.assertEqual([(r['url'], r['title']) for r in scraper.results],
+                         [("https://www.nist.gov/ai-rmf.docx", "Artificial intelligence risk management framework")])
+        self.assertEqual(scraper.documents, {})
+
+if __name__ == '__main__':
+    unittest.main()
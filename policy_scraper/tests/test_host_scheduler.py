@@ -0,0 +1,88 @@
+import unittest
+import threading
+import time
+from unittest.mock import Mock
+from policy_scraper.utils.host_scheduler import HostScheduler, interleave_by_host
+
+ROBOTS_TXT = """User-agent: *
+Disallow: /private/
+Crawl-delay: 2
+"""
+
+class RobotsSession:
+    """Session stand-in that serves a fixed robots.txt and counts fetches"""
+    def __init__(self, status_code=200, text=ROBOTS_TXT):
+        self.status_code = status_code
+        self.text = text
+        self.fetches = 0
+
+    def get(self, url, headers=None, timeout=None):
+        self.fetches += 1
+        return Mock(status_code=self.status_code, text=self.text)
+
+class TestHostScheduler(unittest.TestCase):
+    def test_interleave_by_host(self):
+        """Test that URLs are reordered round-robin across hosts"""
+        urls = [
+            'https://a.gov/1', 'https://a.gov/2', 'https://a.gov/3',
+            'https://b.edu/1', 'https://c.org/1', 'https://b.edu/2'
+        ]
+        self.assertEqual(interleave_by_host(urls), [
+            'https://a.gov/1', 'https://b.edu/1', 'https://c.org/1',
+            'https://a.gov/2', 'https://b.edu/2', 'https://a.gov/3'
+        ])
+
+    def test_robots_disallow_and_cache(self):
+        """Test that robots.txt is honoured and fetched once per host"""
+        session = RobotsSession()
+        scheduler = HostScheduler(session, {'User-Agent': 'TestBot'})
+        self.assertTrue(scheduler.can_fetch('https://a.gov/public/page'))
+        self.assertFalse(scheduler.can_fetch('https://a.gov/private/page'))
+        self.assertEqual(scheduler.delay_for('https://a.gov/public/page'), 2)
+        self.assertEqual(session.fetches, 1)
+
+    def test_robots_status_codes(self):
+        """Test that a missing robots.txt allows everything and a forbidden one blocks"""
+        self.assertTrue(HostScheduler(RobotsSession(404, '')).can_fetch('https://a.gov/x'))
+        self.assertFalse(HostScheduler(RobotsSession(403, '')).can_fetch('https://a.gov/x'))
+
+    def test_robots_disabled(self):
+        """Test that robots.txt is not fetched when disabled"""
+        session = RobotsSession()
+        scheduler = HostScheduler(session, respect_robots=False)
+        self.assertTrue(scheduler.can_fetch('https://a.gov/private/page'))
+        self.assertEqual(session.fetches, 0)
+
+    def test_slot_spacing(self):
+        """Test that request starts on one host are spaced by the minimum delay"""
+        scheduler = HostScheduler(RobotsSession(404, ''), min_delay=0.05)
+        starts = []
+        for _ in range(3):
+            with scheduler.slot('https://a.gov/page'):
+                starts.append(time.monotonic())
+        self.assertGreaterEqual(starts[2] - starts[0], 0.09)
+
+    def test_slot_concurrency(self):
+        """Test that at most max_concurrency requests run on one host"""
+        scheduler = HostScheduler(RobotsSession(404, ''), max_concurrency=2)
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def work():
+            with scheduler.slot('https://a.gov/page'):
+                with lock:
+                    in_flight[0] += 1
+                    in_flight[1] = max(in_flight[1], in_flight[0])
+                time.sleep(0.02)
+                with lock:
+                    in_flight[0] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(in_flight[1], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tests for the HTML parser backends
+"""
+import unittest
+from bs4 import BeautifulSoup
+from policy_scraper.processors.html_parser import PARSER_BACKENDS, LXML_AVAILABLE, get_html_parser
+from policy_scraper.exceptions.scraper_exceptions import ConfigurationError
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>AI Policy</title>
+<script>document.write('<a href="/from-script">x</a>');</script>
+<style>a { color: red; }</style></head>
+<body>
+<!-- <a href="/commented">hidden</a> -->
+<h1>Artificial  Intelligence &amp; Policy</h1>
+<A HREF="/upper">Upper case</A>
+<a class="nav" href="/policy?a=1&amp;b=2"><span>AI</span> governance
+   <b>framework</b></a>
+<a href='/single'>Single &lt;quoted&gt;</a>
+<a href=/unquoted>Unquoted</a>
+<a name="anchor-without-href">No href</a>
+<p>Some <em>emphasised</em> text &copy; 2024</p>
+</body></html>"""
+
+def original_links(markup):
+    soup = BeautifulSoup(markup, 'html.parser')
+    return [(a_tag.get('href'), a_tag.get_text(strip=True)) for a_tag in soup.find_all('a', href=True)]
+
+class TestHTMLParserBackends(unittest.TestCase):
+    def test_backends_match_original_links(self):
+        """Test that every backend extracts the same links as the original BeautifulSoup code"""
+        expected = original_links(PAGE)
+        self.assertEqual(expected[0], ('/upper', 'Upper case'))
+        for name in PARSER_BACKENDS:
+            with self.subTest(backend=name):
+                self.assertEqual(get_html_parser(name).extract_links(PAGE), expected)
+
+    def test_backends_match_original_text(self):
+        """Test that every backend extracts the same text as the original BeautifulSoup code"""
+        expected = BeautifulSoup(PAGE, 'html.parser').get_text(strip=True)
+        for name in PARSER_BACKENDS:
+            with self.subTest(backend=name):
+                self.assertEqual(get_html_parser(name).extract_text(PAGE), expected)
+
+    def test_stream_handles_unclosed_anchor(self):
+        """Test that the tokenizer closes an anchor left open at the end of the document"""
+        links = get_html_parser('stream').extract_links('<p><a href="/a">First<a href="/b">Second')
+        self.assertEqual(links, [('/a', 'First'), ('/b', 'Second')])
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is a configuration error"""
+        with self.assertRaises(ConfigurationError):
+            get_html_parser('html5lib')
+
+    def test_lxml_fallback(self):
+        """Test that the lxml backend falls back when lxml is not installed"""
+        backend = get_html_parser('lxml')
+        self.assertEqual(backend.name, 'lxml' if LXML_AVAILABLE else 'bs4')
+
+if __name__ == '__main__':
+    unittest.main()
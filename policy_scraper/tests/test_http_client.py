@@ -0,0 +1,164 @@
+"""
+Tests for the shared HTTP client
+"""
+import unittest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from policy_scraper.utils.http_client import HTTPClient, sniff_content_type, KIND_HTML, KIND_DOCUMENT, KIND_OTHER
+from policy_scraper.utils.config import ScraperConfig
+from policy_scraper.scrapers.base import BaseScraper
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = self.headers.get('User-Agent', '').encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+HTML = b"<html><body><a href='/a'>AI policy</a></body></html>"
+PDF = b"%PDF-1.7 binary document"
+
+class ContentHandler(BaseHTTPRequestHandler):
+    """Serves bodies of different types and sizes; '/stream' sends no Content-Length"""
+    protocol_version = 'HTTP/1.1'
+    pages = {
+        '/page': ('text/html; charset=utf-8', HTML),
+        '/big': ('text/html', b'x' * 4096),
+        '/report.pdf': ('application/pdf', PDF),
+        '/untyped': (None, PDF),
+        '/video': ('video/mp4', b'\x00' * 4096),
+    }
+
+    def do_GET(self):
+        if self.path == '/stream':
+            self.protocol_version = 'HTTP/1.0'
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html')
+            self.end_headers()
+            for _ in range(64):
+                self.wfile.write(b'y' * 1024)
+            return
+        content_type, body = self.pages[self.path]
+        self.send_response(200)
+        if content_type:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestStreamGet(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ContentHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = HTTPClient()
+
+    def tearDown(self):
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_reads_html_within_cap(self):
+        """Test that an HTML page under the cap is read and decoded"""
+        response = self.client.stream_get(f"{self.base_url}/page", max_bytes=1024)
+        self.assertEqual(response.kind, KIND_HTML)
+        self.assertIsNone(response.skipped)
+        self.assertEqual(response.content, HTML)
+        self.assertIn('AI policy', response.text)
+
+    def test_content_length_over_cap(self):
+        """Test that a declared oversize body is abandoned before reading"""
+        response = self.client.stream_get(f"{self.base_url}/big", max_bytes=1024)
+        self.assertIn('Content-Length', response.skipped)
+        self.assertEqual(response.content, b'')
+
+    def test_streamed_body_over_cap(self):
+        """Test that a body without Content-Length is abandoned once it passes the cap"""
+        response = self.client.stream_get(f"{self.base_url}/stream", max_bytes=8 * 1024)
+        self.assertIn('exceeds', response.skipped)
+        self.assertEqual(response.content, b'')
+
+    def test_non_html_not_read(self):
+        """Test that other content types are never read"""
+        response = self.client.stream_get(f"{self.base_url}/video", max_bytes=1024 * 1024)
+        self.assertEqual(response.kind, KIND_OTHER)
+        self.assertIn('video/mp4', response.skipped)
+
+    def test_documents(self):
+        """Test that documents are read only under their own cap, sniffing untyped bodies"""
+        skipped = self.client.stream_get(f"{self.base_url}/report.pdf", max_bytes=1024)
+        self.assertEqual(skipped.kind, KIND_DOCUMENT)
+        self.assertIsNotNone(skipped.skipped)
+        response = self.client.stream_get(f"{self.base_url}/untyped", max_bytes=1024, document_max_bytes=1024)
+        self.assertEqual(response.content_type, 'application/pdf')
+        self.assertEqual(response.content, PDF)
+
+    def test_sniff_content_type(self):
+        """Test that declared types win and generic ones fall back to the first bytes"""
+        self.assertEqual(sniff_content_type('text/html; charset=utf-8', PDF), 'text/html')
+        self.assertEqual(sniff_content_type('application/octet-stream', PDF), 'application/pdf')
+        self.assertEqual(sniff_content_type(None, b'  <!DOCTYPE html><html>'), 'text/html')
+        self.assertEqual(sniff_content_type(None, b'\x00\x01'), 'application/octet-stream')
+
+    def test_scraper_routes_documents(self):
+        """Test that the scraper routes documents aside instead of parsing them"""
+        scraper = BaseScraper(ScraperConfig())
+        response, cached = scraper.conditional_get(f"{self.base_url}/report.pdf")
+        self.assertIsNone(cached)
+        self.assertEqual(scraper.documents, {f"{self.base_url}/report.pdf": 'application/pdf'})
+
+class TestHTTPClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_connection_reuse(self):
+        """Test that sequential requests reuse one pooled connection"""
+        client = HTTPClient({'User-Agent': 'TestBot'})
+        for i in range(3):
+            response = client.get(f"{self.base_url}/page{i}")
+            self.assertEqual(response.text, 'TestBot')
+        stats = client.stats()
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['connections_opened'], 1)
+        self.assertEqual(stats['hosts']['127.0.0.1']['requests'], 3)
+        client.close()
+
+    def test_errors_counted(self):
+        """Test that failed requests are reported in the stats"""
+        client = HTTPClient(timeout=1)
+        with self.assertRaises(Exception):
+            client.get("http://127.0.0.1:1/unreachable")
+        self.assertEqual(client.stats()['errors'], 1)
+
+    def test_shared_headers_and_pool_size(self):
+        """Test that the client negotiates compression and sizes its host pools"""
+        client = HTTPClient({'User-Agent': 'TestBot'}, pool_connections=8, pool_maxsize=24)
+        self.assertIn('gzip', client.session.headers['Accept-Encoding'])
+        self.assertEqual(client.session.headers['User-Agent'], 'TestBot')
+        self.assertEqual(client.session.get_adapter("https://nist.gov")._pool_maxsize, 24)
+
+    def test_scraper_owns_client(self):
+        """Test that the scraper hands its client to the host scheduler"""
+        scraper = BaseScraper(ScraperConfig(HTTP_POOL_MAXSIZE=12))
+        self.assertIs(scraper.host_scheduler.session, scraper.http)
+        self.assertEqual(scraper.http.pool_maxsize, 12)
+
+if __name__ == '__main__':
+    unittest.main()
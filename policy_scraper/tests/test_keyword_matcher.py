@@ -0,0 +1,47 @@
+"""
+Tests for the keyword matcher
+"""
+import unittest
+from policy_scraper.processors.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from policy_scraper.processors.content_processor import ContentProcessor
+
+class TestKeywordMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = KeywordMatcher(['ai policy', 'regulation', 'white paper', 'act'])
+
+    def test_match_returns_keywords(self):
+        """Test that all matched keywords are reported in list order"""
+        self.assertEqual(self.matcher.match("New Regulation on AI: a policy white paper"),
+                         ['ai policy', 'regulation', 'white paper'])
+        self.assertEqual(self.matcher.match("Cooking recipes"), [])
+
+    def test_overlapping_terms(self):
+        """Test that terms inside longer matches are still found"""
+        matcher = KeywordMatcher(['regulation', 'regulations', 'ion'])
+        self.assertEqual(matcher.match("regulations"), ['regulation', 'regulations', 'ion'])
+
+    def test_words_may_match_in_url(self):
+        """Test that multi-word keywords match when all words appear in the URL"""
+        self.assertEqual(self.matcher.match("Read more", "https://example.gov/ai-policy"), ['ai policy'])
+        # Words split between text and URL do not count
+        self.assertEqual(self.matcher.match("AI update", "https://example.gov/policy"), [])
+
+    def test_phrase_mode(self):
+        """Test whole-phrase matching used by the Congress scraper"""
+        matcher = KeywordMatcher(['machine learning'], match_all_words=False)
+        self.assertTrue(matcher.matches_any("Machine Learning Act"))
+        self.assertFalse(matcher.matches_any("learning about machine tools"))
+
+    def test_batch(self):
+        """Test matching a batch of (text, url) pairs"""
+        pairs = [("Regulation", ""), ("Home", "https://x.gov/home"), ("", "https://x.gov/white-paper")]
+        self.assertEqual(self.matcher.match_batch(pairs), [['regulation'], [], ['white paper']])
+        self.assertEqual(ContentProcessor.relevant_batch(pairs, ['regulation', 'white paper']), [True, False, True])
+
+    def test_compiled_once(self):
+        """Test that matchers are cached per keyword list"""
+        self.assertIs(get_keyword_matcher(['a', 'b']), get_keyword_matcher(['a', 'b']))
+        self.assertFalse(KeywordMatcher([]).matches_any("anything"))
+
+if __name__ == '__main__':
+    unittest.main()
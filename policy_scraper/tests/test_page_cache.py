@@ -0,0 +1,143 @@
+"""
+Tests for the conditional-GET page cache
+"""
+import unittest
+from unittest.mock import Mock, patch
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from policy_scraper.utils.page_cache import PageCache
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+
+INDEX_PAGE = ('<html><body><h1>AI policy index</h1>'
+              '<a href="/framework">AI governance framework</a>'
+              '<a href="/recipes">Cooking recipes</a></body></html>')
+ETAG = '"index-v1"'
+
+class ConditionalHandler(BaseHTTPRequestHandler):
+    """Serves the index page with an ETag and answers 304 when it matches"""
+    protocol_version = 'HTTP/1.1'
+    statuses = []
+
+    def _respond(self, status, body=b'', headers=None):
+        self.statuses.append((self.command, self.path, status))
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/robots.txt':
+            self._respond(404)
+        elif self.headers.get('If-None-Match') == ETAG:
+            self._respond(304, headers={'ETag': ETAG})
+        else:
+            self._respond(200, INDEX_PAGE.encode(), {'ETag': ETAG, 'Content-Type': 'text/html'})
+
+    def do_HEAD(self):
+        self._respond(200, headers={'Content-Type': 'text/html'})
+
+    def log_message(self, format, *args):
+        pass
+
+class TestPageCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'page_cache.sqlite3')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_store_and_conditional_headers(self):
+        """Test that validators, body and links round-trip through the cache"""
+        cache = PageCache(self.path)
+        response = Mock(text='<html>page</html>', headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})
+        self.assertTrue(cache.put('https://nist.gov/ai', response, [('https://nist.gov/a', 'A')]))
+        cache.close()
+
+        cached = PageCache(self.path).get('https://nist.gov/ai')
+        self.assertEqual(cached.body, '<html>page</html>')
+        self.assertEqual(cached.links, [('https://nist.gov/a', 'A')])
+        self.assertEqual(cached.conditional_headers(), {
+            'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        })
+
+    def test_body_only_update_keeps_links(self):
+        """Test that saving a body with the same validators keeps the stored links"""
+        cache = PageCache(self.path)
+        response = Mock(text='<html>page</html>', headers={'ETag': '"v1"'})
+        cache.put('https://nist.gov/ai', response, [('https://nist.gov/a', 'A')])
+        cache.put('https://nist.gov/ai', response)
+        self.assertEqual(cache.get('https://nist.gov/ai').links, [('https://nist.gov/a', 'A')])
+        cache.put('https://nist.gov/ai', Mock(text='<html>new</html>', headers={'ETag': '"v2"'}))
+        self.assertIsNone(cache.get('https://nist.gov/ai').links)
+
+    def test_skips_responses_without_validators(self):
+        """Test that pages that cannot be revalidated are not stored"""
+        cache = PageCache(self.path)
+        self.assertFalse(cache.put('https://nist.gov/ai', Mock(text='x', headers={})))
+        self.assertIsNone(cache.get('https://nist.gov/ai'))
+
+class TestConditionalFetch(unittest.TestCase):
+    def setUp(self):
+        ConditionalHandler.statuses = []
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), ConditionalHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def make_scraper(self):
+        return AIPolicyScraper(config=AIScraperConfig(
+            TRUSTED_DOMAINS={'127.0.0.1'},
+            PAGE_CACHE_PATH=os.path.join(self.tmpdir.name, 'page_cache.sqlite3')
+        ))
+
+    def test_unchanged_page_replays_links(self):
+        """Test that a 304 replays the stored links without parsing the page"""
+        first = self.make_scraper()
+        first.extract_links(f"{self.base_url}/index")
+        self.assertEqual([r['url'] for r in first.results], [f"{self.base_url}/framework"])
+
+        second = self.make_scraper()
+        with patch.object(second.html_parser, 'extract_links') as mock_parse:
+            second.extract_links(f"{self.base_url}/index")
+        mock_parse.assert_not_called()
+        self.assertEqual([r['url'] for r in second.results], [f"{self.base_url}/framework"])
+        index_statuses = [status for method, path, status in ConditionalHandler.statuses
+                          if method == 'GET' and path == '/index']
+        self.assertEqual(index_statuses, [200, 304])
+
+    def test_crawl_closes_page_cache(self):
+        """Test that the page cache is closed with the other stores when a crawl finishes"""
+        scraper = self.make_scraper()
+        with patch.object(scraper, '_discover_query', return_value=[f"{self.base_url}/index"]):
+            scraper.scrape_with_threading()
+        self.assertEqual([r['url'] for r in scraper.results], [f"{self.base_url}/framework"])
+        self.assertIsNone(scraper.page_cache._conn)
+        self.assertIsNotNone(scraper.page_cache.get(f"{self.base_url}/index"))
+
+    def test_fetch_policy_content_uses_cached_body(self):
+        """Test that page text comes from the cached body on a 304"""
+        self.make_scraper().fetch_policy_content(f"{self.base_url}/index")
+        content = self.make_scraper().fetch_policy_content(f"{self.base_url}/index")
+        self.assertIn('AI policy index', content)
+        self.assertEqual(ConditionalHandler.statuses[-1], ('GET', '/index', 304))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Tests for the staged crawl pipeline
+"""
+import unittest
+from unittest.mock import Mock, patch
+import os
+import threading
+import time
+from policy_scraper.scrapers.pipeline import Stage, StagedPipeline
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+from policy_scraper.exceptions.scraper_exceptions import APIError
+
+class TestStagedPipeline(unittest.TestCase):
+    def test_items_flow_through_every_stage(self):
+        """Test that each stage's outputs feed the next and fan-out is supported"""
+        stored = []
+        lock = threading.Lock()
+
+        def store(item):
+            with lock:
+                stored.append(item)
+
+        pipeline = StagedPipeline([
+            Stage('split', lambda n: [n * 10 + i for i in range(3)], workers=2),
+            Stage('square', lambda n: [n * n], workers=3),
+            Stage('store', store),
+        ])
+        stats = pipeline.run(range(5))
+        self.assertEqual(sorted(stored), sorted((n * 10 + i) ** 2 for n in range(5) for i in range(3)))
+        self.assertEqual(stats['split'].processed, 5)
+        self.assertEqual(stats['store'].processed, 15)
+
+    def test_backpressure_bounds_items_in_flight(self):
+        """Test that a slow stage blocks its producers instead of letting work pile up"""
+        produced = []
+        stored = []
+        lock = threading.Lock()
+
+        def produce(n):
+            with lock:
+                produced.append(n)
+            return [n]
+
+        def store(n):
+            time.sleep(0.005)
+            with lock:
+                stored.append(n)
+                # Items produced but not yet stored: one being stored plus the two queues
+                self.assertLessEqual(len(produced) - len(stored), 2 + 2 + 1)
+
+        pipeline = StagedPipeline([
+            Stage('produce', produce, workers=1, queue_size=2),
+            Stage('store', store, workers=1, queue_size=2),
+        ])
+        stats = pipeline.run(range(50))
+        self.assertEqual(len(stored), 50)
+        self.assertLessEqual(stats['store'].max_queued, 2)
+
+    def test_errors_drop_the_item(self):
+        """Test that a failing item is counted and the rest still complete"""
+        stored = []
+
+        def check(n):
+            if n == 3:
+                raise ValueError("bad item")
+            return [n]
+
+        pipeline = StagedPipeline([Stage('check', check), Stage('store', stored.append)])
+        stats = pipeline.run(range(6))
+        self.assertEqual(sorted(stored), [0, 1, 2, 4, 5])
+        self.assertEqual(stats['check'].errors, 1)
+
+    def test_stop_drops_queued_items(self):
+        """Test that stopping finishes quickly without processing the backlog"""
+        processed = []
+
+        def slow(n):
+            time.sleep(0.01)
+            processed.append(n)
+
+        pipeline = StagedPipeline([Stage('slow', slow, workers=2, queue_size=4)])
+        threading.Timer(0.05, pipeline.stop).start()
+        pipeline.run(range(1000))
+        self.assertTrue(pipeline.stopped)
+        self.assertLess(len(processed), 100)
+
+    def test_needs_a_stage(self):
+        with self.assertRaises(ValueError):
+            StagedPipeline([])
+
+class TestThreadedCrawl(unittest.TestCase):
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+
+    def test_failed_pages_are_still_marked_extracted(self):
+        """Test that a page whose fetch fails still completes"""
+        config = AIScraperConfig(SEARCH_QUERIES=['ai policy'], PIPELINE_QUEUE_SIZE=1)
+        scraper = AIPolicyScraper(config=config)
+        urls = ["https://www.nist.gov/ai", "https://www.nist.gov/broken"]
+
+        def fetch_page(url):
+            if url.endswith('broken'):
+                raise RuntimeError("connection reset")
+            return Mock(), None
+
+        marked = []
+        with patch.object(scraper, '_discover_query', return_value=urls), \
+             patch.object(scraper, '_fetch_page', side_effect=fetch_page), \
+             patch.object(scraper, '_parse_page', return_value=[("https://www.nist.gov/ai/rmf", "AI risk framework")]), \
+             patch.object(scraper, '_validate_links', side_effect=lambda links: links), \
+             patch.object(scraper, '_mark_extracted', side_effect=lambda url, _: marked.append(url)):
+            scraper.scrape_with_threading()
+        self.assertEqual(sorted(marked), sorted(urls))
+        self.assertEqual([r['url'] for r in scraper.results], ["https://www.nist.gov/ai/rmf"])
+
+    def test_failed_query_is_raised_after_draining(self):
+        """Test that a failing search query fails the run once the other queries' pages are extracted"""
+        config = AIScraperConfig(SEARCH_QUERIES=['broken query', 'ai policy'], PIPELINE_QUEUE_SIZE=1)
+        scraper = AIPolicyScraper(config=config)
+
+        def discover_query(query, discovered_urls, discovered_lock):
+            if query == 'broken query':
+                raise APIError("quota exceeded")
+            return ["https://www.nist.gov/ai"]
+
+        marked = []
+        with patch.object(scraper, '_discover_query', side_effect=discover_query), \
+             patch.object(scraper, '_mark_query_done') as mock_done, \
+             patch.object(scraper, '_fetch_page', return_value=(Mock(), None)), \
+             patch.object(scraper, '_parse_page', return_value=[]), \
+             patch.object(scraper, '_validate_links', side_effect=lambda links: links), \
+             patch.object(scraper, '_mark_extracted', side_effect=lambda url, _: marked.append(url)):
+            with self.assertRaises(APIError):
+                scraper.scrape_with_threading()
+        self.assertEqual(marked, ["https://www.nist.gov/ai"])
+        self.assertEqual(scraper.pipeline.stats['discover'].errors, 1)
+        # Only the successful query is checkpointed, so a resumed run searches the failed one again
+        mock_done.assert_called_once_with('ai policy', ["https://www.nist.gov/ai"])
+
+if __name__ == '__main__':
+    unittest.main()
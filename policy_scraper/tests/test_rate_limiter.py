@@ -0,0 +1,130 @@
+"""
+Tests for the token-bucket rate limiter
+"""
+import unittest
+from unittest.mock import Mock, patch
+import asyncio
+import os
+import threading
+import time
+from policy_scraper.utils.rate_limiter import TokenBucket, get_rate_limiter, is_rate_limited, retry_after
+from policy_scraper.utils.deadline import Deadline
+from policy_scraper.exceptions.scraper_exceptions import DeadlineExceeded
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+
+class RateLimitError(Exception):
+    """Stand-in for an HTTP error carrying its response"""
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.response = Mock(status_code=status, headers=headers or {})
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        """Test that a full bucket allows a burst and then paces requests"""
+        bucket = TokenBucket(rate=50, capacity=5)
+        self.assertEqual([bucket.reserve() for _ in range(5)], [0.0] * 5)
+        self.assertAlmostEqual(bucket.reserve(), 1 / 50, delta=0.005)
+        self.assertAlmostEqual(bucket.reserve(), 2 / 50, delta=0.005)
+
+    def test_shared_across_threads(self):
+        """Test that concurrent threads together stay within the rate"""
+        bucket = TokenBucket(rate=100, capacity=1)
+        start = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_async_acquire(self):
+        """Test that asyncio tasks share the bucket with threads"""
+        bucket = TokenBucket(rate=100, capacity=1)
+
+        async def acquire_all():
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+
+        start = time.monotonic()
+        asyncio.run(acquire_all())
+        self.assertGreaterEqual(time.monotonic() - start, 0.045)
+
+    def test_penalize_and_recover(self):
+        """Test that a 429 halves the rate, pauses, and successes recover it"""
+        bucket = TokenBucket(rate=10, capacity=1)
+        bucket.reserve()
+        bucket.penalize(retry_after=0.5)
+        self.assertEqual(bucket.rate, 5)
+        self.assertGreaterEqual(bucket.reserve(), 0.5)
+        for _ in range(10):
+            bucket.record_success()
+        self.assertEqual(bucket.rate, 10)
+
+    def test_registry(self):
+        """Test that limiters are shared by key and conflicting settings are reported"""
+        limiter = get_rate_limiter('test-api', 1.0)
+        with self.assertLogs('policy_scraper.utils.rate_limiter', level='WARNING'):
+            self.assertIs(get_rate_limiter('test-api', 2.0), limiter)
+        self.assertIsNot(get_rate_limiter('test-api', 1.0), get_rate_limiter('other-api', 1.0))
+
+    def test_acquire_respects_deadline(self):
+        """Test that a wait longer than the time left raises instead of sleeping, and keeps the token"""
+        bucket = TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            bucket.acquire(deadline=Deadline(0.2))
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertAlmostEqual(bucket.reserve(), 1.0, delta=0.05)
+
+    def test_error_inspection(self):
+        """Test 429 detection and Retry-After parsing"""
+        self.assertTrue(is_rate_limited(RateLimitError(429)))
+        self.assertFalse(is_rate_limited(RateLimitError(500)))
+        self.assertFalse(is_rate_limited(ValueError("boom")))
+        self.assertEqual(retry_after(RateLimitError(429, {'retry-after': '3'})), 3.0)
+        self.assertIsNone(retry_after(RateLimitError(429)))
+        response = Mock(spec=['status_code', 'headers'], status_code=429, headers={'Retry-After': '2'})
+        error = Exception()
+        error.response = response
+        self.assertTrue(is_rate_limited(error))
+        self.assertEqual(retry_after(error), 2.0)
+
+class TestSearchRateLimit(unittest.TestCase):
+    def setUp(self):
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_discover_retries_on_429(self, mock_search):
+        """Test that a rate-limited query is retried after backing off"""
+        execute = mock_search
+        execute.side_effect = [
+            RateLimitError(429),
+            {'items': [{'link': 'https://www.nist.gov/ai'}]}
+        ]
+        scraper = AIPolicyScraper(config=AIScraperConfig(SEARCH_QUERIES=['ai policy']))
+        scraper.search_limiter = TokenBucket(rate=100, capacity=1)
+        self.assertEqual(scraper.discover_urls(), ['https://www.nist.gov/ai'])
+        self.assertEqual(execute.call_count, 2)
+        # Halved by the 429, then partly recovered by the successful retry
+        self.assertEqual(scraper.search_limiter.rate, 60)
+
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_queries_not_serialized_by_delay(self, mock_search):
+        """Test that a burst of queries runs without the fixed per-query delay"""
+        mock_search.return_value = {'items': []}
+        scraper = AIPolicyScraper()
+        scraper.search_limiter = TokenBucket(rate=1, capacity=len(scraper.config.SEARCH_QUERIES))
+        start = time.monotonic()
+        scraper.discover_urls()
+        self.assertLess(time.monotonic() - start, 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
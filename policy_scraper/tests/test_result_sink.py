@@ -0,0 +1,134 @@
+"""
+Tests for the streaming JSONL result sink
+"""
+import unittest
+from unittest.mock import patch
+import json
+import os
+import tempfile
+from policy_scraper.utils.result_sink import JSONLResultSink, iter_jsonl, read_jsonl_at
+from policy_scraper.utils.config import ScraperConfig
+from policy_scraper.scrapers.base import BaseScraper
+from policy_scraper.merge_policy_updates import PolicyMerger
+
+class TestJSONLResultSink(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'results.jsonl')
+        self.records = [
+            {"url": "https://nist.gov/ai", "title": "NIST AI — Überblick", "timestamp": "2024-03-20T10:00:00"},
+            {"url": "https://europa.eu/ai-act", "title": "AI Act", "timestamp": "2024-03-19T10:00:00"}
+        ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_records_flushed_in_batches(self):
+        """Test that records reach disk once a batch is full"""
+        sink = JSONLResultSink(self.path, batch_size=2)
+        sink.write(self.records[0])
+        self.assertEqual(list(iter_jsonl(self.path)), [])
+        sink.write(self.records[1])
+        self.assertEqual(list(iter_jsonl(self.path)), self.records)
+        sink.close()
+
+    def test_materialize_matches_json_dump(self):
+        """Test that the materialized array is identical to json.dump output"""
+        sink = JSONLResultSink(self.path)
+        for record in self.records:
+            sink.write(record)
+        json_path = os.path.join(self.tmpdir.name, 'results.json')
+        self.assertEqual(sink.materialize(json_path), 2)
+        sink.close()
+        with open(json_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), json.dumps(self.records, indent=2, ensure_ascii=False))
+
+    def test_materialize_empty_stream(self):
+        """Test materializing a stream with no records"""
+        json_path = os.path.join(self.tmpdir.name, 'empty.json')
+        JSONLResultSink(self.path).materialize(json_path)
+        with open(json_path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [])
+
+    def test_new_stream_replaces_previous_run(self):
+        """Test that a run accepting no results does not materialize the previous run's records"""
+        previous = JSONLResultSink(self.path)
+        previous.write(self.records[0])
+        previous.close()
+        json_path = os.path.join(self.tmpdir.name, 'results.json')
+        self.assertEqual(JSONLResultSink(self.path).materialize(json_path), 0)
+        self.assertEqual(list(iter_jsonl(self.path)), [])
+
+        resumed = JSONLResultSink(self.path)
+        resumed.write(self.records[1])
+        resumed.close()
+        resumed = JSONLResultSink(self.path)
+        resumed.resume()
+        self.assertEqual(resumed.materialize(json_path), 1)
+
+    def test_merge_reads_newer_output(self):
+        """Test that the merger reads a stream or a JSON array, whichever was written last"""
+        stream_path = os.path.join(self.tmpdir.name, 'ai_policy_updates.jsonl')
+        json_path = os.path.join(self.tmpdir.name, 'ai_policy_updates.json')
+        sink = JSONLResultSink(stream_path)
+        sink.write(self.records[0])
+        sink.materialize(json_path)
+        sink.close()
+        self.assertEqual(list(PolicyMerger._iter_input(json_path)), [self.records[0]])
+
+        # A later non-streaming run leaves the stream stale
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump([self.records[1]], f)
+        stat = os.stat(stream_path)
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(list(PolicyMerger._iter_input(json_path)), [self.records[1]])
+
+    def test_scraper_streams_results(self):
+        """Test that a streaming scraper writes results to the sink instead of memory"""
+        scraper = BaseScraper(ScraperConfig(RESULT_STREAM_PATH=self.path, RESULT_STREAM_BATCH_SIZE=1))
+        scraper.add_result("https://nist.gov/ai", "NIST AI Resource Center", "https://nist.gov")
+        scraper.add_result("https://nist.gov/ai", "NIST AI Resource Center", "https://nist.gov")
+        self.assertEqual(scraper.results, [])
+        self.assertEqual([r['url'] for r in iter_jsonl(self.path)], ["https://nist.gov/ai"])
+        self.assertEqual(len(list(scraper.iter_results())), 1)
+        json_path = os.path.join(self.tmpdir.name, 'out.json')
+        scraper.save_results(json_path)
+        with open(json_path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)[0]['title'], "NIST AI Resource Center")
+        scraper.result_sink.close()
+
+    def test_streaming_merge(self):
+        """Test that the streaming merger dedups and sorts by timestamp"""
+        sink = JSONLResultSink(os.path.join(self.tmpdir.name, 'ai_policy_updates.jsonl'))
+        for record in reversed(self.records + [self.records[0]]):
+            sink.write(record)
+        sink.close()
+        with open(os.path.join(self.tmpdir.name, 'congress_bills.json'), 'w') as f:
+            json.dump([{"url": "https://congress.gov/bill1", "title": "AI Bill", "timestamp": "2024-03-21T10:00:00"}], f)
+        output = os.path.join(self.tmpdir.name, 'merged.json')
+        PolicyMerger()._create_merged_file_streaming(self.tmpdir.name, output, keep_existing=False)
+        with open(output, encoding='utf-8') as f:
+            merged = json.load(f)
+        self.assertEqual([m['title'] for m in merged], ["AI Bill", "NIST AI — Überblick", "AI Act"])
+        self.assertFalse(os.path.exists(output + '.staging.jsonl'))
+
+    def test_failed_merge_keeps_previous_file(self):
+        """Test that a merge failing mid-write leaves the previous merged file intact"""
+        output = os.path.join(self.tmpdir.name, 'merged.json')
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(self.records, f)
+
+        def read_one_then_fail(path, offsets):
+            yield next(read_jsonl_at(path, offsets))
+            raise OSError("disk full")
+
+        with patch('policy_scraper.merge_policy_updates.read_jsonl_at', side_effect=read_one_then_fail):
+            PolicyMerger().create_merged_file(output, keep_existing=True, stream=True)
+        with patch('policy_scraper.merge_policy_updates.json.dump', side_effect=OSError("disk full")):
+            PolicyMerger().create_merged_file(output, keep_existing=True)
+        with open(output, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), self.records)
+        self.assertEqual(os.listdir(self.tmpdir.name), ['merged.json'])
+
+if __name__ == '__main__':
+    unittest.main()
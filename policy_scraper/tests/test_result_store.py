@@ -0,0 +1,108 @@
+"""
+Tests for the concurrent result store
+"""
+import unittest
+from unittest.mock import patch
+import concurrent.futures
+from policy_scraper.utils.result_store import ResultStore
+from policy_scraper.scrapers.base import BaseScraper
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.store = ResultStore(num_stripes=4)
+
+    def test_claim_is_check_and_insert(self):
+        """Test that a URL or hash can only be claimed once"""
+        self.assertTrue(self.store.claim("https://nist.gov/a", "hash-a"))
+        self.assertFalse(self.store.claim("https://nist.gov/a", "hash-b"))
+        self.assertFalse(self.store.claim("https://nist.gov/b", "hash-a"))
+        self.assertIn("https://nist.gov/a", self.store.urls)
+        self.assertNotIn("https://nist.gov/b", self.store.urls)
+        self.assertEqual(len(self.store.hashes), 1)
+
+    def test_striped_set_behaves_like_a_set(self):
+        """Test set operations on the striped set"""
+        urls = self.store.urls
+        for i in range(20):
+            urls.add(f"https://example.gov/{i}")
+        urls.discard("https://example.gov/0")
+        self.assertEqual(len(urls), 19)
+        self.assertEqual(set(urls), {f"https://example.gov/{i}" for i in range(1, 20)})
+        self.assertTrue(urls.add_if_absent("https://example.gov/0"))
+        self.assertFalse(urls.add_if_absent("https://example.gov/0"))
+
+    def test_subscribers_see_new_keys(self):
+        """Test that a subscriber gets existing keys and each key added afterwards once"""
+        self.store.urls.add("https://nist.gov/a")
+        seen = []
+        self.store.urls.subscribe(seen.append)
+        self.store.urls.add("https://nist.gov/a")
+        self.store.urls.add_if_absent("https://nist.gov/b")
+        self.store.claim("https://nist.gov/c", "hash-c")
+        self.store.claim("https://nist.gov/c", "hash-d")
+        self.assertEqual(seen, ["https://nist.gov/a", "https://nist.gov/b", "https://nist.gov/c"])
+
+    def test_concurrent_claims_have_one_winner(self):
+        """Test that racing claims for the same key succeed exactly once"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            outcomes = list(executor.map(
+                lambda i: self.store.claim("https://nist.gov/race", f"hash-{i}"), range(200)
+            ))
+        self.assertEqual(outcomes.count(True), 1)
+
+class TestConcurrentAddResult(unittest.TestCase):
+    def test_no_duplicates_under_concurrency(self):
+        """Test that concurrent add_result calls never store duplicates"""
+        scraper = BaseScraper()
+        items = [(f"https://example.gov/policy/{i % 25}", f"Policy document number {i % 25:03d} on topic {(i % 25) * 37}")
+                 for i in range(500)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda item: scraper.add_result(item[0], item[1], "https://example.gov"), items))
+        urls = [r['normalized_url'] for r in scraper.results]
+        self.assertEqual(len(urls), len(set(urls)))
+        self.assertLessEqual(len(urls), 25)
+
+    def test_similar_titles_rejected_under_concurrency(self):
+        """Test that near-duplicate titles racing each other are still caught"""
+        scraper = BaseScraper()
+        items = [(f"https://example.gov/policy/{i}", f"National AI policy framework revision {i % 4}") for i in range(64)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda item: scraper.add_result(item[0], item[1], "https://example.gov"), items))
+        self.assertEqual(len(scraper.results), 1)
+
+    def test_title_comparison_outside_results_lock(self):
+        """Test that full title comparisons do not hold the global results lock"""
+        scraper = BaseScraper()
+        scraper.add_result("https://nist.gov/ai", "NIST AI risk management framework", "https://nist.gov")
+        held = []
+        original = scraper._title_index.has_similar
+
+        def has_similar(title, since=0):
+            if since == 0:
+                held.append(scraper._results_lock._is_owned())
+            return original(title, since)
+
+        with patch.object(scraper._title_index, 'has_similar', side_effect=has_similar):
+            scraper.add_result("https://europa.eu/ai-act", "EU Artificial Intelligence Act", "https://europa.eu")
+        self.assertEqual(held, [False])
+        self.assertEqual(len(scraper.results), 2)
+
+    def test_rejected_result_leaves_url_unclaimed(self):
+        """Test that a result rejected as a near-duplicate does not mark its URL visited"""
+        scraper = BaseScraper()
+        racing = []
+
+        def is_duplicate(url, title):
+            # Another worker accepts a similar title while this one runs its unlocked checks
+            if not racing:
+                racing.append(url)
+                scraper.add_result("https://nist.gov/ai", "NIST AI risk management framework", "https://nist.gov")
+            return False
+
+        with patch.object(scraper, 'is_duplicate', side_effect=is_duplicate):
+            scraper.add_result("https://nist.gov/ai-copy", "NIST AI risk management framework.", "https://nist.gov")
+        self.assertEqual([r['url'] for r in scraper.results], ["https://nist.gov/ai"])
+        self.assertNotIn(scraper.url_processor.normalize_url("https://nist.gov/ai-copy"), scraper.visited_urls)
+
+if __name__ == '__main__':
+    unittest.main()
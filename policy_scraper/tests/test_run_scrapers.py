@@ -42,6 +42,62 @@ class TestRunScrapers(unittest.TestCase):
         # Verify Policy Merger was called correctly
         mock_merger_instance.create_merged_file.assert_called_once()
 
+    @patch('policy_scraper.run_scrapers.AIPolicyScraper')
+    @patch('policy_scraper.run_scrapers.CongressScraper')
+    @patch('policy_scraper.run_scrapers.PolicyMerger')
+    def test_run_scrapers_resume(self, mock_merger, mock_congress, mock_ai):
+        # AI scraper finished before the failure, Congress scraper did not
+        mock_ai_instance = Mock()
+        mock_ai_instance.resume.return_value = True
+        mock_ai_instance.checkpoint.is_complete.return_value = True
+        mock_ai.return_value = mock_ai_instance
+
+        mock_congress_instance = Mock()
+        mock_congress_instance.resume.return_value = True
+        mock_congress_instance.checkpoint.is_complete.return_value = False
+        mock_congress.return_value = mock_congress_instance
+
+        run_scrapers(resume=True)
+
+        # Completed stage is skipped, unfinished one continues, checkpoints are cleared at the end
+        mock_ai_instance.scrape_with_threading.assert_not_called()
+        mock_congress_instance.run.assert_called_once()
+        mock_congress_instance.checkpoint.clear.assert_called_once()
+        mock_merger.return_value.create_merged_file.assert_called_once()
+
+    @patch('policy_scraper.run_scrapers.AIPolicyScraper')
+    @patch('policy_scraper.run_scrapers.CongressScraper')
+    @patch('policy_scraper.run_scrapers.PolicyMerger')
+    def test_run_scrapers_frontier_engine(self, mock_merger, mock_congress, mock_ai):
+        mock_ai_instance = Mock()
+        mock_ai.return_value = mock_ai_instance
+
+        run_scrapers(crawl_engine='frontier')
+
+        mock_ai_instance.scrape_deep.assert_called_once()
+        mock_ai_instance.scrape_with_threading.assert_not_called()
+        mock_ai_instance.save_results.assert_called_once()
+
+    @patch('policy_scraper.run_scrapers.AIPolicyScraper')
+    @patch('policy_scraper.run_scrapers.CongressScraper')
+    @patch('policy_scraper.run_scrapers.PolicyMerger')
+    def test_run_scrapers_time_budget(self, mock_merger, mock_congress, mock_ai):
+        mock_ai_instance = Mock()
+        mock_ai.return_value = mock_ai_instance
+        mock_congress_instance = Mock()
+        mock_congress.return_value = mock_congress_instance
+
+        run_scrapers(time_budget=0)
+
+        # Both scrapers share the run deadline; once it is spent, partial results are
+        # saved and merged, remaining stages are skipped and checkpoints are kept
+        self.assertIs(mock_ai_instance.deadline, mock_congress_instance.deadline)
+        mock_ai_instance.save_results.assert_called_once()
+        mock_ai_instance.checkpoint.mark_complete.assert_not_called()
+        mock_congress_instance.run.assert_not_called()
+        mock_merger.return_value.create_merged_file.assert_called_once()
+        mock_congress_instance.checkpoint.clear.assert_not_called()
+
     @patch('policy_scraper.run_scrapers.AIPolicyScraper')
     def test_run_scrapers_ai_scraper_error(self, mock_ai):
         # Setup mock to raise an exception
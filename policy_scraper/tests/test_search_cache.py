@@ -0,0 +1,128 @@
+"""
+Tests for the search response cache
+"""
+import unittest
+from unittest.mock import patch
+import os
+import tempfile
+import threading
+from policy_scraper.utils.search_cache import SearchCache
+from policy_scraper.utils.rate_limiter import TokenBucket
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+
+RESPONSE = {'items': [{'link': 'https://www.nist.gov/ai', 'title': 'AI Risk Management Framework'}]}
+
+class TestSearchCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'search_cache.sqlite3')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_key_includes_all_parameters(self):
+        """Test that cache keys differ by query, cx, start and num"""
+        keys = {
+            SearchCache.make_key('ai policy', 'cx1'),
+            SearchCache.make_key('ai policy', 'cx2'),
+            SearchCache.make_key('ai policy', 'cx1', start=11),
+            SearchCache.make_key('ai policy', 'cx1', num=5),
+            SearchCache.make_key('ai ethics', 'cx1')
+        }
+        self.assertEqual(len(keys), 5)
+
+    def test_fresh_hit_and_persistence(self):
+        """Test that a fresh response is served from disk without fetching"""
+        key = SearchCache.make_key('ai policy', 'cx')
+        cache = SearchCache(self.path)
+        self.assertEqual(cache.fetch(key, lambda: RESPONSE), RESPONSE)
+        cache.close()
+
+        reopened = SearchCache(self.path)
+        self.assertEqual(reopened.fetch(key, self.fail), RESPONSE)
+        self.assertEqual(reopened.get(key), (RESPONSE, True))
+        reopened.close()
+
+    def test_stale_while_revalidate(self):
+        """Test that a stale response is served at once and refreshed in the background"""
+        key = SearchCache.make_key('ai policy', 'cx')
+        cache = SearchCache(self.path, ttl=0, max_stale=3600)
+        cache.put(key, RESPONSE)
+        release = threading.Event()
+        refreshed = {'items': []}
+
+        def slow_fetch():
+            release.wait(5)
+            return refreshed
+
+        self.assertEqual(cache.fetch(key, slow_fetch), RESPONSE)
+        release.set()
+        cache.wait()
+        self.assertEqual(cache.get(key)[0], refreshed)
+        cache.close()
+
+    def test_stale_without_revalidate_refetches(self):
+        """Test that a stale response is refetched when revalidation is off"""
+        key = SearchCache.make_key('ai policy', 'cx')
+        cache = SearchCache(self.path, ttl=0)
+        cache.put(key, RESPONSE)
+        self.assertEqual(cache.fetch(key, lambda: {'items': []}, stale_while_revalidate=False), {'items': []})
+        cache.close()
+
+    def test_failed_refresh_keeps_stale(self):
+        """Test that a failing background refresh leaves the stale entry"""
+        key = SearchCache.make_key('ai policy', 'cx')
+        cache = SearchCache(self.path, ttl=0)
+        cache.put(key, RESPONSE)
+
+        def failing_fetch():
+            raise RuntimeError("quota exceeded")
+
+        self.assertEqual(cache.fetch(key, failing_fetch), RESPONSE)
+        cache.wait()
+        self.assertEqual(cache.get(key)[0], RESPONSE)
+        cache.close()
+
+    def test_too_stale_is_missing(self):
+        """Test that entries past the stale window are not served"""
+        key = SearchCache.make_key('ai policy', 'cx')
+        cache = SearchCache(self.path, ttl=0, max_stale=0)
+        cache.put(key, RESPONSE)
+        self.assertIsNone(cache.get(key))
+        cache.close()
+
+class TestScraperSearchCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env_patcher = patch.dict(os.environ, {
+            'GOOGLE_API_KEY': 'test_api_key',
+            'GOOGLE_CSE_ID': 'test_search_engine_id'
+        })
+        self.env_patcher.start()
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        self.tmpdir.cleanup()
+
+    @patch('policy_scraper.utils.search_client.CustomSearchClient.search')
+    def test_repeat_discovery_uses_cache(self, mock_search):
+        """Test that a second run's queries are answered from the cache"""
+        execute = mock_search
+        execute.return_value = RESPONSE
+        config = AIScraperConfig(SEARCH_QUERIES=['ai policy', 'ai ethics'],
+                                 SEARCH_CACHE_PATH=os.path.join(self.tmpdir.name, 'search_cache.sqlite3'))
+
+        first = AIPolicyScraper(config=config)
+        first.search_limiter = TokenBucket(rate=100, capacity=2)
+        self.assertEqual(first.discover_urls(), ['https://www.nist.gov/ai'])
+        first.close_search_cache()
+        self.assertEqual(execute.call_count, 2)
+
+        second = AIPolicyScraper(config=config)
+        self.assertEqual(second.discover_urls(), ['https://www.nist.gov/ai'])
+        second.close_search_cache()
+        self.assertEqual(execute.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for the Custom Search REST client, against a local stand-in server
+"""
+import unittest
+from unittest.mock import patch
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+import requests
+from policy_scraper.utils.search_client import CustomSearchClient
+from policy_scraper.utils.rate_limiter import TokenBucket, is_rate_limited, retry_after
+from policy_scraper.utils.http_client import HTTPClient
+from policy_scraper.scrapers.ai_policy import AIPolicyScraper
+from policy_scraper.utils.config import AIScraperConfig
+
+class StandInSearchHandler(BaseHTTPRequestHandler):
+    """Answers Custom Search requests; the query 'throttled' gets a 429"""
+    protocol_version = 'HTTP/1.1'
+    requests_seen = []
+
+    def do_GET(self):
+        params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        self.requests_seen.append(params)
+        if params.get('q') == 'throttled':
+            status, headers = 429, {'Retry-After': '7'}
+            body = {'error': {'code': 429, 'message': 'Quota exceeded'}}
+        else:
+            status, headers = 200, {}
+            body = {'items': [{'link': f"https://www.nist.gov/{params['q'].replace(' ', '-')}",
+                               'title': params['q']}]}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+class TestCustomSearchClient(unittest.TestCase):
+    def setUp(self):
+        StandInSearchHandler.requests_seen = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInSearchHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.endpoint = f"http://127.0.0.1:{self.server.server_address[1]}/customsearch/v1"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_search_parameters(self):
+        """Test that the REST parameters are sent and the JSON is decoded"""
+        client = CustomSearchClient('key123', HTTPClient(), endpoint=self.endpoint)
+        result = client.search(q='ai policy', cx='cx1', num=10, start=11)
+        self.assertEqual(result['items'][0]['link'], 'https://www.nist.gov/ai-policy')
+        self.assertEqual(StandInSearchHandler.requests_seen,
+                         [{'key': 'key123', 'q': 'ai policy', 'cx': 'cx1', 'num': '10', 'start': '11'}])
+
+    def test_rate_limit_error(self):
+        """Test that a 429 raises an error the rate limiter recognises"""
+        client = CustomSearchClient('key123', endpoint=self.endpoint)
+        with self.assertRaises(requests.HTTPError) as context:
+            client.search(q='throttled', cx='cx1')
+        self.assertIn('Quota exceeded', str(context.exception))
+        self.assertTrue(is_rate_limited(context.exception))
+        self.assertEqual(retry_after(context.exception), 7.0)
+
+    def test_scraper_discovers_from_endpoint(self):
+        """Test that the scraper searches the configured endpoint over its pooled client"""
+        with patch.dict(os.environ, {'GOOGLE_API_KEY': 'key123', 'GOOGLE_CSE_ID': 'cx1'}):
+            scraper = AIPolicyScraper(config=AIScraperConfig(
+                SEARCH_API_ENDPOINT=self.endpoint, SEARCH_QUERIES=['ai policy', 'ai ethics']
+            ))
+        scraper.search_limiter = TokenBucket(rate=100, capacity=2)
+        self.assertEqual(sorted(scraper.discover_urls()),
+                         ['https://www.nist.gov/ai-ethics', 'https://www.nist.gov/ai-policy'])
+        self.assertEqual(scraper.http.stats()['hosts']['127.0.0.1']['requests'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Tests for the URL processor
+"""
+import unittest
+from unittest.mock import Mock
+import os
+import tempfile
+import threading
+import time
+from policy_scraper.processors.url_processor import URLProcessor, URLCheck
+from policy_scraper.processors.domain_matcher import TrustedDomainMatcher, get_matcher
+from policy_scraper.utils.validation_cache import ValidationCache
+from policy_scraper.utils.config import AIScraperConfig
+from policy_scraper.utils.config import ScraperConfig
+from policy_scraper.scrapers.base import BaseScraper
+
+class FakeSession:
+    """Session stand-in that records how many requests run at once per host"""
+    def __init__(self, status_codes):
+        self.status_codes = status_codes
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self.calls = []
+
+    def head(self, url, headers=None, timeout=None):
+        host = url.split('/')[2]
+        with self.lock:
+            self.calls.append(url)
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.max_in_flight[host] = max(self.max_in_flight.get(host, 0), self.in_flight[host])
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight[host] -= 1
+        if isinstance(self.status_codes.get(url), Exception):
+            raise self.status_codes[url]
+        return Mock(status_code=self.status_codes.get(url, 200), headers={'Content-Type': 'text/html'})
+
+    def get(self, url, headers=None, timeout=None):
+        # No robots.txt on the fake hosts
+        return Mock(status_code=404, text='')
+
+class TestBatchValidation(unittest.TestCase):
+    def test_validate_urls(self):
+        """Test that batch validation returns a verdict per URL"""
+        session = FakeSession({
+            "https://nist.gov/missing": 404,
+            "https://nist.gov/error": ConnectionError("reset")
+        })
+        urls = ["https://nist.gov/ok", "https://nist.gov/missing", "https://nist.gov/error",
+                "not a url", "https://nist.gov/visited", "https://nist.gov/ok"]
+        results = URLProcessor.validate_urls(urls, {}, {"https://nist.gov/visited"}, session=session)
+        self.assertEqual(results, {
+            "https://nist.gov/ok": True,
+            "https://nist.gov/missing": False,
+            "https://nist.gov/error": False,
+            "not a url": False,
+            "https://nist.gov/visited": False
+        })
+        self.assertEqual(sorted(session.calls),
+                         ["https://nist.gov/error", "https://nist.gov/missing", "https://nist.gov/ok"])
+
+    def test_per_host_limit(self):
+        """Test that concurrency to a single host is capped"""
+        session = FakeSession({})
+        urls = [f"https://nist.gov/{i}" for i in range(20)] + [f"https://europa.eu/{i}" for i in range(20)]
+        results = URLProcessor.validate_urls(urls, {}, set(), session=session, max_workers=16, per_host_limit=3)
+        self.assertTrue(all(results.values()))
+        self.assertLessEqual(session.max_in_flight["nist.gov"], 3)
+        self.assertLessEqual(session.max_in_flight["europa.eu"], 3)
+
+    def test_scraper_validations_share_one_pool(self):
+        """Test that concurrent validate_urls calls together use at most VALIDATION_WORKERS threads"""
+        scraper = BaseScraper(ScraperConfig(VALIDATION_WORKERS=4, MAX_CONNECTIONS_PER_HOST=16))
+        scraper.http.session = FakeSession({})
+        threads = set()
+        head = scraper.http.session.head
+
+        def recording_head(url, headers=None, timeout=None):
+            threads.add(threading.current_thread().name)
+            return head(url, headers, timeout)
+
+        scraper.http.session.head = recording_head
+        batches = [[f"https://site{b}.gov/{i}" for i in range(10)] for b in range(8)]
+        workers = [threading.Thread(target=scraper.validate_urls, args=(batch,)) for batch in batches]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        scraper.close_validation_pool()
+        self.assertEqual(len(scraper.http.session.calls), 80)
+        self.assertLessEqual(len(threads), 4)
+
+class TestTrustedDomainMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = TrustedDomainMatcher({'whitehouse.gov', 'gov', 'edu', 'oecd', 'un'})
+
+    def test_dotted_entries_match_host_and_subdomains(self):
+        """Test suffix matching of full domain entries"""
+        matcher = TrustedDomainMatcher({'whitehouse.gov', 'leg.colorado.gov'})
+        self.assertTrue(matcher.is_trusted("https://whitehouse.gov/briefing"))
+        self.assertTrue(matcher.is_trusted("https://www.WhiteHouse.gov:443/briefing"))
+        self.assertTrue(matcher.is_trusted("https://leg.colorado.gov/bills"))
+        self.assertFalse(matcher.is_trusted("https://colorado.gov"))
+        self.assertFalse(matcher.is_trusted("https://notwhitehouse.gov.example.com"))
+
+    def test_bare_entries_match_whole_labels(self):
+        """Test that bare entries no longer match arbitrary substrings"""
+        self.assertTrue(self.matcher.is_trusted("https://www.nist.gov/ai"))
+        self.assertTrue(self.matcher.is_trusted("https://www.service.gov.uk/guidance"))
+        self.assertTrue(self.matcher.is_trusted("https://web.mit.edu"))
+        self.assertTrue(self.matcher.is_trusted("https://www.oecd.org/ai"))
+        self.assertTrue(self.matcher.is_trusted("https://www.un.org/ai"))
+        self.assertFalse(self.matcher.is_trusted("https://governance-news.com"))
+        self.assertFalse(self.matcher.is_trusted("https://www.unicorn.io"))
+        self.assertFalse(self.matcher.is_trusted("https://education.example.com"))
+        self.assertFalse(self.matcher.is_trusted("not a url"))
+
+    def test_bulk_matching(self):
+        """Test scoring a list of links in one call"""
+        urls = ["https://www.nist.gov/a", "https://example.com/b", "https://www.nist.gov/a"]
+        self.assertEqual(self.matcher.match_urls(urls),
+                         {"https://www.nist.gov/a": True, "https://example.com/b": False})
+        self.assertEqual(self.matcher.filter_trusted(urls), ["https://www.nist.gov/a", "https://www.nist.gov/a"])
+
+    def test_default_config_compiles_once(self):
+        """Test that the configured domain list is compiled once and reused"""
+        domains = AIScraperConfig().TRUSTED_DOMAINS
+        self.assertIs(get_matcher(domains), get_matcher(set(domains)))
+        self.assertTrue(URLProcessor.is_trusted_domain("https://pdpc.gov.sg/ai", domains))
+        self.assertEqual(URLProcessor.match_trusted_domains(["https://stanford.edu", "https://example.com"], domains),
+                         {"https://stanford.edu": True, "https://example.com": False})
+
+class TestValidationCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'validation_cache.json')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_ttl_expiry(self):
+        """Test that entries older than the TTL are treated as missing"""
+        cache = ValidationCache(ttl=60)
+        cache.put("https://nist.gov/a", URLCheck(200, checked_at=time.time() - 120))
+        cache.put("https://nist.gov/b", URLCheck(404))
+        self.assertIsNone(cache.get("https://nist.gov/a"))
+        self.assertFalse(cache.get("https://nist.gov/b").is_valid)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = ValidationCache(max_entries=2)
+        cache.put("https://nist.gov/a", URLCheck(200))
+        cache.put("https://nist.gov/b", URLCheck(200))
+        cache.get("https://nist.gov/a")
+        cache.put("https://nist.gov/c", URLCheck(200))
+        self.assertIsNotNone(cache.get("https://nist.gov/a"))
+        self.assertIsNone(cache.get("https://nist.gov/b"))
+        self.assertEqual(len(cache), 2)
+
+    def test_transient_outcomes_not_cached(self):
+        """Test that throttled and failing checks are retried instead of cached"""
+        cache = ValidationCache(self.path)
+        for status in (429, 500, 503):
+            cache.put(f"https://nist.gov/{status}", URLCheck(status))
+        cache.put("https://nist.gov/gone", URLCheck(410))
+        self.assertIsNone(cache.get("https://nist.gov/429"))
+        self.assertIsNone(cache.get("https://nist.gov/503"))
+        self.assertFalse(cache.get("https://nist.gov/gone").is_valid)
+        cache.save()
+        self.assertEqual(len(ValidationCache(self.path)), 1)
+
+    def test_persistence(self):
+        """Test that saved entries are loaded by a new cache"""
+        cache = ValidationCache(self.path)
+        cache.put("https://nist.gov/a", URLCheck(200, 'text/html', 1024))
+        cache.save()
+        entry = ValidationCache(self.path).get("https://nist.gov/a")
+        self.assertEqual((entry.status_code, entry.content_type, entry.content_length), (200, 'text/html', 1024))
+
+    def test_scraper_uses_cache(self):
+        """Test that repeat validations across runs skip the network"""
+        config = ScraperConfig(VALIDATION_CACHE_PATH=self.path)
+        first = BaseScraper(config)
+        first.http.session = FakeSession({"https://nist.gov/missing": 404})
+        self.assertEqual(first.validate_urls(["https://nist.gov/ok", "https://nist.gov/missing"]),
+                         {"https://nist.gov/ok": True, "https://nist.gov/missing": False})
+        first.save_results(os.path.join(self.tmpdir.name, 'results.json'))
+
+        second = BaseScraper(config)
+        second.http.session = FakeSession({})
+        self.assertTrue(second.validate_url("https://nist.gov/ok/"))
+        self.assertFalse(second.validate_url("https://nist.gov/missing"))
+        self.assertEqual(second.http.session.calls, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Checkpoint module for resuming long scraping runs.
+This module provides a small JSON checkpoint file that scrapers update as they make
+progress (completed search queries, pages already passed through extract_links,
+pagination position). Writes are atomic and rate-limited so that frequent updates
+cost little, and a later run can load the file to continue where a failed run stopped.
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Checkpoint:
+    """Progress state for one scraper, persisted to a JSON file."""
+
+    def __init__(self, path: str, save_interval: float = 30.0):
+        self.path = path
+        self.save_interval = save_interval
+        self.state: Dict[str, Any] = {}
+        self._last_save: Optional[float] = None
+        self._dirty = False
+        self._providers: Dict[str, Callable[[], Any]] = {}
+        self._lock = threading.RLock()
+
+    def load(self) -> bool:
+        """Load state from disk, returning False if there is no usable checkpoint."""
+        with self._lock:
+            if not os.path.exists(self.path):
+                return False
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.state = json.load(f)
+                logger.info(f"Loaded checkpoint from {self.path}")
+                return True
+            except (OSError, json.JSONDecodeError) as e:
+                logger.error(f"Error loading checkpoint {self.path}: {str(e)}")
+                self.state = {}
+                return False
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self.state.get(key, default)
+
+    def set(self, key: str, value: Any):
+        """Update a value; it is written at the next save."""
+        with self._lock:
+            self.state[key] = value
+            self._dirty = True
+
+    def provide(self, key: str, provider: Callable[[], Any]):
+        """Compute a value with provider each time the checkpoint is written.
+
+        For values that change often and are costly to build (result lists, sorted URL
+        sets): callers only mark the checkpoint dirty, and the value is built at save time.
+        """
+        with self._lock:
+            self._providers[key] = provider
+            self._dirty = True
+
+    def touch(self):
+        """Note that provided values changed; they are rebuilt at the next save."""
+        with self._lock:
+            self._dirty = True
+
+    def is_complete(self) -> bool:
+        return bool(self.get('complete', False))
+
+    def mark_complete(self):
+        """Record that the scraper finished, so a resumed run can skip it."""
+        self.set('complete', True)
+        self.save()
+
+    def save(self):
+        """Write state to disk atomically."""
+        with self._lock:
+            for key, provider in self._providers.items():
+                self.state[key] = provider()
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                tmp_path = self.path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.state, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                self._dirty = False
+                self._last_save = time.monotonic()
+            except OSError as e:
+                logger.error(f"Error saving checkpoint {self.path}: {str(e)}")
+
+    def maybe_save(self):
+        """Save if there are unsaved changes and the save interval has elapsed."""
+        with self._lock:
+            due = self._last_save is None or time.monotonic() - self._last_save >= self.save_interval
+            if self._dirty and due:
+                self.save()
+
+    def clear(self):
+        """Discard state and remove the checkpoint file.
+
+        Registered providers are kept, so values such as the results list are still
+        written by the run that starts over.
+        """
+        with self._lock:
+            self.state = {}
+            self._dirty = False
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -5,22 +5,70 @@ base settings, trusted domains, search queries, and API endpoints. It uses datac
 for clean and maintainable configuration management.
 """
 
-from typing import Set, List
+from typing import Set, List, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 
 @dataclass
 class ScraperConfig:
     """Base configuration for all scrapers."""
-    MAX_WORKERS: int = 5
+    MAX_WORKERS: int = 5  # Pages fetched at once by the threaded and frontier crawls
     REQUEST_TIMEOUT: int = 10
-    SEARCH_DELAY: int = 2
+    TIME_BUDGET: Optional[float] = None  # Seconds the scraper may run before it stops and flushes partial results; None for no limit
+    HTML_PARSER: str = 'stream'  # Link/text extraction backend: 'stream', 'regex', 'strainer', 'lxml' or 'bs4'
+    MAX_PAGE_BYTES: int = 5 * 1024 * 1024  # HTML bodies larger than this are abandoned unread
+    MAX_DOCUMENT_BYTES: int = 25 * 1024 * 1024  # Cap on PDF/DOC/DOCX bodies downloaded for text extraction
+    DOCUMENT_WORKERS: int = 2  # Worker processes extracting PDF/DOCX text
+    DOCUMENT_TIMEOUT: float = 30.0  # Seconds allowed to extract one document
+    DOCUMENT_MAX_PAGES: int = 50  # Pages of each document whose text is extracted
+    DOCUMENT_CACHE_PATH: Optional[str] = None  # SQLite file of extracted text by content hash; relative paths go under output/
+    CONTENT_STORE_PATH: Optional[str] = None  # Directory keeping raw fetched bodies by content hash; relative paths go under output/
+    CONTENT_STORE_COMPRESSION: str = 'gzip'  # 'gzip' or 'zstd' (needs the zstandard package)
+    SEARCH_RATE: float = 1.0  # Sustained search API queries per second, shared by all scrapers
+    SEARCH_BURST: int = 8  # Search queries allowed back to back before the rate applies
+    SEARCH_CONCURRENCY: int = 4  # Search queries in flight at once
+    SEARCH_MAX_PAGES: int = 10  # Result pages of 10 fetched per query; a page adding no new URLs ends the query
+    RATE_LIMIT_RETRIES: int = 3  # Retries of a request answered with 429, after slowing down
+    SEARCH_CACHE_PATH: Optional[str] = None  # SQLite file caching search API responses; relative paths go under output/
+    SEARCH_CACHE_TTL: int = 86400  # Seconds a cached search response is fresh
+    SEARCH_CACHE_MAX_STALE: int = 604800  # Seconds past the TTL a response may still be served while it refreshes
+    SEARCH_CACHE_REVALIDATE: bool = True  # Serve stale responses and refresh them in the background
     SIMILARITY_THRESHOLD: float = 0.85
+    DEDUP_SIMILAR_TITLES: bool = True  # Skip results whose title is SIMILARITY_THRESHOLD-similar to an accepted one, on any host
     URL_SIMILARITY_THRESHOLD: float = 0.9
+    TITLE_LSH_BANDS: int = 16  # MinHash bands for the title near-duplicate index
+    TITLE_LSH_ROWS: int = 3  # Rows per band; fewer rows raise recall and candidate count
+    DEDUP_STORE_PATH: Optional[str] = None  # SQLite file for cross-run dedup; relative paths go under output/
+    DEDUP_BATCH_SIZE: int = 100  # Number of new keys buffered before writing to the dedup store
+    RESULT_STORE_STRIPES: int = 16  # Lock stripes for the shared visited-URL and content-hash sets
+    RESULT_STREAM_PATH: Optional[str] = None  # JSONL file to stream accepted results to; relative paths go under output/
+    RESULT_STREAM_BATCH_SIZE: int = 50  # Number of results buffered before appending to the stream
+    CHECKPOINT_PATH: Optional[str] = None  # JSON checkpoint file for resuming runs; relative paths go under output/
+    CHECKPOINT_INTERVAL: float = 30.0  # Minimum seconds between periodic checkpoint writes
+    CRAWL_ENGINE: str = 'threads'  # 'threads' (scrape_with_threading) or 'frontier' (scrape_deep)
+    PARSE_WORKERS: int = 2  # Threads parsing fetched pages for links in the threaded crawl
+    VALIDATE_STAGE_WORKERS: int = 4  # Threaded crawl pipeline workers each validating one page's links; their HEAD requests run on the VALIDATION_WORKERS pool
+    PIPELINE_QUEUE_SIZE: int = 32  # Bound on items waiting between threaded crawl stages; full queues block the stage feeding them
+    CRAWL_MAX_DEPTH: int = 2  # Link hops followed from the search hits by the frontier crawl
+    CRAWL_DOMAIN_BUDGET: int = 25  # Maximum pages fetched from one domain by the frontier crawl
+    CRAWL_MAX_PAGES: Optional[int] = 200  # Maximum pages fetched by the frontier crawl; None for no limit
+    VALIDATION_WORKERS: int = 16  # Threads of the HEAD request pool shared by every link validation, capping requests in flight
+    HTTP_POOL_CONNECTIONS: int = 32  # Per-host connection pools kept alive by the shared HTTP client
+    HTTP_POOL_MAXSIZE: int = 16  # Connections kept per host pool; size against MAX_WORKERS and VALIDATION_WORKERS
+    MAX_CONNECTIONS_PER_HOST: int = 4  # Maximum concurrent requests to a single host
+    HOST_MIN_DELAY: float = 0.0  # Minimum seconds between request starts on one host; robots.txt Crawl-delay can raise it
+    RESPECT_ROBOTS_TXT: bool = True  # Skip URLs disallowed by the host's robots.txt
+    ROBOTS_TXT_TTL: int = 3600  # Seconds a fetched robots.txt is reused
+    PAGE_CACHE_PATH: Optional[str] = None  # SQLite file of page validators and links for conditional GETs; relative paths go under output/
+    VALIDATION_CACHE_PATH: Optional[str] = None  # JSON file persisting URL validations; relative paths go under output/
+    VALIDATION_CACHE_TTL: int = 86400  # Seconds a cached validation stays fresh
+    VALIDATION_CACHE_SIZE: int = 50000  # Maximum cached validations before least recently used are evicted
 
 @dataclass
 class AIScraperConfig(ScraperConfig):
     """Configuration for the AI Policy Scraper."""
+    SEARCH_API_ENDPOINT: str = 'https://www.googleapis.com/customsearch/v1'  # Custom Search JSON API; point at a stand-in server for tests
+    DEDUP_SIMILAR_TITLES: bool = False  # Policy pages are deduplicated by URL, content hash and URL similarity; set True to also drop similar titles
     TRUSTED_DOMAINS: Set[str] = field(default_factory=lambda: {
         'whitehouse.gov', 'europa.eu', 'gov.uk', 'canada.ca', 'congress.gov',
         'fda.gov', 'nist.gov', 'oecd.org', 'un.org', 'weforum.org',
@@ -58,4 +106,8 @@ class CongressScraperConfig(ScraperConfig):
     MAX_RETRIES: int = 5  # Increased max retries
     RETRY_DELAY: int = 10  # Increased base delay for exponential backoff
     RATE_LIMIT_PAUSE: int = 120  # Increased pause time when rate limited (seconds)
-    SEARCH_DELAY: int = 30  # Added delay between search requests 
\ No newline at end of file
+    KEYWORDS: List[str] = field(default_factory=lambda: [
+        "artificial intelligence", "machine learning", "ai governance",
+        "neural network", "automated decision", "foundation model",
+        "deep learning", "facial recognition", "algorithmic accountability"
+    ])  # Matched as whole phrases against bill titles and summaries 
\ No newline at end of file
@@ -0,0 +1,162 @@
+"""
+Content-addressed page store module for the policy scraper system.
+This module keeps the raw bodies of fetched pages and documents so later stages can
+reprocess them (new keywords, a better extractor) from local disk instead of
+crawling again. Each body is stored once under its SHA-256, compressed with gzip (or
+zstd when the zstandard package is installed), in a two-level sharded directory tree;
+an SQLite index maps each normalized URL to the hash of its latest body.
+"""
+
+import gzip
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from policy_scraper.exceptions.scraper_exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+_EXTENSIONS = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+@dataclass
+class StoredPage:
+    """Index entry of a stored body."""
+    url: str
+    digest: str
+    content_type: Optional[str]
+    stored_at: float
+
+
+class ContentStore:
+    """Deduplicated, compressed store of raw page bodies with a URL index."""
+
+    def __init__(self, root: str, compression: str = 'gzip', level: int = 6):
+        if compression not in _EXTENSIONS:
+            raise ConfigurationError(f"Unknown compression '{compression}', expected 'gzip' or 'zstd'")
+        if compression == 'zstd' and not ZSTD_AVAILABLE:
+            logger.warning("zstandard is not installed, storing bodies with gzip")
+            compression = 'gzip'
+        self.root = root
+        self.compression = compression
+        self.level = level
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index on first use."""
+        if self._conn is None:
+            os.makedirs(self.root, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.root, 'index.sqlite3'), check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS pages ('
+                'url TEXT PRIMARY KEY, digest TEXT NOT NULL, content_type TEXT, stored_at REAL NOT NULL'
+                ') WITHOUT ROWID'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest)')
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _blob_path(self, digest: str, compression: Optional[str] = None) -> str:
+        extension = _EXTENSIONS[compression or self.compression]
+        return os.path.join(self.root, 'objects', digest[:2], digest[2:4], digest + extension)
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=self.level).compress(body)
+        # mtime=0 keeps the compressed bytes a function of the body alone
+        return gzip.compress(body, compresslevel=self.level, mtime=0)
+
+    def _write_blob(self, digest: str, body: bytes):
+        """Write a blob unless it is already stored, atomically so readers never see a partial file."""
+        path = self._blob_path(digest)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._compress(body))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def put(self, url: str, body: bytes, content_type: Optional[str] = None) -> str:
+        """Store a body for a normalized URL and return its content hash."""
+        digest = hashlib.sha256(body).hexdigest()
+        self._write_blob(digest, body)
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO pages (url, digest, content_type, stored_at) VALUES (?, ?, ?, ?)',
+                        (url, digest, content_type, time.time())
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Error indexing {url} in content store {self.root}: {str(e)}")
+        return digest
+
+    def has(self, digest: str) -> bool:
+        return any(os.path.exists(self._blob_path(digest, compression)) for compression in _EXTENSIONS)
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """Return the body stored under a content hash, or None."""
+        # Blobs written before a change of compression setting stay readable
+        for compression in (self.compression,) + tuple(c for c in _EXTENSIONS if c != self.compression):
+            path = self._blob_path(digest, compression)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            if compression == 'zstd':
+                if not ZSTD_AVAILABLE:
+                    logger.error(f"Cannot read {path}: zstandard is not installed")
+                    return None
+                return zstandard.ZstdDecompressor().decompress(data)
+            return gzip.decompress(data)
+        return None
+
+    def lookup(self, url: str) -> Optional[StoredPage]:
+        """Return the index entry of a normalized URL, or None."""
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT url, digest, content_type, stored_at FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+        return StoredPage(*row) if row else None
+
+    def get_url(self, url: str) -> Optional[bytes]:
+        """Return the latest body stored for a normalized URL, or None."""
+        entry = self.lookup(url)
+        return self.get(entry.digest) if entry else None
+
+    def pages(self) -> Iterator[StoredPage]:
+        """Iterate over the index entries of every stored URL."""
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT url, digest, content_type, stored_at FROM pages ORDER BY url'
+            ).fetchall()
+        for row in rows:
+            yield StoredPage(*row)
+
+    def close(self):
+        """Close the index."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,100 @@
+"""
+Crawl frontier module for the policy scraper system.
+This module implements CrawlFrontier, a priority queue of pages still to fetch for
+multi-depth crawling. Each page is scored from its keyword relevance, the trust level
+of its domain and its depth, so the most valuable policy pages come out first. URLs
+are deduplicated before they are enqueued, pages deeper than the maximum depth are
+refused, and every domain and the crawl as a whole have a page budget.
+"""
+
+import heapq
+import itertools
+import threading
+import logging
+from collections import Counter
+from typing import Callable, Iterable, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+def score_page(relevance: int, trust: int, depth: int) -> float:
+    """Priority of a page: more keyword matches and a more trusted domain rank higher,
+    and each hop away from the search results divides the score."""
+    return (1 + relevance) * (1 + trust) / (1 + depth)
+
+
+class CrawlFrontier:
+    """Thread-safe priority queue of (url, depth) with dedup, depth limit and page budgets."""
+
+    def __init__(self, max_depth: int = 2, domain_budget: int = 25, max_pages: Optional[int] = None,
+                 normalize: Optional[Callable[[str], str]] = None):
+        self.max_depth = max_depth
+        self.domain_budget = domain_budget
+        self.max_pages = max_pages
+        self.normalize = normalize or (lambda url: url)
+        self._heap = []
+        self._counter = itertools.count()
+        self._seen: Set[str] = set()
+        self._domain_pages: Counter = Counter()
+        self._popped = 0
+        self.max_score = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._heap)
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _budget_left_locked(self, domain: str) -> bool:
+        return self._domain_pages[domain] < self.domain_budget
+
+    def seen(self, url: str) -> bool:
+        with self._lock:
+            return self.normalize(url) in self._seen
+
+    def mark_seen(self, urls: Iterable[str]):
+        """Record URLs that must not be enqueued, such as pages fetched by an earlier run."""
+        with self._lock:
+            self._seen.update(self.normalize(url) for url in urls)
+
+    def push(self, url: str, depth: int, score: float) -> bool:
+        """Enqueue a page unless it was seen, is too deep or its domain's budget is spent."""
+        if depth > self.max_depth:
+            return False
+        key = self.normalize(url)
+        domain = self._domain(url)
+        with self._lock:
+            if key in self._seen or not self._budget_left_locked(domain):
+                return False
+            self._seen.add(key)
+            self.max_score = max(self.max_score, score)
+            heapq.heappush(self._heap, (-score, next(self._counter), url, depth))
+            return True
+
+    def pop(self, min_score: float = 0.0) -> Optional[Tuple[str, int]]:
+        """Return the highest-scoring (url, depth) within budget, or None when exhausted
+        or when no page left scores at least min_score."""
+        with self._lock:
+            while self._heap:
+                if self.max_pages is not None and self._popped >= self.max_pages:
+                    return None
+                if -self._heap[0][0] < min_score:
+                    return None
+                _, _, url, depth = heapq.heappop(self._heap)
+                domain = self._domain(url)
+                # The budget may have been spent since this page was enqueued
+                if not self._budget_left_locked(domain):
+                    continue
+                self._domain_pages[domain] += 1
+                self._popped += 1
+                return url, depth
+            return None
+
+    @property
+    def pages_popped(self) -> int:
+        with self._lock:
+            return self._popped
@@ -0,0 +1,59 @@
+"""
+Run deadline module for the policy scraper system.
+This module provides Deadline, a monotonic-clock time budget for a whole run that
+every stage shares. Stages check it before starting new work, network calls trim
+their timeouts to the time left, and schedulers read the fraction of the budget
+remaining to keep only high-priority work as it runs out. A deadline without a
+budget never expires, so code can use one unconditionally.
+"""
+
+import time
+from typing import Callable, Optional
+from policy_scraper.exceptions.scraper_exceptions import DeadlineExceeded
+
+# Shortest timeout handed to a request while the budget is not yet spent
+MIN_REQUEST_TIMEOUT = 0.5
+
+
+class Deadline:
+    """Time budget measured from creation; budget None means unlimited."""
+
+    def __init__(self, budget: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.budget = budget
+        self._clock = clock
+        self._start = clock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.budget is None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, never negative, or None without a budget."""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - (self._clock() - self._start))
+
+    def fraction_remaining(self) -> float:
+        """Share of the budget left, from 1.0 down to 0.0; always 1.0 without a budget."""
+        if self.budget is None:
+            return 1.0
+        if self.budget <= 0:
+            return 0.0
+        return self.remaining() / self.budget
+
+    def expired(self) -> bool:
+        return self.budget is not None and self.remaining() <= 0
+
+    def check(self, stage: str = ''):
+        """Raise DeadlineExceeded if the budget is spent."""
+        if self.expired():
+            raise DeadlineExceeded(f"Time budget of {self.budget}s exhausted{' during ' + stage if stage else ''}")
+
+    def timeout(self, default: Optional[float]) -> Optional[float]:
+        """Trim a request timeout to the time left, raising DeadlineExceeded if none is."""
+        remaining = self.remaining()
+        if remaining is None:
+            return default
+        self.check()
+        trimmed = max(MIN_REQUEST_TIMEOUT, remaining)
+        return trimmed if default is None else min(default, trimmed)
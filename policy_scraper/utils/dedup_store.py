@@ -0,0 +1,107 @@
+"""
+Persistent deduplication store module for the policy scraper system.
+This module provides an SQLite-backed (WAL mode) store of keys seen in previous runs,
+such as visited URLs, content hashes and processed bill URLs. Scrapers consult it
+before doing any network I/O so that repeat runs skip work already done. New keys
+are buffered in memory and written in batches.
+"""
+
+import os
+import sqlite3
+import threading
+import logging
+from typing import Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Key kinds stored by the scrapers
+KIND_URL = 'url'
+KIND_HASH = 'hash'
+KIND_PROCESSED = 'processed'
+
+
+class DedupStore:
+    """On-disk set of (kind, key) pairs shared across scraper runs."""
+
+    def __init__(self, path: str, batch_size: int = 100):
+        self.path = path
+        self.batch_size = batch_size
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS seen ('
+                'kind TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (kind, key)'
+                ') WITHOUT ROWID'
+            )
+            conn.commit()
+            self._conn = conn
+            logger.debug(f"Opened dedup store at {self.path}")
+        return self._conn
+
+    def contains(self, kind: str, key: str) -> bool:
+        """Check whether a key of the given kind has been recorded."""
+        with self._lock:
+            if (kind, key) in self._pending:
+                return True
+            row = self._connect().execute(
+                'SELECT 1 FROM seen WHERE kind = ? AND key = ?', (kind, key)
+            ).fetchone()
+            return row is not None
+
+    def add(self, kind: str, key: str):
+        """Record a key, writing to disk once a full batch is buffered."""
+        with self._lock:
+            self._pending.add((kind, key))
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def add_many(self, kind: str, keys: Iterable[str]):
+        """Record several keys of the same kind."""
+        for key in keys:
+            self.add(kind, key)
+
+    def keys(self, kind: str) -> List[str]:
+        """Return all recorded keys of the given kind."""
+        with self._lock:
+            stored = [row[0] for row in self._connect().execute(
+                'SELECT key FROM seen WHERE kind = ?', (kind,)
+            )]
+            return stored + [key for k, key in self._pending if k == kind]
+
+    def _flush_locked(self):
+        if not self._pending:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    'INSERT OR IGNORE INTO seen (kind, key) VALUES (?, ?)',
+                    list(self._pending)
+                )
+            logger.debug(f"Flushed {len(self._pending)} keys to dedup store")
+            self._pending.clear()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing dedup store {self.path}: {str(e)}")
+
+    def flush(self):
+        """Write all buffered keys to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush buffered keys and close the database."""
+        with self._lock:
+            self._flush_locked()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
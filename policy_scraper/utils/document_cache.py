@@ -0,0 +1,90 @@
+"""
+Document text cache module for the policy scraper system.
+This module keeps the text extracted from PDF and Word documents, keyed by the
+SHA-256 of the document bytes, in an SQLite table of zlib-compressed text. The same
+document served from several URLs, or fetched again by a later run, is looked up by
+its content instead of being parsed again. Without a path the cache lives in memory
+for the run.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def content_digest(data: bytes) -> str:
+    """Return the cache key of a document's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class DocumentTextCache:
+    """Extracted document text keyed by content hash, on disk or in memory."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._memory: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS texts ('
+                'digest TEXT PRIMARY KEY, text BLOB NOT NULL, extracted_at REAL NOT NULL'
+                ') WITHOUT ROWID'
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, digest: str) -> Optional[str]:
+        """Return the text stored for a content hash, or None."""
+        with self._lock:
+            if self.path is None:
+                return self._memory.get(digest)
+            try:
+                row = self._connect().execute('SELECT text FROM texts WHERE digest = ?', (digest,)).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Error reading document cache {self.path}: {str(e)}")
+                return None
+        if row is None:
+            return None
+        try:
+            return zlib.decompress(row[0]).decode('utf-8')
+        except (zlib.error, UnicodeDecodeError) as e:
+            logger.error(f"Corrupt document cache entry {digest}: {str(e)}")
+            return None
+
+    def put(self, digest: str, text: str):
+        """Store the text extracted from a document."""
+        with self._lock:
+            if self.path is None:
+                self._memory[digest] = text
+                return
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO texts (digest, text, extracted_at) VALUES (?, ?, ?)',
+                        (digest, zlib.compress(text.encode('utf-8')), time.time())
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Error writing document cache {self.path}: {str(e)}")
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
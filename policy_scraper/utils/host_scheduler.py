@@ -0,0 +1,159 @@
+"""
+Host-aware fetch scheduling module for the policy scraper system.
+This module keeps per-host politeness state: a cached robots.txt parser, the host's
+Crawl-delay, a cap on concurrent requests and the earliest time the next request may
+start. Workers wrap each request in HostScheduler.slot(url), and work lists are
+interleaved round-robin by host so that concurrency spreads across sites instead of
+piling onto one.
+"""
+
+import threading
+import time
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+import requests
+from policy_scraper.exceptions.scraper_exceptions import DeadlineExceeded
+from policy_scraper.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+
+def interleave_by_host(urls: Iterable[str]) -> List[str]:
+    """Reorder URLs round-robin across hosts, keeping per-host order."""
+    queues: 'OrderedDict[str, List[str]]' = OrderedDict()
+    for url in urls:
+        queues.setdefault(urlparse(url).netloc.lower(), []).append(url)
+    ordered = []
+    position = 0
+    while queues:
+        for host in list(queues):
+            queue = queues[host]
+            if position < len(queue):
+                ordered.append(queue[position])
+            else:
+                del queues[host]
+        position += 1
+    return ordered
+
+
+class _HostState:
+    def __init__(self, max_concurrency: int):
+        self.lock = threading.Lock()
+        self.robots_lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.next_start = 0.0
+        self.robots: Optional[RobotFileParser] = None
+        self.robots_fetched_at = 0.0
+
+
+class HostScheduler:
+    """Per-host rate limiting with robots.txt and Crawl-delay support."""
+
+    def __init__(self, session=None, headers: Optional[Dict[str, str]] = None, max_concurrency: int = 4,
+                 min_delay: float = 0.0, respect_robots: bool = True,
+                 robots_ttl: float = 3600, timeout: int = 10, deadline: Optional[Deadline] = None):
+        self.session = session or requests
+        self.headers = headers or {}
+        self.user_agent = self.headers.get('User-Agent', '*')
+        self.max_concurrency = max_concurrency
+        self.min_delay = min_delay
+        self.respect_robots = respect_robots
+        self.robots_ttl = robots_ttl
+        self.timeout = timeout
+        # Run deadline; waits for a slot or a host's request spacing never outlast it
+        self.deadline = deadline
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.max_concurrency)
+            return state
+
+    def _robots(self, scheme: str, host: str) -> Optional[RobotFileParser]:
+        """Return the host's robots.txt parser, fetching it once per TTL."""
+        if not self.respect_robots:
+            return None
+        state = self._state(host)
+        with state.robots_lock:
+            if state.robots is not None and time.time() - state.robots_fetched_at < self.robots_ttl:
+                return state.robots
+            parser = RobotFileParser(f"{scheme}://{host}/robots.txt")
+            try:
+                response = self.session.get(parser.url, headers=self.headers, timeout=self.timeout)
+                if response.status_code in (401, 403):
+                    parser.disallow_all = True
+                elif response.status_code >= 400:
+                    parser.allow_all = True
+                else:
+                    parser.parse(response.text.splitlines())
+            except DeadlineExceeded:
+                # Not a verdict on the host, so nothing is cached
+                raise
+            except Exception as e:
+                logger.warning(f"Could not fetch robots.txt for {host}: {str(e)}")
+                parser.allow_all = True
+            state.robots = parser
+            state.robots_fetched_at = time.time()
+            return parser
+
+    def can_fetch(self, url: str) -> bool:
+        """Check robots.txt for whether the URL may be fetched."""
+        parsed = urlparse(url)
+        robots = self._robots(parsed.scheme or 'https', parsed.netloc.lower())
+        return robots is None or robots.can_fetch(self.user_agent, url)
+
+    def delay_for(self, url: str) -> float:
+        """Minimum spacing between request starts for the URL's host."""
+        parsed = urlparse(url)
+        robots = self._robots(parsed.scheme or 'https', parsed.netloc.lower())
+        crawl_delay = robots.crawl_delay(self.user_agent) if robots is not None else None
+        return max(self.min_delay, float(crawl_delay or 0))
+
+    def _remaining(self) -> Optional[float]:
+        return self.deadline.remaining() if self.deadline is not None else None
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's concurrency slots, waiting out its request spacing first.
+
+        Raises DeadlineExceeded instead of waiting past the run deadline.
+        """
+        host = urlparse(url).netloc.lower()
+        delay = self.delay_for(url)
+        state = self._state(host)
+        if not state.slots.acquire(timeout=self._remaining()):
+            raise DeadlineExceeded(f"Time budget exhausted waiting for a request slot on {host}")
+        try:
+            # Reserve a start time under the lock, then sleep without holding it
+            with state.lock:
+                now = time.monotonic()
+                start = max(now, state.next_start)
+                remaining = self._remaining()
+                if remaining is not None and start - now > remaining:
+                    # Leave the reservation to requests that can still use it
+                    raise DeadlineExceeded(f"Request spacing on {host} outlasts the time budget")
+                state.next_start = start + delay
+            if start > now:
+                time.sleep(start - now)
+            yield
+        finally:
+            state.slots.release()
+
+    def stats(self) -> Dict[str, Dict]:
+        """Per-host robots and delay information, for logging."""
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {
+            host: {
+                'robots_cached': state.robots is not None,
+                'crawl_delay': state.robots.crawl_delay(self.user_agent) if state.robots is not None else None
+            }
+            for host, state in hosts.items()
+        }
@@ -0,0 +1,263 @@
+"""
+Shared HTTP client module for the policy scraper system.
+This module provides HTTPClient, a pooled keep-alive session that a scraper owns and
+hands to its processors, so page fetches, link validation and robots.txt lookups
+reuse connections instead of paying DNS, TCP and TLS setup on every request. It
+negotiates compressed responses, applies shared headers and a default timeout, and
+reports per-host pool statistics for sizing the pool against the worker counts.
+Page fetches can be streamed: the Content-Type (sniffed from the first bytes when it
+is missing or generic) and Content-Length are checked before the body is read, and
+non-HTML or oversize bodies are abandoned without being downloaded or decoded.
+"""
+
+import threading
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from policy_scraper.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# urllib3 only decodes brotli when one of these packages is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+KIND_HTML = 'html'
+KIND_DOCUMENT = 'document'
+KIND_OTHER = 'other'
+
+HTML_CONTENT_TYPES = frozenset(['text/html', 'application/xhtml+xml'])
+DOCUMENT_CONTENT_TYPES = {
+    'application/pdf': 'pdf',
+    'application/msword': 'doc',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+}
+# Content-Types that say nothing about the body, so its first bytes are checked instead
+_GENERIC_CONTENT_TYPES = frozenset(['', 'application/octet-stream', 'binary/octet-stream',
+                                    'application/download', 'application/x-download'])
+_MAGIC_NUMBERS = (
+    (b'%PDF-', 'application/pdf'),
+    (b'\xd0\xcf\x11\xe0', 'application/msword'),
+    (b'PK\x03\x04', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'),
+)
+_SNIFF_BYTES = 512
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def sniff_content_type(declared: Optional[str], head: bytes = b'') -> str:
+    """Return the media type of a body from its Content-Type header, or from its first
+    bytes when the header is missing or generic."""
+    content_type = (declared or '').split(';', 1)[0].strip().lower()
+    if content_type not in _GENERIC_CONTENT_TYPES:
+        return content_type
+    for magic, sniffed in _MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return sniffed
+    start = head[:_SNIFF_BYTES].lstrip().lower()
+    if start.startswith((b'<!doctype html', b'<html', b'<head', b'<body', b'<a ', b'<p>', b'<div')):
+        return 'text/html'
+    return content_type or 'application/octet-stream'
+
+
+def content_kind(content_type: str) -> str:
+    """Classify a media type as KIND_HTML, KIND_DOCUMENT or KIND_OTHER."""
+    if content_type in HTML_CONTENT_TYPES:
+        return KIND_HTML
+    if content_type in DOCUMENT_CONTENT_TYPES:
+        return KIND_DOCUMENT
+    return KIND_OTHER
+
+
+@dataclass
+class StreamedResponse:
+    """A streamed response whose body was read only if its type and size were accepted.
+
+    skipped holds the reason the body was abandoned, in which case content is empty.
+    headers, status_code, text and raise_for_status behave as on the wrapped response.
+    """
+    response: requests.Response
+    content_type: str
+    kind: str
+    skipped: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return self.response.url
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @property
+    def headers(self):
+        return self.response.headers
+
+    @property
+    def content(self) -> bytes:
+        return self.response.content
+
+    @property
+    def text(self) -> str:
+        return self.response.text
+
+    def raise_for_status(self):
+        self.response.raise_for_status()
+
+
+class HTTPClient:
+    """Thread-safe pooled HTTP session shared by a scraper and its processors.
+
+    pool_connections is the number of per-host pools kept alive and pool_maxsize the
+    number of connections kept in each host's pool.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, pool_connections: int = 32,
+                 pool_maxsize: int = 16, timeout: int = 10):
+        self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        self.session.headers['Connection'] = 'keep-alive'
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', self._adapter)
+        self.session.mount('https://', self._adapter)
+        self._requests: Counter = Counter()
+        self._errors: Counter = Counter()
+        self._lock = threading.Lock()
+        # Run deadline; request timeouts are trimmed to the time it leaves
+        self.deadline: Optional[Deadline] = None
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        if self.deadline is not None:
+            kwargs['timeout'] = self.deadline.timeout(kwargs['timeout'])
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            self._requests[host] += 1
+        try:
+            return getattr(self.session, method)(url, **kwargs)
+        except Exception:
+            with self._lock:
+                self._errors[host] += 1
+            raise
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request over the shared pool."""
+        return self._send('get', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """Send a HEAD request over the shared pool."""
+        return self._send('head', url, **kwargs)
+
+    def stream_get(self, url: str, max_bytes: int, document_max_bytes: int = 0, **kwargs) -> StreamedResponse:
+        """GET a page, reading its body only if it is HTML or a document within its size cap.
+
+        HTML bodies are read up to max_bytes and document bodies up to document_max_bytes;
+        a cap of 0 leaves that kind unread. The body is abandoned as soon as Content-Length
+        or the bytes received exceed the cap, and other content types are never read.
+        """
+        response = self.get(url, stream=True, **kwargs)
+        try:
+            chunks = response.iter_content(STREAM_CHUNK_SIZE)
+            declared = response.headers.get('Content-Type')
+            head = b''
+            if response.status_code < 300 and sniff_content_type(declared) in _GENERIC_CONTENT_TYPES:
+                head = next(chunks, b'')
+            content_type = sniff_content_type(declared, head)
+            kind = content_kind(content_type)
+            try:
+                length = int(response.headers.get('Content-Length', ''))
+            except ValueError:
+                length = None
+            if response.status_code >= 300:
+                # 304s and error pages carry nothing worth reading; drain small ones so
+                # the connection can be reused
+                if response.status_code == 304 or (length is not None and length <= STREAM_CHUNK_SIZE):
+                    for _ in chunks:
+                        pass
+                return self._abandon(response, content_type, kind, None)
+            limit = {KIND_HTML: max_bytes, KIND_DOCUMENT: document_max_bytes}.get(kind, 0)
+            if limit <= 0:
+                return self._abandon(response, content_type, kind, f"content type {content_type or 'unknown'}")
+            if length is not None and length > limit:
+                return self._abandon(response, content_type, kind, f"Content-Length {length} exceeds {limit} bytes")
+            body = bytearray(head)
+            for chunk in chunks:
+                body += chunk
+                if len(body) > limit:
+                    return self._abandon(response, content_type, kind, f"body exceeds {limit} bytes")
+            response._content = bytes(body)
+            return StreamedResponse(response, content_type, kind)
+        finally:
+            # A fully read body returns the connection to the pool; an abandoned one drops it
+            response.close()
+
+    @staticmethod
+    def _abandon(response: requests.Response, content_type: str, kind: str,
+                 reason: Optional[str]) -> StreamedResponse:
+        response._content = b''
+        if reason:
+            logger.info(f"Skipping body of {response.url}: {reason}")
+        return StreamedResponse(response, content_type, kind, skipped=reason)
+
+    def stats(self) -> Dict:
+        """Request counts and connection pool usage, overall and per host.
+
+        A host whose opened connections exceed pool_maxsize had connections discarded
+        because its pool was full, meaning the pool is undersized for the workers using it.
+        """
+        hosts = {}
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            hosts[key.key_host] = {
+                'requests': pool.num_requests,
+                'connections_opened': pool.num_connections,
+                'idle_connections': pool.pool.qsize() if pool.pool is not None else 0
+            }
+        with self._lock:
+            requests_sent = sum(self._requests.values())
+            errors = sum(self._errors.values())
+        connections = sum(host['connections_opened'] for host in hosts.values())
+        return {
+            'pool_connections': self.pool_connections,
+            'pool_maxsize': self.pool_maxsize,
+            'requests': requests_sent,
+            'errors': errors,
+            'connections_opened': connections,
+            'connection_reuse': 1 - connections / requests_sent if requests_sent else 0.0,
+            'undersized_hosts': sorted(host for host, info in hosts.items()
+                                       if info['connections_opened'] > self.pool_maxsize),
+            'hosts': hosts
+        }
+
+    def log_stats(self):
+        """Log a one-line pool summary, warning if any host's pool was too small."""
+        stats = self.stats()
+        logger.info(
+            f"HTTP pool: {stats['requests']} requests over {stats['connections_opened']} connections "
+            f"({stats['connection_reuse']:.0%} reuse), {stats['errors']} errors"
+        )
+        if stats['undersized_hosts']:
+            logger.warning(
+                f"HTTP pool size {self.pool_maxsize} too small for: {', '.join(stats['undersized_hosts'])}"
+            )
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
@@ -0,0 +1,138 @@
+"""
+Conditional-GET page cache module for the policy scraper system.
+This module keeps, per URL, the validators (ETag, Last-Modified) of the last fetched
+response together with its compressed body and the links extracted from it, in an
+SQLite table. Scrapers send If-None-Match / If-Modified-Since from the cache, and on
+a 304 Not Modified reuse the stored links or body instead of downloading and parsing
+the page again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """Validators, body and extracted links of a previously fetched page."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: Optional[str]
+    links: Optional[List[Tuple[str, str]]]
+    fetched_at: float
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the server answer 304 if the page is unchanged."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """Persistent per-URL cache of response validators, bodies and extracted links."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS pages ('
+                'url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, '
+                'body BLOB, links BLOB, fetched_at REAL NOT NULL'
+                ') WITHOUT ROWID'
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _pack(value) -> Optional[bytes]:
+        if value is None:
+            return None
+        return zlib.compress(json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _unpack(blob: Optional[bytes]):
+        if blob is None:
+            return None
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached entry for a URL, or None."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    'SELECT etag, last_modified, body, links, fetched_at FROM pages WHERE url = ?', (url,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Error reading page cache {self.path}: {str(e)}")
+                return None
+        if row is None:
+            return None
+        try:
+            links = self._unpack(row[3])
+            return CachedPage(
+                etag=row[0],
+                last_modified=row[1],
+                body=self._unpack(row[2]),
+                links=[tuple(link) for link in links] if links is not None else None,
+                fetched_at=row[4]
+            )
+        except (zlib.error, ValueError) as e:
+            logger.error(f"Corrupt page cache entry for {url}: {str(e)}")
+            return None
+
+    def put(self, url: str, response, links: Optional[List[Tuple[str, str]]] = None) -> bool:
+        """Store a 200 response that carries validators, with the links extracted from it.
+
+        Responses without an ETag or Last-Modified cannot be revalidated and are skipped.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+        body = self._pack(response.text)
+        packed_links = self._pack([list(link) for link in links] if links is not None else None)
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    # Keep links already stored for this URL when only the body is being saved
+                    conn.execute(
+                        'INSERT INTO pages (url, etag, last_modified, body, links, fetched_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(url) DO UPDATE SET '
+                        'etag = excluded.etag, last_modified = excluded.last_modified, body = excluded.body, '
+                        'links = CASE WHEN excluded.etag IS pages.etag AND excluded.last_modified IS pages.last_modified '
+                        'THEN COALESCE(excluded.links, pages.links) ELSE excluded.links END, '
+                        'fetched_at = excluded.fetched_at',
+                        (url, etag, last_modified, body, packed_links, time.time())
+                    )
+                return True
+            except sqlite3.Error as e:
+                logger.error(f"Error writing page cache {self.path}: {str(e)}")
+                return False
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
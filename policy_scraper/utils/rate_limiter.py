@@ -0,0 +1,125 @@
+"""
+Rate limiting module for the policy scraper system.
+This module provides a token-bucket rate limiter shared by threads and asyncio tasks.
+Callers reserve a token under a short lock and then wait outside it, so requests run
+concurrently up to the allowed rate and bursts up to the bucket capacity go out
+immediately. On a 429 response the limiter halves its rate and honours Retry-After,
+then recovers gradually as requests succeed. Limiters are registered by key (an API
+name or host) so every scraper talking to the same service shares one bucket.
+"""
+
+import asyncio
+import threading
+import time
+import logging
+from typing import Dict, Optional
+from policy_scraper.exceptions.scraper_exceptions import DeadlineExceeded
+from policy_scraper.utils.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread- and task-safe token bucket with adaptive rate on 429 responses."""
+
+    def __init__(self, rate: float, capacity: int = 1, min_rate: Optional[float] = None):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 16
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        # Refill origin; set in the future while a Retry-After pause is in effect
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill_locked(self, now: float):
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Take tokens, going into debt if needed, and return the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill_locked(now)
+            self._tokens -= tokens
+            return max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+
+    def _reserve_within(self, tokens: int, deadline: Optional[Deadline]) -> float:
+        """Reserve tokens, giving them back and raising DeadlineExceeded if the wait outlasts the deadline."""
+        wait = self.reserve(tokens)
+        remaining = deadline.remaining() if deadline is not None else None
+        if remaining is not None and wait > remaining:
+            with self._lock:
+                self._tokens += tokens
+            raise DeadlineExceeded(f"Rate limit wait of {wait:.3g}s exceeds the {remaining:.3g}s left in the time budget")
+        return wait
+
+    def acquire(self, tokens: int = 1, deadline: Optional[Deadline] = None):
+        """Block the calling thread until the tokens may be used.
+
+        With a deadline, raise DeadlineExceeded at once instead of waiting past it.
+        """
+        wait = self._reserve_within(tokens, deadline)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int = 1, deadline: Optional[Deadline] = None):
+        """Wait without blocking the event loop until the tokens may be used."""
+        wait = self._reserve_within(tokens, deadline)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, retry_after: Optional[float] = None):
+        """React to a rate-limit response: halve the rate and pause for retry_after seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill_locked(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._updated = max(self._updated, now + retry_after)
+            logger.warning(f"Rate limited, slowing to {self.rate:.3g} requests/s"
+                           + (f" after a {retry_after:g}s pause" if retry_after else ""))
+
+    def record_success(self):
+        """Recover the rate additively after a penalty."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, rate: float, capacity: int = 1) -> TokenBucket:
+    """Return the limiter shared by everything calling the given API or host.
+
+    The first caller's settings win; a later caller asking for different ones is
+    warned and gets the existing limiter.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = TokenBucket(rate, capacity)
+        elif (limiter.max_rate, limiter.capacity) != (rate, capacity):
+            logger.warning(f"Rate limiter '{key}' already exists with rate {limiter.max_rate:g}/s and "
+                           f"capacity {limiter.capacity}; ignoring rate {rate:g}/s and capacity {capacity}")
+        return limiter
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Check whether an API or HTTP error is a 429 Too Many Requests."""
+    status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status is not None and int(status) == 429
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the Retry-After header of a rate-limit error, if given as a number."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    try:
+        value = headers.get('retry-after') or headers.get('Retry-After')
+        return float(value) if value is not None else None
+    except (AttributeError, TypeError, ValueError):
+        return None
@@ -0,0 +1,149 @@
+"""
+Streaming result sink module for the policy scraper system.
+This module provides a JSONL sink that appends each accepted result as one record
+while scraping, flushing in batches, so that memory stays flat and a crash keeps
+everything written so far. The pretty-printed JSON array used by the rest of the
+system is materialized from the stream only when requested.
+"""
+
+import json
+import os
+import threading
+import logging
+from contextlib import contextmanager, suppress
+from typing import Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def iter_jsonl(path: str) -> Iterator[Dict]:
+    """Yield records from a JSONL file, skipping a torn trailing line."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed record at {path}:{line_number}")
+
+
+@contextmanager
+def atomic_open(path: str):
+    """Open a temporary file beside path for writing and move it over path once the block
+    completes, so a failed write leaves the previous contents in place."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def write_json_array(records, json_path: str) -> int:
+    """Write records as a JSON array formatted like json.dump(..., indent=2), one at a time.
+
+    json_path is replaced only once every record is written.
+    """
+    count = 0
+    with atomic_open(json_path) as out:
+        for record in records:
+            out.write('[\n' if count == 0 else ',\n')
+            body = json.dumps(record, indent=2, ensure_ascii=False)
+            out.write('\n'.join('  ' + line for line in body.split('\n')))
+            count += 1
+        out.write('\n]' if count else '[]')
+    return count
+
+
+def read_jsonl_at(path: str, offsets: List[int]) -> Iterator[Dict]:
+    """Yield records from a JSONL file at the given byte offsets, in order."""
+    with open(path, 'rb') as f:
+        for offset in offsets:
+            f.seek(offset)
+            yield json.loads(f.readline().decode('utf-8'))
+
+
+class JSONLResultSink:
+    """Append-only JSONL writer with batched flushing."""
+
+    def __init__(self, path: str, batch_size: int = 50, append: bool = False):
+        self.path = path
+        self.batch_size = batch_size
+        self.count = 0
+        self._append = append
+        self._buffer: List[str] = []
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        if self._file is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, 'a' if self._append else 'w', encoding='utf-8')
+            # Later reopenings must not truncate what was already written
+            self._append = True
+        return self._file
+
+    def resume(self):
+        """Append to the existing stream instead of truncating it on the next flush."""
+        with self._lock:
+            self._append = True
+            if os.path.exists(self.path):
+                # Drop a torn trailing line left by a crash mid-write
+                with open(self.path, 'rb+') as f:
+                    data = f.read()
+                    if data and not data.endswith(b'\n'):
+                        f.truncate(data.rfind(b'\n') + 1)
+            self.count = sum(1 for _ in iter_jsonl(self.path))
+
+    def write(self, record: Dict):
+        """Buffer one record, flushing to disk when a batch is full."""
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._buffer.append(line)
+            self.count += 1
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        # Opening truncates a stream left by an earlier run even if this run writes nothing
+        f = self._open()
+        if not self._buffer:
+            return
+        f.write('\n'.join(self._buffer) + '\n')
+        f.flush()
+        self._buffer.clear()
+
+    def flush(self):
+        """Write buffered records to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush buffered records and close the file."""
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        self.flush()
+        return iter_jsonl(self.path)
+
+    def materialize(self, json_path: Optional[str] = None) -> int:
+        """Write the streamed records as a pretty JSON array and return the record count."""
+        self.flush()
+        if json_path is None:
+            json_path = os.path.splitext(self.path)[0] + '.json'
+        count = write_json_array(iter_jsonl(self.path), json_path)
+        # Give the copy the stream's mtime so readers choosing the newer of the two take the stream
+        stat = os.stat(self.path)
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        return count
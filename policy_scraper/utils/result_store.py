@@ -0,0 +1,116 @@
+"""
+Concurrent result store module for the policy scraper system.
+This module provides lock-striped key sets for visited URLs and content hashes so that
+worker threads can check and record keys without contending on a single global lock.
+Keys are hash-partitioned across stripes, and ResultStore.claim performs an atomic
+check-and-insert of a (normalized URL, content hash) pair.
+"""
+
+import threading
+from collections.abc import MutableSet
+from typing import Callable, Iterator, List, Optional, Set
+
+
+class StripedSet(MutableSet):
+    """Set of strings partitioned across independently locked stripes."""
+
+    def __init__(self, locks: List[threading.Lock]):
+        self._locks = locks
+        self._stripes: List[Set[str]] = [set() for _ in locks]
+        self._listeners: List[Callable[[str], None]] = []
+
+    def stripe_of(self, key: str) -> int:
+        return hash(key) % len(self._locks)
+
+    def __contains__(self, key) -> bool:
+        index = self.stripe_of(key)
+        with self._locks[index]:
+            return key in self._stripes[index]
+
+    def __iter__(self) -> Iterator[str]:
+        # Iterate over a snapshot so concurrent inserts cannot break iteration
+        for lock, stripe in zip(self._locks, self._stripes):
+            with lock:
+                snapshot = list(stripe)
+            yield from snapshot
+
+    def __len__(self) -> int:
+        return sum(len(stripe) for stripe in self._stripes)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({set(self)!r})"
+
+    def subscribe(self, listener: Callable[[str], None]):
+        """Call listener with the current keys, then with every key added afterwards."""
+        self._listeners.append(listener)
+        for key in self:
+            listener(key)
+
+    def _notify(self, key: str):
+        # Called outside the stripe lock so listeners can take their own locks
+        for listener in self._listeners:
+            listener(key)
+
+    def add(self, key: str):
+        index = self.stripe_of(key)
+        with self._locks[index]:
+            stripe = self._stripes[index]
+            added = key not in stripe
+            stripe.add(key)
+        if added:
+            self._notify(key)
+
+    def discard(self, key: str):
+        index = self.stripe_of(key)
+        with self._locks[index]:
+            self._stripes[index].discard(key)
+
+    def add_if_absent(self, key: str) -> bool:
+        """Atomically add a key, returning False if it was already present."""
+        index = self.stripe_of(key)
+        with self._locks[index]:
+            stripe = self._stripes[index]
+            if key in stripe:
+                return False
+            stripe.add(key)
+        self._notify(key)
+        return True
+
+
+class ResultStore:
+    """Lock-striped URL and content-hash sets with atomic check-and-insert."""
+
+    def __init__(self, num_stripes: int = 16):
+        self._locks = [threading.Lock() for _ in range(max(1, num_stripes))]
+        self.urls = StripedSet(self._locks)
+        self.hashes = StripedSet(self._locks)
+
+    def claim(self, normalized_url: str, content_hash: Optional[str]) -> bool:
+        """Record a URL and content hash unless either has been seen already.
+
+        Both stripes are locked in index order, so two workers racing on the same
+        URL or the same content cannot both succeed, and lock order prevents deadlock.
+        """
+        url_index = self.urls.stripe_of(normalized_url)
+        indexes = {url_index}
+        if content_hash:
+            hash_index = self.hashes.stripe_of(content_hash)
+            indexes.add(hash_index)
+        locks = [self._locks[i] for i in sorted(indexes)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            if normalized_url in self.urls._stripes[url_index]:
+                return False
+            if content_hash and content_hash in self.hashes._stripes[hash_index]:
+                return False
+            self.urls._stripes[url_index].add(normalized_url)
+            if content_hash:
+                self.hashes._stripes[hash_index].add(content_hash)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        self.urls._notify(normalized_url)
+        if content_hash:
+            self.hashes._notify(content_hash)
+        return True
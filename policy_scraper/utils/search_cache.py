@@ -0,0 +1,160 @@
+"""
+Search response cache module for the policy scraper system.
+This module caches search API responses on disk, keyed by (query, cx, start, num), in
+an SQLite table of zlib-compressed JSON payloads. A response is fresh for the TTL;
+after that it may still be served for up to max_stale seconds while a background
+refresh replaces it (stale-while-revalidate), so a run can start crawling from cached
+hits immediately instead of waiting on the API and spending quota.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SearchCache:
+    """On-disk TTL cache of search API responses with background revalidation."""
+
+    def __init__(self, path: str, ttl: float = 86400, max_stale: float = 604800, revalidate_workers: int = 2):
+        self.path = path
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.revalidate_workers = revalidate_workers
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Dict[str, Future] = {}
+
+    @staticmethod
+    def make_key(query: str, cx: str, start: int = 1, num: int = 10) -> str:
+        return json.dumps([query, cx, start, num], ensure_ascii=False)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, payload BLOB NOT NULL'
+                ') WITHOUT ROWID'
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[Dict, bool]]:
+        """Return (response, is_fresh), or None if missing or too stale to serve."""
+        with self._lock:
+            try:
+                row = self._connect().execute(
+                    'SELECT fetched_at, payload FROM responses WHERE key = ?', (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.error(f"Error reading search cache {self.path}: {str(e)}")
+                return None
+        if row is None:
+            return None
+        age = time.time() - row[0]
+        if age >= self.ttl + self.max_stale:
+            return None
+        try:
+            response = json.loads(zlib.decompress(row[1]).decode('utf-8'))
+        except (zlib.error, ValueError) as e:
+            logger.error(f"Corrupt search cache entry {key}: {str(e)}")
+            return None
+        return response, age < self.ttl
+
+    def put(self, key: str, response: Dict):
+        """Store a response, compressed, stamped with the current time."""
+        payload = zlib.compress(json.dumps(response, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO responses (key, fetched_at, payload) VALUES (?, ?, ?)',
+                        (key, time.time(), payload)
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Error writing search cache {self.path}: {str(e)}")
+
+    def fetch(self, key: str, fetch: Callable[[], Dict], stale_while_revalidate: bool = True) -> Dict:
+        """Return the cached response for key, calling fetch() on a miss.
+
+        A stale hit is returned immediately when stale_while_revalidate is set, with
+        fetch() run in the background to refresh the entry; otherwise it is refetched.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            response, fresh = cached
+            if fresh:
+                return response
+            if stale_while_revalidate:
+                self.revalidate(key, fetch)
+                return response
+        response = fetch()
+        self.put(key, response)
+        return response
+
+    def revalidate(self, key: str, fetch: Callable[[], Dict]) -> Future:
+        """Refresh an entry in the background, at most once at a time per key."""
+        with self._lock:
+            future = self._refreshing.get(key)
+            if future is not None:
+                return future
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.revalidate_workers,
+                                                    thread_name_prefix='search-revalidate')
+            future = self._executor.submit(self._refresh, key, fetch)
+            self._refreshing[key] = future
+            return future
+
+    def _refresh(self, key: str, fetch: Callable[[], Dict]):
+        try:
+            self.put(key, fetch())
+        except Exception as e:
+            # The stale entry stays in place and is retried on the next lookup
+            logger.warning(f"Background refresh of search cache entry {key} failed: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+
+    def wait(self):
+        """Wait for background refreshes to finish."""
+        with self._lock:
+            pending = list(self._refreshing.values())
+        for future in pending:
+            future.result()
+
+    def prune(self):
+        """Delete entries too old to be served even as stale."""
+        cutoff = time.time() - self.ttl - self.max_stale
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    conn.execute('DELETE FROM responses WHERE fetched_at < ?', (cutoff,))
+            except sqlite3.Error as e:
+                logger.error(f"Error pruning search cache {self.path}: {str(e)}")
+
+    def close(self):
+        """Finish background refreshes, prune expired entries and close the database."""
+        self.wait()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.prune()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,44 @@
+"""
+Custom Search client module for the policy scraper system.
+This module provides a thin client for the Google Custom Search JSON API that calls
+the REST endpoint directly through the scraper's shared pooled HTTP client, instead
+of building the googleapiclient discovery service. The endpoint is configurable so a
+local stand-in server can answer searches in tests and benchmarks.
+"""
+
+import logging
+from typing import Dict, Optional
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT = 'https://www.googleapis.com/customsearch/v1'
+
+
+class CustomSearchClient:
+    """Minimal Custom Search JSON API client."""
+
+    def __init__(self, api_key: str, http=None, endpoint: str = DEFAULT_ENDPOINT, timeout: int = 10):
+        self.api_key = api_key
+        self.http = http or requests
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def search(self, q: str, cx: str, num: int = 10, start: Optional[int] = None) -> Dict:
+        """Run one search and return the decoded JSON response.
+
+        Error responses raise requests.HTTPError carrying the response, so callers
+        can recognise 429s and read Retry-After.
+        """
+        params = {'key': self.api_key, 'q': q, 'cx': cx, 'num': num}
+        if start is not None:
+            params['start'] = start
+        response = self.http.get(self.endpoint, params=params, timeout=self.timeout)
+        if response.status_code >= 400:
+            try:
+                message = response.json()['error']['message']
+            except (ValueError, KeyError, TypeError):
+                message = response.reason
+            raise requests.HTTPError(f"{response.status_code} error from search API: {message}",
+                                     response=response)
+        return response.json()
@@ -0,0 +1,106 @@
+"""
+URL validation cache module for the policy scraper system.
+This module caches the outcome of HEAD validation requests (status code, content type,
+content length and check time) keyed by normalized URL. Entries expire after a TTL,
+the cache is bounded by least-recently-used eviction, and it can be persisted to disk
+so that repeat runs answer validations with a lookup instead of a network call.
+"""
+
+import json
+import os
+import threading
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Optional
+from policy_scraper.processors.url_processor import URLCheck
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationCache:
+    """TTL- and size-bounded cache of URL validation outcomes."""
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 86400, max_entries: int = 50000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, URLCheck]' = OrderedDict()
+        self._loaded = path is None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load_locked()
+            return len(self._entries)
+
+    def _load_locked(self):
+        """Read persisted entries on first use."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            now = time.time()
+            for url, entry in stored.items():
+                check = URLCheck(**entry)
+                if check.is_cacheable and now - check.checked_at < self.ttl:
+                    self._entries[url] = check
+            self._evict_locked()
+            logger.info(f"Loaded {len(self._entries)} cached URL validations from {self.path}")
+        except (OSError, ValueError, TypeError) as e:
+            logger.error(f"Error loading validation cache {self.path}: {str(e)}")
+
+    def _evict_locked(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, normalized_url: str) -> Optional[URLCheck]:
+        """Return the cached outcome for a URL, or None if missing or expired."""
+        with self._lock:
+            self._load_locked()
+            check = self._entries.get(normalized_url)
+            if check is None:
+                return None
+            if time.time() - check.checked_at >= self.ttl:
+                del self._entries[normalized_url]
+                return None
+            self._entries.move_to_end(normalized_url)
+            return check
+
+    def put(self, normalized_url: str, check: URLCheck):
+        """Store an outcome, evicting the least recently used entries beyond the size bound.
+
+        Transient outcomes (429, 5xx and other non-definitive errors) are not stored.
+        """
+        if not check.is_cacheable:
+            return
+        with self._lock:
+            self._load_locked()
+            self._entries[normalized_url] = check
+            self._entries.move_to_end(normalized_url)
+            self._evict_locked()
+
+    def save(self):
+        """Write unexpired entries to disk atomically."""
+        if self.path is None:
+            return
+        with self._lock:
+            self._load_locked()
+            now = time.time()
+            data = {
+                url: asdict(check) for url, check in self._entries.items()
+                if now - check.checked_at < self.ttl
+            }
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Error saving validation cache {self.path}: {str(e)}")